@@ -0,0 +1,324 @@
+import "dotenv/config";
+
+import bcrypt from "bcryptjs";
+import { Pool } from "pg";
+import { PrismaPg } from "@prisma/adapter-pg";
+import { PrismaClient } from "../src/generated/prisma/client";
+import { matchTokens } from "../src/lib/matching";
+
+// Synthetic volume for the benchmark suite (tools/bench/run.ts). Never run against production.
+// Needs the demo roles/categories/locations from prisma/seed.ts. Deterministic for a given --seed.
+//
+//   npm run bench:seed                                  # defaults below
+//   npm run bench:seed -- --found=100000 --lost=50000 --claims=20000 --audit=1000000
+//   npm run bench:seed -- --reset                       # delete bench data only
+//
+// Everything it creates belongs to bench-*@foundit.local users, so --reset removes exactly that.
+
+const args = process.argv.slice(2);
+
+function arg(name: string, fallback: number) {
+  const raw = args.find((a) => a.startsWith(`--${name}=`))?.split("=")[1];
+  const env = process.env[`BENCH_${name.toUpperCase().replace(/-/g, "_")}`];
+  const n = Number(raw ?? env);
+  return Number.isFinite(n) && n >= 0 ? Math.floor(n) : fallback;
+}
+
+const reset = args.includes("--reset");
+const USERS = arg("users", 500);
+const FOUND = arg("found", 100_000);
+const LOST = arg("lost", 50_000);
+const CLAIMS = arg("claims", 20_000);
+const AUDIT = arg("audit", 1_000_000);
+const NOTIFICATIONS_PER_USER = arg("notifications", 40);
+const MATCHES_PER_LOST = arg("matches", 10);
+const SEED = arg("seed", 42);
+const CHUNK = 5_000;
+
+const BENCH_EMAIL_PREFIX = "bench-";
+const BENCH_STAFF_EMAIL = "bench-staff@foundit.local";
+
+const pool = new Pool({
+  connectionString: process.env.DATABASE_URL,
+});
+
+const adapter = new PrismaPg(pool);
+
+const prisma = new PrismaClient({ adapter });
+
+// mulberry32: small, fast, reproducible
+function rng(seed: number) {
+  let a = seed >>> 0;
+  return () => {
+    a = (a + 0x6d2b79f5) >>> 0;
+    let t = a;
+    t = Math.imul(t ^ (t >>> 15), t | 1);
+    t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+}
+
+const rand = rng(SEED);
+const pick = <T>(xs: readonly T[]) => xs[Math.floor(rand() * xs.length)];
+const int = (min: number, max: number) => min + Math.floor(rand() * (max - min + 1));
+
+const NOUNS = [
+  "Wallet", "Umbrella", "Earbuds Case", "Student ID", "Calculator", "Water Bottle", "Jacket",
+  "Backpack", "Notebook", "USB Flash Drive", "Phone", "Charger", "Keys", "Eyeglasses", "Watch",
+  "Lanyard", "Hoodie", "Tumbler", "Laptop Sleeve", "Power Bank",
+];
+const COLORS = ["Black", "White", "Blue", "Red", "Gray", "Green", "Pink", "Brown", "Silver", "Navy"];
+const BRANDS = ["", "", "Casio", "Hydro Flask", "Jansport", "Samsung", "Apple", "Xiaomi", "Nike", "Sanrio"];
+const PLACES = ["near the benches", "under a table", "by the entrance", "in a classroom", "beside the stairs", "at the help desk"];
+const FOUND_STATUSES = ["NEWLY_FOUND", "NEWLY_FOUND", "NEWLY_FOUND", "CLAIMED", "RETURNED"];
+const LOST_STATUSES = ["REPORTED_LOST", "REPORTED_LOST", "REPORTED_LOST", "REPORTED_LOST", "CANCELLED"];
+const AUDIT_ACTIONS = [
+  ["FOUND_CREATE", "FoundItem"],
+  ["FOUND_UPDATE", "FoundItem"],
+  ["LOST_CREATE", "LostItem"],
+  ["CLAIM_CREATE", "Claim"],
+  ["CLAIM_APPROVED", "Claim"],
+  ["LOGIN", "User"],
+] as const;
+
+function item() {
+  const name = [pick(COLORS), pick(BRANDS), pick(NOUNS)].filter(Boolean).join(" ");
+  const description = `${name} ${pick(PLACES)}. ${pick(COLORS)} strap, minor scratches. Ref #${int(1000, 99999)}.`;
+  return { name, description };
+}
+
+function daysAgo(maxDays: number) {
+  return new Date(Date.now() - int(0, maxDays) * 86_400_000);
+}
+
+async function inChunks(
+  label: string,
+  total: number,
+  make: (start: number, size: number) => Promise<unknown>,
+  chunk = CHUNK
+) {
+  for (let start = 0; start < total; start += chunk) {
+    const size = Math.min(chunk, total - start);
+    await make(start, size);
+    process.stdout.write(`\r  ${label}: ${start + size}/${total}`);
+  }
+  if (total) process.stdout.write("\n");
+}
+
+async function benchUserIds() {
+  const users = await prisma.user.findMany({
+    where: { email: { startsWith: BENCH_EMAIL_PREFIX } },
+    select: { user_id: true },
+  });
+  return users.map((u) => u.user_id);
+}
+
+async function resetBenchData() {
+  const ids = await benchUserIds();
+  if (!ids.length) return;
+
+  const foundOf = { found_item: { user_id: { in: ids } } };
+  const lostOf = { lost_item: { user_id: { in: ids } } };
+
+  await prisma.match.deleteMany({ where: { OR: [foundOf, lostOf] } });
+  await prisma.claim.deleteMany({ where: { OR: [foundOf, { claimant_id: { in: ids } }] } });
+  await prisma.notification.deleteMany({ where: { user_id: { in: ids } } });
+  await prisma.auditLog.deleteMany({ where: { actor_user_id: { in: ids } } });
+  await prisma.foundItem.deleteMany({ where: { user_id: { in: ids } } });
+  await prisma.lostItem.deleteMany({ where: { user_id: { in: ids } } });
+  await prisma.user.deleteMany({ where: { user_id: { in: ids } } });
+}
+
+async function main() {
+  console.log("Removing previous bench data...");
+  await resetBenchData();
+  if (reset) {
+    console.log("✅ Bench data removed.");
+    return;
+  }
+
+  const userRole = await prisma.role.findFirst({ where: { role_name: "USER" } });
+  const staffRole = await prisma.role.findFirst({ where: { role_name: "STAFF" } });
+  const categories = await prisma.category.findMany({ select: { category_id: true } });
+  const locations = await prisma.location.findMany({ select: { location_id: true } });
+
+  if (!userRole || !staffRole || !categories.length || !locations.length) {
+    throw new Error("Run the main seed first (npx prisma db seed).");
+  }
+
+  const catIds = categories.map((c) => c.category_id);
+  const locIds = locations.map((l) => l.location_id);
+
+  // One hash for every bench account: bcrypt at 12 rounds x hundreds of users would dominate the run
+  const password = await bcrypt.hash("bench123", 12);
+
+  // 1) Users: one staff poster + USERS reporters
+  console.log(
+    `Seeding ${USERS} users, ${FOUND} found, ${LOST} lost, ${CLAIMS} claims, ${AUDIT} audit rows (seed ${SEED})`
+  );
+  await prisma.user.create({
+    data: {
+      role_id: staffRole.role_id,
+      full_name: "Bench Staff",
+      id_number: "BENCH-S-0001",
+      email: BENCH_STAFF_EMAIL,
+      password,
+      department: "Security Office",
+      status: "ACTIVE",
+    },
+  });
+  await prisma.user.createMany({
+    data: Array.from({ length: USERS }, (_, i) => ({
+      role_id: userRole.role_id,
+      full_name: `Bench User ${i + 1}`,
+      id_number: `BENCH-U-${String(i + 1).padStart(6, "0")}`,
+      email: `${BENCH_EMAIL_PREFIX}user-${i + 1}@foundit.local`,
+      password,
+      department: "Engineering",
+      status: "ACTIVE",
+    })),
+  });
+
+  const staff = await prisma.user.findUniqueOrThrow({ where: { email: BENCH_STAFF_EMAIL }, select: { user_id: true } });
+  const userIds = (await benchUserIds()).filter((id) => id !== staff.user_id);
+
+  // 2) Found items (posted by bench staff)
+  await inChunks("found items", FOUND, (_, size) =>
+    prisma.foundItem.createMany({
+      data: Array.from({ length: size }, () => {
+        const { name, description } = item();
+        return {
+          user_id: staff.user_id,
+          category_id: pick(catIds),
+          location_id: pick(locIds),
+          item_name: name,
+          description,
+          date_found: daysAgo(365),
+          storage_location: "Security Office - Bench Shelf",
+          status: pick(FOUND_STATUSES),
+          match_tokens: matchTokens(name, description),
+        };
+      }),
+    })
+  );
+
+  // 3) Lost reports (spread over bench users)
+  await inChunks("lost reports", LOST, (_, size) =>
+    prisma.lostItem.createMany({
+      data: Array.from({ length: size }, () => {
+        const { name, description } = item();
+        return {
+          user_id: pick(userIds),
+          category_id: pick(catIds),
+          location_id: pick(locIds),
+          item_name: name,
+          description,
+          date_lost: daysAgo(365),
+          last_seen_location: pick(PLACES),
+          status: pick(LOST_STATUSES),
+          match_tokens: matchTokens(name, description),
+        };
+      }),
+    })
+  );
+
+  // 4) Stored matches, so /api/matches/suggest reads realistic result sets
+  const foundIds = (
+    await prisma.foundItem.findMany({ where: { user_id: staff.user_id }, select: { found_id: true } })
+  ).map((f) => f.found_id);
+  const lostIds = (
+    await prisma.lostItem.findMany({ where: { user_id: { in: userIds } }, select: { lost_id: true } })
+  ).map((l) => l.lost_id);
+
+  if (foundIds.length && MATCHES_PER_LOST) {
+    const perChunk = Math.max(1, Math.floor(CHUNK / MATCHES_PER_LOST));
+    await inChunks(
+      "lost reports matched",
+      lostIds.length,
+      (start, size) =>
+        prisma.match.createMany({
+          data: lostIds.slice(start, start + size).flatMap((lost_id) =>
+            Array.from({ length: MATCHES_PER_LOST }, () => ({
+              lost_id,
+              found_id: pick(foundIds),
+              match_score: int(20, 95),
+            }))
+          ),
+          skipDuplicates: true,
+        }),
+      perChunk
+    );
+  }
+
+  // 5) Claims: a small pending queue, the rest already reviewed by bench staff
+  if (foundIds.length) {
+    await inChunks("claims", CLAIMS, (_, size) =>
+      prisma.claim.createMany({
+        data: Array.from({ length: size }, () => {
+          const r = rand();
+          const claim_status = r < 0.1 ? "PENDING" : r < 0.7 ? "APPROVED" : "DENIED";
+          const reviewed = claim_status !== "PENDING";
+          return {
+            found_id: pick(foundIds),
+            claimant_id: pick(userIds),
+            proof_description: "Bench claim: describes the item and where it was lost.",
+            claim_status,
+            date_claimed: daysAgo(365),
+            verified_by: reviewed ? staff.user_id : null,
+            reviewed_at: reviewed ? daysAgo(300) : null,
+          };
+        }),
+      })
+    );
+  }
+
+  // 6) Notifications (mostly read, a few unread per user)
+  await inChunks("notifications", userIds.length * NOTIFICATIONS_PER_USER, (start, size) =>
+    prisma.notification.createMany({
+      data: Array.from({ length: size }, (_, i) => ({
+        user_id: userIds[Math.floor((start + i) / NOTIFICATIONS_PER_USER)],
+        type: "MATCH_SUGGESTED",
+        title: "Possible match found",
+        message: `A found item may match your report (${int(40, 95)}% match).`,
+        href: "/lost/mine",
+        is_read: rand() < 0.85,
+        created_at: daysAgo(180),
+      })),
+    })
+  );
+
+  // 7) Audit trail
+  const actors = [staff.user_id, ...userIds];
+  await inChunks("audit rows", AUDIT, (_, size) =>
+    prisma.auditLog.createMany({
+      data: Array.from({ length: size }, () => {
+        const [action, entity_type] = pick(AUDIT_ACTIONS);
+        return {
+          actor_user_id: pick(actors),
+          action,
+          entity_type,
+          entity_id: int(1, Math.max(1, FOUND)),
+          summary: `${action} (bench)`,
+          ip: `10.0.${int(0, 255)}.${int(1, 254)}`,
+          user_agent: "foundit-bench",
+          created_at: daysAgo(365),
+        };
+      }),
+    })
+  );
+
+  // Planner statistics for the freshly loaded tables
+  await prisma.$executeRawUnsafe("ANALYZE");
+
+  console.log("✅ Bench seed complete. Accounts: bench-staff@foundit.local / bench-user-N@foundit.local (bench123)");
+}
+
+main()
+  .catch((e) => {
+    console.error(e);
+    process.exit(1);
+  })
+  .finally(async () => {
+    await prisma.$disconnect();
+    await pool.end();
+  });
@@ -0,0 +1,30 @@
+-- AlterTable
+ALTER TABLE "lost_items" ADD COLUMN "match_tokens" TEXT[] DEFAULT ARRAY[]::TEXT[];
+
+-- AlterTable
+ALTER TABLE "found_items" ADD COLUMN "match_tokens" TEXT[] DEFAULT ARRAY[]::TEXT[];
+
+-- Backfill existing rows (mirrors matchTokens() in src/lib/matching.ts)
+UPDATE "lost_items" SET "match_tokens" = COALESCE((
+    SELECT array_agg(DISTINCT t)
+    FROM regexp_split_to_table(
+        regexp_replace(lower("item_name" || ' ' || "description"), '[^a-z0-9\s]', ' ', 'g'),
+        '\s+'
+    ) AS t
+    WHERE length(t) >= 2
+), ARRAY[]::TEXT[]);
+
+UPDATE "found_items" SET "match_tokens" = COALESCE((
+    SELECT array_agg(DISTINCT t)
+    FROM regexp_split_to_table(
+        regexp_replace(lower("item_name" || ' ' || "description"), '[^a-z0-9\s]', ' ', 'g'),
+        '\s+'
+    ) AS t
+    WHERE length(t) >= 2
+), ARRAY[]::TEXT[]);
+
+-- CreateIndex
+CREATE INDEX "lost_items_match_tokens_idx" ON "lost_items" USING GIN ("match_tokens");
+
+-- CreateIndex
+CREATE INDEX "found_items_match_tokens_idx" ON "found_items" USING GIN ("match_tokens");
@@ -0,0 +1,21 @@
+-- AlterTable
+ALTER TABLE "lost_items" ADD COLUMN "updated_at" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP;
+
+-- AlterTable
+ALTER TABLE "found_items" ADD COLUMN "updated_at" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP;
+
+-- CreateTable
+CREATE TABLE "job_state" (
+    "job_name" VARCHAR(50) NOT NULL,
+    "watermark" TIMESTAMP(3) NOT NULL,
+    "meta" JSONB,
+    "updated_at" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    CONSTRAINT "job_state_pkey" PRIMARY KEY ("job_name")
+);
+
+-- CreateIndex
+CREATE INDEX "lost_items_updated_at_idx" ON "lost_items"("updated_at");
+
+-- CreateIndex
+CREATE INDEX "found_items_updated_at_idx" ON "found_items"("updated_at");
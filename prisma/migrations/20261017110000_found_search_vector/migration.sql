@@ -0,0 +1,28 @@
+-- AlterTable
+ALTER TABLE "found_items" ADD COLUMN "search_vector" tsvector;
+
+-- Keep search_vector in sync with the searchable text ('simple' config: no stemming,
+-- so prefix queries behave like the old substring search)
+CREATE OR REPLACE FUNCTION found_items_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW."search_vector" :=
+        setweight(to_tsvector('simple', coalesce(NEW."item_name", '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(NEW."description", '')), 'B') ||
+        setweight(to_tsvector('simple', coalesce(NEW."storage_location", '')), 'C');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER "found_items_search_vector_trg"
+    BEFORE INSERT OR UPDATE OF "item_name", "description", "storage_location"
+    ON "found_items"
+    FOR EACH ROW EXECUTE FUNCTION found_items_search_vector_update();
+
+-- Backfill existing rows
+UPDATE "found_items" SET "search_vector" =
+    setweight(to_tsvector('simple', coalesce("item_name", '')), 'A') ||
+    setweight(to_tsvector('simple', coalesce("description", '')), 'B') ||
+    setweight(to_tsvector('simple', coalesce("storage_location", '')), 'C');
+
+-- CreateIndex
+CREATE INDEX "found_items_search_vector_idx" ON "found_items" USING GIN ("search_vector");
@@ -0,0 +1,11 @@
+-- DropIndex
+DROP INDEX "audit_logs_created_at_idx";
+
+-- CreateIndex
+CREATE INDEX "audit_logs_created_at_audit_id_idx" ON "audit_logs"("created_at", "audit_id");
+
+-- CreateIndex
+CREATE INDEX "found_items_date_created_found_id_idx" ON "found_items"("date_created", "found_id");
+
+-- CreateIndex
+CREATE INDEX "found_items_date_found_found_id_idx" ON "found_items"("date_found", "found_id");
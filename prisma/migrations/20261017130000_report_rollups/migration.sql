@@ -0,0 +1,113 @@
+-- CreateTable
+CREATE TABLE "report_rollups" (
+    "kind" VARCHAR(10) NOT NULL,
+    "month" DATE NOT NULL,
+    "category_id" INTEGER NOT NULL DEFAULT 0,
+    "location_id" INTEGER NOT NULL DEFAULT 0,
+    "status" VARCHAR(20) NOT NULL,
+    "n" INTEGER NOT NULL DEFAULT 0,
+
+    CONSTRAINT "report_rollups_pkey" PRIMARY KEY ("kind","month","category_id","location_id","status")
+);
+
+-- Add (or remove) one row from a rollup bucket
+CREATE OR REPLACE FUNCTION report_rollup_bump(
+    p_kind TEXT, p_day DATE, p_category INTEGER, p_location INTEGER, p_status TEXT, p_delta INTEGER
+) RETURNS void AS $$
+BEGIN
+    INSERT INTO "report_rollups" ("kind", "month", "category_id", "location_id", "status", "n")
+    VALUES (p_kind, date_trunc('month', p_day::timestamp)::date, p_category, p_location, p_status, p_delta)
+    ON CONFLICT ("kind", "month", "category_id", "location_id", "status")
+    DO UPDATE SET "n" = "report_rollups"."n" + EXCLUDED."n";
+END
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION lost_items_rollup_update() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM report_rollup_bump('LOST', OLD."date_created", OLD."category_id", OLD."location_id", OLD."status", -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM report_rollup_bump('LOST', NEW."date_created", NEW."category_id", NEW."location_id", NEW."status", 1);
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION found_items_rollup_update() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM report_rollup_bump('FOUND', OLD."date_created", OLD."category_id", OLD."location_id", OLD."status", -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM report_rollup_bump('FOUND', NEW."date_created", NEW."category_id", NEW."location_id", NEW."status", 1);
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+-- Claims are only counted by status (category/location stay 0)
+CREATE OR REPLACE FUNCTION claims_rollup_update() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM report_rollup_bump('CLAIM', OLD."date_claimed", 0, 0, OLD."claim_status", -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM report_rollup_bump('CLAIM', NEW."date_claimed", 0, 0, NEW."claim_status", 1);
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER "lost_items_rollup_ins_del_trg"
+    AFTER INSERT OR DELETE ON "lost_items"
+    FOR EACH ROW EXECUTE FUNCTION lost_items_rollup_update();
+
+CREATE TRIGGER "lost_items_rollup_upd_trg"
+    AFTER UPDATE OF "status", "category_id", "location_id", "date_created" ON "lost_items"
+    FOR EACH ROW
+    WHEN (OLD."status" IS DISTINCT FROM NEW."status"
+       OR OLD."category_id" IS DISTINCT FROM NEW."category_id"
+       OR OLD."location_id" IS DISTINCT FROM NEW."location_id"
+       OR OLD."date_created" IS DISTINCT FROM NEW."date_created")
+    EXECUTE FUNCTION lost_items_rollup_update();
+
+CREATE TRIGGER "found_items_rollup_ins_del_trg"
+    AFTER INSERT OR DELETE ON "found_items"
+    FOR EACH ROW EXECUTE FUNCTION found_items_rollup_update();
+
+CREATE TRIGGER "found_items_rollup_upd_trg"
+    AFTER UPDATE OF "status", "category_id", "location_id", "date_created" ON "found_items"
+    FOR EACH ROW
+    WHEN (OLD."status" IS DISTINCT FROM NEW."status"
+       OR OLD."category_id" IS DISTINCT FROM NEW."category_id"
+       OR OLD."location_id" IS DISTINCT FROM NEW."location_id"
+       OR OLD."date_created" IS DISTINCT FROM NEW."date_created")
+    EXECUTE FUNCTION found_items_rollup_update();
+
+CREATE TRIGGER "claims_rollup_ins_del_trg"
+    AFTER INSERT OR DELETE ON "claims"
+    FOR EACH ROW EXECUTE FUNCTION claims_rollup_update();
+
+CREATE TRIGGER "claims_rollup_upd_trg"
+    AFTER UPDATE OF "claim_status", "date_claimed" ON "claims"
+    FOR EACH ROW
+    WHEN (OLD."claim_status" IS DISTINCT FROM NEW."claim_status"
+       OR OLD."date_claimed" IS DISTINCT FROM NEW."date_claimed")
+    EXECUTE FUNCTION claims_rollup_update();
+
+-- Backfill from existing rows
+INSERT INTO "report_rollups" ("kind", "month", "category_id", "location_id", "status", "n")
+SELECT 'LOST', date_trunc('month', "date_created"::timestamp)::date, "category_id", "location_id", "status", count(*)::int
+FROM "lost_items"
+GROUP BY 2, 3, 4, 5;
+
+INSERT INTO "report_rollups" ("kind", "month", "category_id", "location_id", "status", "n")
+SELECT 'FOUND', date_trunc('month', "date_created"::timestamp)::date, "category_id", "location_id", "status", count(*)::int
+FROM "found_items"
+GROUP BY 2, 3, 4, 5;
+
+INSERT INTO "report_rollups" ("kind", "month", "category_id", "location_id", "status", "n")
+SELECT 'CLAIM', date_trunc('month', "date_claimed"::timestamp)::date, 0, 0, "claim_status", count(*)::int
+FROM "claims"
+GROUP BY 2, 5;
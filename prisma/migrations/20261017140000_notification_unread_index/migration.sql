@@ -0,0 +1,32 @@
+-- DropIndex
+DROP INDEX "notifications_user_id_idx";
+
+-- DropIndex
+DROP INDEX "notifications_is_read_idx";
+
+-- CreateIndex
+CREATE INDEX "notifications_user_id_is_read_created_at_idx" ON "notifications"("user_id", "is_read", "created_at");
+
+-- Tell listening app servers whose unread count changed (payload = user_id).
+-- NOTIFY is delivered on commit and identical payloads in one transaction collapse,
+-- so "mark all read" on 500 rows is still one message.
+CREATE OR REPLACE FUNCTION notifications_changed_notify() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        PERFORM pg_notify('notifications_changed', OLD."user_id"::text);
+    ELSE
+        PERFORM pg_notify('notifications_changed', NEW."user_id"::text);
+    END IF;
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER "notifications_changed_ins_del_trg"
+    AFTER INSERT OR DELETE ON "notifications"
+    FOR EACH ROW EXECUTE FUNCTION notifications_changed_notify();
+
+CREATE TRIGGER "notifications_changed_upd_trg"
+    AFTER UPDATE OF "is_read" ON "notifications"
+    FOR EACH ROW
+    WHEN (OLD."is_read" IS DISTINCT FROM NEW."is_read")
+    EXECUTE FUNCTION notifications_changed_notify();
@@ -0,0 +1,24 @@
+-- Indexes for the filter + order combinations the routes actually run
+-- (see tools/plancheck/run.ts, which fails when one of them falls back to a large Seq Scan).
+
+-- CreateIndex: staff found list filtered by status, newest first; status counts (staff dashboard)
+CREATE INDEX "found_items_status_date_created_found_id_idx" ON "found_items"("status", "date_created", "found_id");
+
+-- CreateIndex: staff claim queues (PENDING oldest first, APPROVED/DENIED newest first) and the
+-- pending-claims counts on the staff and admin dashboards
+CREATE INDEX "claims_claim_status_date_claimed_idx" ON "claims"("claim_status", "date_claimed");
+
+-- Partial indexes below are not expressible in schema.prisma (see the notes there).
+-- The predicates are written exactly as the queries write them, so the planner can prove them.
+
+-- Public browse: /api/found/list without a status filter (newest first, keyset on found_id)
+CREATE INDEX "found_items_public_date_created_found_id_idx" ON "found_items"("date_created", "found_id")
+    WHERE "status" NOT IN ('RETURNED', 'CLAIMED');
+
+-- Match candidate loads (src/lib/match-index.ts): status = X AND (tokens && .. OR category OR location).
+-- The category/location arms of the BitmapOr only visit active rows; matched/cancelled reports
+-- pile up over time and used to be fetched and filtered out.
+CREATE INDEX "lost_items_active_category_id_idx" ON "lost_items"("category_id") WHERE "status" = 'REPORTED_LOST';
+CREATE INDEX "lost_items_active_location_id_idx" ON "lost_items"("location_id") WHERE "status" = 'REPORTED_LOST';
+CREATE INDEX "found_items_active_category_id_idx" ON "found_items"("category_id") WHERE "status" = 'NEWLY_FOUND';
+CREATE INDEX "found_items_active_location_id_idx" ON "found_items"("location_id") WHERE "status" = 'NEWLY_FOUND';
@@ -0,0 +1,27 @@
+-- Spread each rollup bucket over 8 rows ("slots"). Every item/claim write bumps its bucket from a
+-- trigger, so concurrent writes to one bucket (e.g. this month's PENDING claims) all queued on the
+-- same row lock. Each transaction now bumps the slot picked by its txid, so concurrent writers
+-- mostly land on different rows. Readers sum "n" across slots (src/lib/reports.ts).
+
+-- AlterTable: existing totals stay in slot 0
+ALTER TABLE "report_rollups" ADD COLUMN "slot" SMALLINT NOT NULL DEFAULT 0;
+ALTER TABLE "report_rollups" DROP CONSTRAINT "report_rollups_pkey";
+ALTER TABLE "report_rollups" ADD CONSTRAINT "report_rollups_pkey"
+    PRIMARY KEY ("kind", "month", "category_id", "location_id", "status", "slot");
+
+-- Every rollup trigger (lost_items/found_items/claims_rollup_update) bumps through this function.
+-- One slot per transaction: a status change's -1 and +1 come from the same txid and its row locks
+-- stay together. A slot's "n" may go negative (the +1 landed in another slot); only sums are meaningful.
+CREATE OR REPLACE FUNCTION report_rollup_bump(
+    p_kind TEXT, p_day DATE, p_category INTEGER, p_location INTEGER, p_status TEXT, p_delta INTEGER
+) RETURNS void AS $$
+BEGIN
+    INSERT INTO "report_rollups" ("kind", "month", "category_id", "location_id", "status", "slot", "n")
+    VALUES (
+        p_kind, date_trunc('month', p_day::timestamp)::date, p_category, p_location, p_status,
+        (txid_current() % 8)::smallint, p_delta
+    )
+    ON CONFLICT ("kind", "month", "category_id", "location_id", "status", "slot")
+    DO UPDATE SET "n" = "report_rollups"."n" + EXCLUDED."n";
+END
+$$ LANGUAGE plpgsql;
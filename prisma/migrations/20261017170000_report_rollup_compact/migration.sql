@@ -0,0 +1,30 @@
+-- Fold each rollup bucket's slot rows back into slot 0 and drop buckets that sum to zero.
+-- report_rollup_bump() spreads a bucket over up to 8 rows, and nothing else ever merges them;
+-- prisma/rematch.ts calls this once per run so the table stays at one row per live bucket.
+-- Safe alongside writers: a bump blocked on a deleted slot row re-inserts it after commit.
+-- Returns how many rows were removed.
+CREATE OR REPLACE FUNCTION report_rollups_compact() RETURNS INTEGER AS $$
+DECLARE
+    before_n INTEGER;
+    after_n INTEGER;
+BEGIN
+    SELECT count(*) INTO before_n FROM "report_rollups";
+
+    WITH "folded" AS (
+        DELETE FROM "report_rollups"
+        WHERE "slot" <> 0
+        RETURNING "kind", "month", "category_id", "location_id", "status", "n"
+    )
+    INSERT INTO "report_rollups" ("kind", "month", "category_id", "location_id", "status", "slot", "n")
+    SELECT "kind", "month", "category_id", "location_id", "status", 0, sum("n")::INTEGER
+    FROM "folded"
+    GROUP BY "kind", "month", "category_id", "location_id", "status"
+    ON CONFLICT ("kind", "month", "category_id", "location_id", "status", "slot")
+    DO UPDATE SET "n" = "report_rollups"."n" + EXCLUDED."n";
+
+    DELETE FROM "report_rollups" WHERE "slot" = 0 AND "n" = 0;
+
+    SELECT count(*) INTO after_n FROM "report_rollups";
+    RETURN before_n - after_n;
+END
+$$ LANGUAGE plpgsql;
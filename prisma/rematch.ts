@@ -0,0 +1,327 @@
+import "dotenv/config";
+
+import { Pool } from "pg";
+import { PrismaPg } from "@prisma/adapter-pg";
+import { Prisma, PrismaClient } from "../src/generated/prisma/client";
+import { buildMatchColumns, scoreIndexed, topMatches, type IndexedMatchInput } from "../src/lib/matching";
+
+// Re-match worker: re-scores lost reports / found items changed since the last run
+// and upserts into `matches`. Same policy as the request path: matches only exist between open
+// reports (REPORTED_LOST) and unclaimed items (NEWLY_FOUND), and a report keeps its top
+// STORE_TOP_K. Pairs that fall under STORE_MIN_SCORE or out of the top list are deleted, as are
+// matches whose report or item has closed. Also compacts report_rollups' slot rows.
+// Meant to run nightly (cron) against the main DB.
+//
+//   npm run rematch                        # incremental, from stored watermark
+//   npm run rematch -- --dry-run           # score + report only, no writes
+//   npm run rematch -- --full              # ignore watermark, re-score everything
+//   npm run rematch -- --batch-size=1000
+
+const JOB_NAME = "rematch";
+
+// Same thresholds as the request-path matching (found/create, lost/create)
+const STORE_MIN_SCORE = 20;
+const STORE_TOP_K = 30;
+const NOTIFY_MIN_SCORE = 40;
+
+// Re-read a little before the watermark so app/DB clock skew can't skip rows.
+// Upserts are idempotent and notifications only fire on a threshold crossing.
+const WATERMARK_OVERLAP_MS = 5 * 60 * 1000;
+
+const args = process.argv.slice(2);
+const dryRun = args.includes("--dry-run");
+const full = args.includes("--full");
+const batchSizeArg = args.find((a) => a.startsWith("--batch-size="));
+const batchSize = Math.max(1, Number(batchSizeArg?.split("=")[1]) || 500);
+
+const pool = new Pool({ connectionString: process.env.DATABASE_URL });
+const adapter = new PrismaPg(pool);
+const prisma = new PrismaClient({ adapter });
+
+type Pair = { lost_id: number; found_id: number; score: number; reasons: string[] };
+
+function pairKey(lostId: number, foundId: number) {
+  return `${lostId}:${foundId}`;
+}
+
+function chunk<T>(arr: T[], size: number) {
+  const out: T[][] = [];
+  for (let i = 0; i < arr.length; i += size) out.push(arr.slice(i, i + size));
+  return out;
+}
+
+async function main() {
+  const t0 = Date.now();
+
+  const [{ now: runStartedAt }] = await prisma.$queryRaw<Array<{ now: Date }>>`SELECT now() AS now`;
+
+  const state = await prisma.jobState.findUnique({ where: { job_name: JOB_NAME } });
+  const since = full || !state ? new Date(0) : new Date(state.watermark.getTime() - WATERMARK_OVERLAP_MS);
+
+  // 1) Load active inventory once (index columns only)
+  const [lostRows, foundRows] = await Promise.all([
+    prisma.lostItem.findMany({
+      where: { status: "REPORTED_LOST" },
+      orderBy: { lost_id: "asc" },
+      select: {
+        lost_id: true,
+        user_id: true,
+        category_id: true,
+        location_id: true,
+        date_lost: true,
+        match_tokens: true,
+        updated_at: true,
+      },
+    }),
+    prisma.foundItem.findMany({
+      where: { status: "NEWLY_FOUND" },
+      orderBy: { found_id: "asc" },
+      select: {
+        found_id: true,
+        category_id: true,
+        location_id: true,
+        date_found: true,
+        match_tokens: true,
+        updated_at: true,
+      },
+    }),
+  ]);
+
+  const lostInput = (l: (typeof lostRows)[number]): IndexedMatchInput => ({
+    tokens: l.match_tokens,
+    category_id: l.category_id,
+    location_id: l.location_id,
+    date: new Date(l.date_lost),
+  });
+  const foundInput = (f: (typeof foundRows)[number]): IndexedMatchInput => ({
+    tokens: f.match_tokens,
+    category_id: f.category_id,
+    location_id: f.location_id,
+    date: new Date(f.date_found),
+  });
+
+  const lostCols = buildMatchColumns(lostRows.map((l) => ({ id: l.lost_id, ...lostInput(l) })));
+  const foundCols = buildMatchColumns(foundRows.map((f) => ({ id: f.found_id, ...foundInput(f) })));
+
+  const changedLost = lostRows.filter((l) => l.updated_at > since);
+  const changedFound = foundRows.filter((f) => f.updated_at > since);
+
+  // 2) Score changed rows against the other side (batch pass per changed row)
+  const pairs = new Map<string, Pair>();
+  const keep = (p: Pair) => {
+    const k = pairKey(p.lost_id, p.found_id);
+    if (!pairs.has(k)) pairs.set(k, p);
+  };
+
+  for (const l of changedLost) {
+    for (const m of topMatches(lostInput(l), "lost", foundCols, { k: STORE_TOP_K, minScore: STORE_MIN_SCORE })) {
+      keep({ lost_id: l.lost_id, found_id: m.id, score: m.score, reasons: m.reasons });
+    }
+  }
+  for (const f of changedFound) {
+    for (const m of topMatches(foundInput(f), "found", lostCols, { k: STORE_TOP_K, minScore: STORE_MIN_SCORE })) {
+      keep({ lost_id: m.id, found_id: f.found_id, score: m.score, reasons: m.reasons });
+    }
+  }
+
+  // Stored pairs that touch a changed row but didn't make its new top list still carry the old
+  // score: re-score them, and delete the ones now under STORE_MIN_SCORE
+  const lostById = new Map(lostRows.map((l) => [l.lost_id, l] as const));
+  const foundById = new Map(foundRows.map((f) => [f.found_id, f] as const));
+  const changedLostIds = changedLost.map((l) => l.lost_id);
+  const changedFoundIds = changedFound.map((f) => f.found_id);
+
+  const existing =
+    changedLostIds.length || changedFoundIds.length
+      ? await prisma.$queryRaw<Array<{ lost_id: number; found_id: number }>>`
+          SELECT lost_id, found_id FROM matches
+          WHERE lost_id = ANY(${changedLostIds}::int[]) OR found_id = ANY(${changedFoundIds}::int[])
+        `
+      : [];
+
+  const belowMin: Array<{ lost_id: number; found_id: number }> = [];
+  for (const e of existing) {
+    if (pairs.has(pairKey(e.lost_id, e.found_id))) continue;
+    const l = lostById.get(e.lost_id);
+    const f = foundById.get(e.found_id);
+    if (!l || !f) continue; // one side closed: removed in step 5
+    const s = scoreIndexed(lostInput(l), foundInput(f));
+    if (s.score >= STORE_MIN_SCORE) keep({ lost_id: l.lost_id, found_id: f.found_id, ...s });
+    else belowMin.push(e);
+  }
+
+  const tScored = Date.now();
+
+  // 3) Upsert in batches; remember which pairs newly crossed the notify threshold
+  const ownerOf = new Map(lostRows.map((l) => [l.lost_id, l.user_id] as const));
+  const crossed: Pair[] = [];
+  let inserted = 0;
+  let updated = 0;
+  let unchanged = 0;
+
+  for (const batch of chunk(Array.from(pairs.values()), batchSize)) {
+    const values = Prisma.join(
+      batch.map((p) => Prisma.sql`(${p.lost_id}::int, ${p.found_id}::int, ${p.score.toFixed(2)}::numeric)`)
+    );
+
+    const prev = await prisma.$queryRaw<Array<{ lost_id: number; found_id: number; match_score: Prisma.Decimal }>>`
+      SELECT m.lost_id, m.found_id, m.match_score
+      FROM matches m
+      JOIN (VALUES ${values}) AS v(lost_id, found_id, score)
+        ON v.lost_id = m.lost_id AND v.found_id = m.found_id
+    `;
+    const prevScore = new Map(prev.map((r) => [pairKey(r.lost_id, r.found_id), Number(r.match_score)] as const));
+
+    for (const p of batch) {
+      const before = prevScore.get(pairKey(p.lost_id, p.found_id));
+      if (before === undefined) inserted++;
+      else if (before !== p.score) updated++;
+      else unchanged++;
+
+      if (p.score >= NOTIFY_MIN_SCORE && (before === undefined || before < NOTIFY_MIN_SCORE)) {
+        crossed.push(p);
+      }
+    }
+
+    if (!dryRun) {
+      await prisma.$executeRaw`
+        INSERT INTO matches (lost_id, found_id, match_score)
+        SELECT v.lost_id, v.found_id, v.score
+        FROM (VALUES ${values}) AS v(lost_id, found_id, score)
+        ON CONFLICT (lost_id, found_id)
+        DO UPDATE SET match_score = EXCLUDED.match_score, date_matched = CURRENT_DATE
+        WHERE matches.match_score IS DISTINCT FROM EXCLUDED.match_score
+      `;
+    }
+  }
+
+  // 4) Delete re-scored pairs under STORE_MIN_SCORE, then trim every touched report back to its
+  //    top STORE_TOP_K unclaimed items (ties by found_id, like topMatches); an upsert alone never
+  //    removes a row
+  for (const batch of chunk(belowMin, batchSize)) {
+    if (dryRun) break;
+    const values = Prisma.join(batch.map((p) => Prisma.sql`(${p.lost_id}::int, ${p.found_id}::int)`));
+    await prisma.$executeRaw`
+      DELETE FROM matches m
+      USING (VALUES ${values}) AS v(lost_id, found_id)
+      WHERE m.lost_id = v.lost_id AND m.found_id = v.found_id
+    `;
+  }
+
+  let trimmed = 0;
+  const touchedLost = [...new Set(Array.from(pairs.values(), (p) => p.lost_id))];
+  for (const ids of chunk(touchedLost, batchSize)) {
+    const overflow = Prisma.sql`
+      SELECT match_id FROM (
+        SELECT m.match_id,
+               row_number() OVER (PARTITION BY m.lost_id ORDER BY m.match_score DESC, m.found_id) AS rn
+        FROM matches m
+        JOIN found_items f ON f.found_id = m.found_id AND f.status = 'NEWLY_FOUND'
+        WHERE m.lost_id = ANY(${ids}::int[])
+      ) ranked
+      WHERE rn > ${STORE_TOP_K}
+    `;
+    if (dryRun) {
+      // Approximate: ranks the stored scores, since the upserts above were skipped
+      const [{ n }] = await prisma.$queryRaw<Array<{ n: number }>>`SELECT count(*)::int AS n FROM (${overflow}) o`;
+      trimmed += n;
+    } else {
+      trimmed += await prisma.$executeRaw`DELETE FROM matches WHERE match_id IN (${overflow})`;
+    }
+  }
+
+  // 5) Drop matches that can no longer lead to a claim: the report was resolved or the item
+  //    claimed/returned. Stale rows would otherwise linger until the pair is re-scored.
+  const [{ stale }] = await prisma.$queryRaw<Array<{ stale: number }>>`
+    SELECT count(*)::int AS stale
+    FROM matches m
+    JOIN lost_items l ON l.lost_id = m.lost_id
+    JOIN found_items f ON f.found_id = m.found_id
+    WHERE l.status <> 'REPORTED_LOST' OR f.status <> 'NEWLY_FOUND'
+  `;
+  if (!dryRun && stale) {
+    await prisma.$executeRaw`
+      DELETE FROM matches m
+      USING lost_items l, found_items f
+      WHERE l.lost_id = m.lost_id
+        AND f.found_id = m.found_id
+        AND (l.status <> 'REPORTED_LOST' OR f.status <> 'NEWLY_FOUND')
+    `;
+  }
+
+  // 6) MATCH_SUGGESTED notifications: 1 per user per run (best newly-crossed match)
+  const bestPerUser = new Map<number, Pair>();
+  for (const p of crossed) {
+    const uid = ownerOf.get(p.lost_id);
+    if (uid === undefined) continue;
+    const existing = bestPerUser.get(uid);
+    if (!existing || p.score > existing.score) bestPerUser.set(uid, p);
+  }
+
+  if (!dryRun && bestPerUser.size) {
+    const names = await prisma.foundItem.findMany({
+      where: { found_id: { in: Array.from(bestPerUser.values(), (p) => p.found_id) } },
+      select: { found_id: true, item_name: true },
+    });
+    const nameOf = new Map(names.map((n) => [n.found_id, n.item_name] as const));
+
+    for (const batch of chunk(Array.from(bestPerUser.entries()), batchSize)) {
+      await prisma.notification.createMany({
+        data: batch.map(([userId, p]) => ({
+          user_id: userId,
+          type: "MATCH_SUGGESTED",
+          title: "Possible match found",
+          message: `A found item "${nameOf.get(p.found_id) || "item"}" may match your lost report (score ${p.score}). Reasons: ${p.reasons
+            .slice(0, 2)
+            .join(", ")}`,
+          href: `/lost/${p.lost_id}`,
+          is_read: false,
+        })),
+      });
+    }
+  }
+
+  // Fold report_rollups slot rows back into one row per bucket (report_rollup_bump spreads them)
+  const rollupRowsCompacted = dryRun
+    ? 0
+    : (await prisma.$queryRaw<Array<{ n: number }>>`SELECT report_rollups_compact() AS n`)[0].n;
+
+  const elapsedMs = Date.now() - t0;
+  const report = {
+    dryRun,
+    since: since.toISOString(),
+    watermark: runStartedAt.toISOString(),
+    inventory: { lost: lostRows.length, found: foundRows.length },
+    changed: { lost: changedLost.length, found: changedFound.length },
+    pairsScored: changedLost.length * foundRows.length + changedFound.length * lostRows.length,
+    matches: { touched: pairs.size, inserted, updated, unchanged, belowMinDeleted: belowMin.length, trimmed, staleDeleted: stale },
+    notifications: bestPerUser.size,
+    rollupRowsCompacted,
+    timingMs: { scoring: tScored - t0, total: elapsedMs },
+    throughput: {
+      changedRowsPerSec: Math.round(((changedLost.length + changedFound.length) / Math.max(1, elapsedMs)) * 1000),
+      matchRowsPerSec: Math.round((pairs.size / Math.max(1, elapsedMs)) * 1000),
+    },
+  };
+
+  // 7) Advance watermark (only after a successful real run)
+  if (!dryRun) {
+    await prisma.jobState.upsert({
+      where: { job_name: JOB_NAME },
+      update: { watermark: runStartedAt, meta: report },
+      create: { job_name: JOB_NAME, watermark: runStartedAt, meta: report },
+    });
+  }
+
+  console.log(JSON.stringify(report, null, 2));
+}
+
+main()
+  .catch((e) => {
+    console.error(e);
+    process.exit(1);
+  })
+  .finally(async () => {
+    await prisma.$disconnect();
+    await pool.end();
+  });
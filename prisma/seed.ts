@@ -4,6 +4,7 @@ import bcrypt from "bcryptjs";
 import { Pool } from "pg";
 import { PrismaPg } from "@prisma/adapter-pg";
 import { PrismaClient } from "../src/generated/prisma/client";
+import { matchTokens } from "../src/lib/matching";
 
 const pool = new Pool({
   connectionString: process.env.DATABASE_URL,
@@ -150,42 +151,44 @@ async function main() {
   });
 
   if (existing === 0) {
+    const demoFound = [
+      {
+        user_id: staff.user_id,
+        category_id: electronics,
+        location_id: engBldg,
+        item_name: "White Earbuds Case",
+        description: "Found a white earbuds charging case near the lab benches. No earbuds inside.",
+        date_found: new Date("2026-01-28T00:00:00.000Z"),
+        storage_location: "Security Office - Cabinet A",
+        image: null,
+        status: "NEWLY_FOUND",
+      },
+      {
+        user_id: staff.user_id,
+        category_id: idsDocs,
+        location_id: library,
+        item_name: "Student ID (Initials: M.J.)",
+        description: "Student ID found near library help desk. Initials M.J. on the sleeve.",
+        date_found: new Date("2026-01-29T00:00:00.000Z"),
+        storage_location: "Library Help Desk",
+        image: null,
+        status: "NEWLY_FOUND",
+      },
+      {
+        user_id: staff.user_id,
+        category_id: accessories,
+        location_id: cafeteria,
+        item_name: "Black Wallet",
+        description: "Black bi-fold wallet found on cafeteria table. Contains no cash.",
+        date_found: new Date("2026-01-29T00:00:00.000Z"),
+        storage_location: "Security Office - Lost & Found Drawer",
+        image: null,
+        status: "NEWLY_FOUND",
+      },
+    ];
+
     await prisma.foundItem.createMany({
-      data: [
-        {
-          user_id: staff.user_id,
-          category_id: electronics,
-          location_id: engBldg,
-          item_name: "White Earbuds Case",
-          description: "Found a white earbuds charging case near the lab benches. No earbuds inside.",
-          date_found: new Date("2026-01-28T00:00:00.000Z"),
-          storage_location: "Security Office - Cabinet A",
-          image: null,
-          status: "NEWLY_FOUND",
-        },
-        {
-          user_id: staff.user_id,
-          category_id: idsDocs,
-          location_id: library,
-          item_name: "Student ID (Initials: M.J.)",
-          description: "Student ID found near library help desk. Initials M.J. on the sleeve.",
-          date_found: new Date("2026-01-29T00:00:00.000Z"),
-          storage_location: "Library Help Desk",
-          image: null,
-          status: "NEWLY_FOUND",
-        },
-        {
-          user_id: staff.user_id,
-          category_id: accessories,
-          location_id: cafeteria,
-          item_name: "Black Wallet",
-          description: "Black bi-fold wallet found on cafeteria table. Contains no cash.",
-          date_found: new Date("2026-01-29T00:00:00.000Z"),
-          storage_location: "Security Office - Lost & Found Drawer",
-          image: null,
-          status: "NEWLY_FOUND",
-        },
-      ],
+      data: demoFound.map((f) => ({ ...f, match_tokens: matchTokens(f.item_name, f.description) })),
     });
   }
 
@@ -0,0 +1,94 @@
+import "dotenv/config";
+
+import { readdir, stat, unlink } from "fs/promises";
+import path from "path";
+import { Pool } from "pg";
+import { PrismaPg } from "@prisma/adapter-pg";
+import { PrismaClient } from "../src/generated/prisma/client";
+
+// Orphan sweep for local found-item uploads (public/uploads/found). found/update only deletes an
+// old image once its file is past a grace period, since a same-bytes upload may be about to
+// reference it; files still inside the grace window then are left for this sweep.
+//
+//   npm run sweep:uploads                      # delete unreferenced files older than the grace
+//   npm run sweep:uploads -- --dry-run         # list only
+//   npm run sweep:uploads -- --grace-minutes=60
+//
+// A file belongs to its stem ("<hash>" for <hash>.jpg and its .thumb/.md.webp variants), and a
+// stem is only removed when no found item points at it and every file in it is past the grace.
+
+const args = process.argv.slice(2);
+const dryRun = args.includes("--dry-run");
+const graceArg = args.find((a) => a.startsWith("--grace-minutes="));
+// Same window as found/update's UPLOAD_DELETE_GRACE_MS
+const graceMs = Math.max(0, Number(graceArg?.split("=")[1]) || 15) * 60 * 1000;
+
+const UPLOAD_DIR = path.join(process.cwd(), "public", "uploads", "found");
+const URL_PREFIX = "/uploads/found/";
+
+const pool = new Pool({ connectionString: process.env.DATABASE_URL });
+const adapter = new PrismaPg(pool);
+const prisma = new PrismaClient({ adapter });
+
+function stemOf(filename: string) {
+  const dot = filename.indexOf(".");
+  return dot === -1 ? filename : filename.slice(0, dot);
+}
+
+async function main() {
+  const names = await readdir(UPLOAD_DIR).catch((err: any) => {
+    if (err?.code === "ENOENT") return [] as string[];
+    throw err;
+  });
+
+  const groups = new Map<string, Array<{ name: string; mtimeMs: number }>>();
+  for (const name of names) {
+    const st = await stat(path.join(UPLOAD_DIR, name)).catch(() => null);
+    if (!st?.isFile()) continue;
+    const stem = stemOf(name);
+    const group = groups.get(stem) ?? [];
+    group.push({ name, mtimeMs: st.mtimeMs });
+    groups.set(stem, group);
+  }
+
+  // Read after listing: a file saved to a row in between is then seen as referenced
+  const rows = await prisma.foundItem.findMany({
+    where: { image: { startsWith: URL_PREFIX } },
+    select: { image: true },
+  });
+  const referenced = new Set(rows.map((r) => stemOf(r.image!.slice(URL_PREFIX.length))));
+
+  const cutoff = Date.now() - graceMs;
+  const removed: string[] = [];
+  let recent = 0;
+
+  for (const [stem, files] of groups) {
+    if (referenced.has(stem)) continue;
+    if (files.some((f) => f.mtimeMs > cutoff)) {
+      recent++;
+      continue;
+    }
+    for (const f of files) {
+      if (!dryRun) await unlink(path.join(UPLOAD_DIR, f.name)).catch(() => {});
+      removed.push(f.name);
+    }
+  }
+
+  console.log(
+    JSON.stringify(
+      { dryRun, graceMinutes: graceMs / 60000, files: names.length, removed: removed.length, keptRecent: recent, names: removed },
+      null,
+      2
+    )
+  );
+}
+
+main()
+  .catch((e) => {
+    console.error(e);
+    process.exit(1);
+  })
+  .finally(async () => {
+    await prisma.$disconnect();
+    await pool.end();
+  });
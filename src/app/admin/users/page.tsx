@@ -37,7 +37,9 @@ export default async function AdminUsersPage() {
             <div>
               <div className="font-semibold">User directory</div>
               <div className="text-sm text-muted-foreground">
-                Search and browse registered users.
+                Search and browse registered users. Changing a role or status signs that user out, but only
+                on the server instance that handled the change; others accept their old session until it
+                expires (up to 7 days).
               </div>
             </div>
           </div>
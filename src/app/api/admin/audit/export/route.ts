@@ -0,0 +1,75 @@
+import { NextResponse } from "next/server";
+import { instrumentRoute, prismaRead } from "@/lib/db";
+import { getSession } from "@/lib/session";
+import { auditLogWhere } from "@/lib/list-filters";
+import { exportResponse, keysetChunks, parseExportFormat, type ExportColumn } from "@/lib/export";
+
+type Row = Awaited<ReturnType<typeof fetchChunk>>[number];
+
+function fetchChunk(where: any, afterId: number | null, take: number) {
+  return prismaRead.auditLog.findMany({
+    where: afterId === null ? where : { AND: [where, { audit_id: { gt: afterId } }] },
+    orderBy: { audit_id: "asc" },
+    take,
+    select: {
+      audit_id: true,
+      created_at: true,
+      actor_user_id: true,
+      action: true,
+      entity_type: true,
+      entity_id: true,
+      summary: true,
+      ip: true,
+      user_agent: true,
+      meta: true,
+      actor: { select: { full_name: true, email: true } },
+    },
+  });
+}
+
+const COLUMNS: ExportColumn<Row>[] = [
+  { header: "audit_id", value: (r) => r.audit_id },
+  { header: "created_at", value: (r) => r.created_at },
+  { header: "actor_user_id", value: (r) => r.actor_user_id },
+  { header: "actor_name", value: (r) => r.actor?.full_name },
+  { header: "actor_email", value: (r) => r.actor?.email },
+  { header: "action", value: (r) => r.action },
+  { header: "entity_type", value: (r) => r.entity_type },
+  { header: "entity_id", value: (r) => r.entity_id },
+  { header: "summary", value: (r) => r.summary },
+  { header: "ip", value: (r) => r.ip },
+  { header: "user_agent", value: (r) => r.user_agent },
+  { header: "meta", value: (r) => r.meta },
+];
+
+// GET /api/admin/audit/export?format=csv|ndjson + the /api/admin/audit/list filters
+export const GET = instrumentRoute("GET /api/admin/audit/export", async (req: Request) => {
+  try {
+    const session = await getSession();
+    if (!session) {
+      return NextResponse.json({ ok: false, error: "Unauthorized" }, { status: 401 });
+    }
+
+    const role = String(session.role || "").toUpperCase();
+    if (role !== "ADMIN") {
+      return NextResponse.json({ ok: false, error: "Forbidden" }, { status: 403 });
+    }
+
+    const url = new URL(req.url);
+    const format = parseExportFormat(url.searchParams.get("format"));
+    if (!format) {
+      return NextResponse.json({ ok: false, error: "Invalid format. Allowed: csv, ndjson" }, { status: 400 });
+    }
+
+    const where = auditLogWhere(url.searchParams);
+
+    return exportResponse({
+      filename: "audit-logs",
+      format,
+      columns: COLUMNS,
+      chunks: keysetChunks((afterId, take) => fetchChunk(where, afterId, take), (r) => r.audit_id),
+    });
+  } catch {
+    return NextResponse.json({ ok: false, error: "Server error." }, { status: 500 });
+  }
+});
@@ -1,8 +1,10 @@
 import { NextResponse } from "next/server";
-import { prisma } from "@/lib/db";
+import { instrumentRoute, prismaRead } from "@/lib/db";
 import { getSession } from "@/lib/session";
+import { auditLogWhere } from "@/lib/list-filters";
+import { keysetPage, keysetWhere, keysetWindow, parseKeyset, resolveTotal } from "@/lib/pagination";
 
-export async function GET(req: Request) {
+export const GET = instrumentRoute("GET /api/admin/audit/list", async (req: Request) => {
   try {
     const session = await getSession();
     if (!session) {
@@ -16,65 +18,31 @@ export async function GET(req: Request) {
 
     const url = new URL(req.url);
 
-    const q = String(url.searchParams.get("q") || "").trim();
-    const action = String(url.searchParams.get("action") || "ALL").trim();
-    const entityType = String(url.searchParams.get("entityType") || "ALL").trim();
-    const actorUserIdRaw = String(url.searchParams.get("actorUserId") || "").trim();
-
     const page = Math.max(1, Number(url.searchParams.get("page") || 1));
     const pageSize = Math.min(50, Math.max(5, Number(url.searchParams.get("pageSize") || 20)));
-    const skip = (page - 1) * pageSize;
-
-    const fromRaw = String(url.searchParams.get("from") || "").trim(); // ISO date/time
-    const toRaw = String(url.searchParams.get("to") || "").trim();
 
-    const where: any = {};
+    // Same filters as /api/admin/audit/export
+    const where = auditLogWhere(url.searchParams);
 
-    if (action && action !== "ALL") where.action = action;
-    if (entityType && entityType !== "ALL") where.entity_type = entityType;
-
-    const actorUserId = Number(actorUserIdRaw);
-    if (actorUserIdRaw && Number.isFinite(actorUserId)) {
-      where.actor_user_id = actorUserId;
+    // Keyset mode (see lib/pagination.ts), keyed on (created_at, audit_id)
+    const keyset = parseKeyset(url.searchParams);
+    if (!keyset) {
+      return NextResponse.json({ ok: false, error: "Invalid cursor." }, { status: 400 });
     }
+    const { cursorMode, totalMode } = keyset;
 
-    if (fromRaw || toRaw) {
-      where.created_at = {};
-      if (fromRaw) {
-        const from = new Date(fromRaw);
-        if (!Number.isNaN(from.getTime())) where.created_at.gte = from;
-      }
-      if (toRaw) {
-        const to = new Date(toRaw);
-        if (!Number.isNaN(to.getTime())) where.created_at.lte = to;
-      }
-      // cleanup if invalid
-      if (Object.keys(where.created_at).length === 0) delete where.created_at;
-    }
-
-    if (q.length > 0) {
-      where.OR = [
-        { action: { contains: q, mode: "insensitive" } },
-        { entity_type: { contains: q, mode: "insensitive" } },
-        { summary: { contains: q, mode: "insensitive" } },
-        {
-          actor: {
-            OR: [
-              { full_name: { contains: q, mode: "insensitive" } },
-              { email: { contains: q, mode: "insensitive" } },
-            ],
-          },
-        },
-      ];
-    }
+    const pageWhere = keysetWhere(where, keyset, { date: "created_at", id: "audit_id" });
 
-    const [total, rows] = await Promise.all([
-      prisma.auditLog.count({ where }),
-      prisma.auditLog.findMany({
-        where,
-        orderBy: { created_at: "desc" },
-        skip,
-        take: pageSize,
+    const [totalInfo, found] = await Promise.all([
+      resolveTotal(totalMode, {
+        exact: () => prismaRead.auditLog.count({ where }),
+        capped: (take) => prismaRead.auditLog.count({ where, take }),
+        table: Object.keys(where).length ? undefined : "audit_logs",
+      }),
+      prismaRead.auditLog.findMany({
+        where: pageWhere,
+        orderBy: [{ created_at: "desc" }, { audit_id: "desc" }],
+        ...keysetWindow(keyset, page, pageSize),
         select: {
           audit_id: true,
           actor_user_id: true,
@@ -98,20 +66,25 @@ export async function GET(req: Request) {
       }),
     ]);
 
-    const totalPages = Math.max(1, Math.ceil(total / pageSize));
+    const { rows, nextCursor } = keysetPage(found, keyset, pageSize, (r) => ({ at: r.created_at, id: r.audit_id }));
+
+    const { total, totalIsEstimate } = totalInfo;
+    const items = rows.map((r) => ({
+      ...r,
+      created_at: r.created_at.toISOString(),
+    }));
+
+    if (cursorMode) {
+      return NextResponse.json(
+        { ok: true, items, pageSize, nextCursor, total, totalIsEstimate },
+        { status: 200 }
+      );
+    }
+
+    const totalPages = total === null ? null : Math.max(1, Math.ceil(total / pageSize));
 
     return NextResponse.json(
-      {
-        ok: true,
-        page,
-        pageSize,
-        total,
-        totalPages,
-        items: rows.map((r) => ({
-          ...r,
-          created_at: r.created_at.toISOString(),
-        })),
-      },
+      { ok: true, page, pageSize, total, totalPages, totalIsEstimate, items },
       { status: 200 }
     );
   } catch (e: any) {
@@ -120,4 +93,4 @@ export async function GET(req: Request) {
       { status: 500 }
     );
   }
-}
+});
@@ -1,8 +1,9 @@
 import { NextResponse } from "next/server";
-import { prisma } from "@/lib/db";
+import { instrumentRoute, prismaRead } from "@/lib/db";
 import { getSession } from "@/lib/session";
+import { keysetPage, keysetWhere, keysetWindow, parseKeyset, resolveTotal } from "@/lib/pagination";
 
-export async function GET(req: Request) {
+export const GET = instrumentRoute("GET /api/admin/audit", async (req: Request) => {
   try {
     const session = await getSession();
     if (!session) {
@@ -42,14 +43,25 @@ export async function GET(req: Request) {
       ];
     }
 
-    const total = await prisma.auditLog.count({ where });
-    const totalPages = Math.max(1, Math.ceil(total / pageSize));
+    // Keyset mode (see lib/pagination.ts), keyed on (created_at, audit_id)
+    const keyset = parseKeyset(url.searchParams);
+    if (!keyset) {
+      return NextResponse.json({ ok: false, error: "Invalid cursor." }, { status: 400 });
+    }
+    const { cursorMode, totalMode } = keyset;
+
+    const pageWhere = keysetWhere(where, keyset, { date: "created_at", id: "audit_id" });
 
-    const rows = await prisma.auditLog.findMany({
-      where,
-      orderBy: { created_at: "desc" },
-      skip: (page - 1) * pageSize,
-      take: pageSize,
+    const { total, totalIsEstimate } = await resolveTotal(totalMode, {
+      exact: () => prismaRead.auditLog.count({ where }),
+      capped: (take) => prismaRead.auditLog.count({ where, take }),
+      table: Object.keys(where).length ? undefined : "audit_logs",
+    });
+
+    const found = await prismaRead.auditLog.findMany({
+      where: pageWhere,
+      orderBy: [{ created_at: "desc" }, { audit_id: "desc" }],
+      ...keysetWindow(keyset, page, pageSize),
       select: {
         audit_id: true,
         actor_user_id: true,
@@ -72,18 +84,24 @@ export async function GET(req: Request) {
       },
     });
 
+    const { rows, nextCursor } = keysetPage(found, keyset, pageSize, (r) => ({ at: r.created_at, id: r.audit_id }));
+
+    const items = rows.map((r) => ({
+      ...r,
+      created_at: r.created_at.toISOString(),
+    }));
+
+    if (cursorMode) {
+      return NextResponse.json(
+        { ok: true, items, pageSize, nextCursor, total, totalIsEstimate },
+        { status: 200 }
+      );
+    }
+
+    const totalPages = total === null ? null : Math.max(1, Math.ceil(total / pageSize));
+
     return NextResponse.json(
-      {
-        ok: true,
-        page,
-        pageSize,
-        total,
-        totalPages,
-        items: rows.map((r) => ({
-          ...r,
-          created_at: r.created_at.toISOString(),
-        })),
-      },
+      { ok: true, page, pageSize, total, totalPages, totalIsEstimate, items },
       { status: 200 }
     );
   } catch (e: any) {
@@ -92,4 +110,4 @@ export async function GET(req: Request) {
       { status: 500 }
     );
   }
-}
+});
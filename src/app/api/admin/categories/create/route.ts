@@ -1,8 +1,10 @@
 import { NextResponse } from "next/server";
-import { prisma } from "@/lib/db";
 import { getSession } from "@/lib/session";
+import { auditedTransaction } from "@/lib/audit";
+import { instrumentRoute } from "@/lib/db";
+import { invalidateReferenceData } from "@/lib/reference-data";
 
-export async function POST(req: Request) {
+export const POST = instrumentRoute("POST /api/admin/categories/create", async (req: Request) => {
   try {
     const session = await getSession();
     if (!session) return NextResponse.json({ ok: false, error: "Unauthorized" }, { status: 401 });
@@ -25,7 +27,7 @@ export async function POST(req: Request) {
     const ip = req.headers.get("x-forwarded-for") || req.headers.get("x-real-ip") || null;
     const ua = req.headers.get("user-agent") || null;
 
-    const created = await prisma.$transaction(async (tx) => {
+    const created = await auditedTransaction(async (tx, audit) => {
       const exists = await tx.category.findFirst({
         where: { category_name: { equals: categoryName, mode: "insensitive" } },
         select: { category_id: true },
@@ -37,22 +39,22 @@ export async function POST(req: Request) {
         select: { category_id: true, category_name: true },
       });
 
-      await tx.auditLog.create({
-        data: {
-          actor_user_id: actorUserId,
-          action: "ADMIN_CATEGORY_CREATE",
-          entity_type: "Category",
-          entity_id: row.category_id,
-          summary: `Created category "${row.category_name}"`,
-          meta: { category_id: row.category_id, category_name: row.category_name },
-          ip,
-          user_agent: ua,
-        },
+      audit({
+        actor_user_id: actorUserId,
+        action: "ADMIN_CATEGORY_CREATE",
+        entity_type: "Category",
+        entity_id: row.category_id,
+        summary: `Created category "${row.category_name}"`,
+        meta: { category_id: row.category_id, category_name: row.category_name },
+        ip,
+        user_agent: ua,
       });
 
       return row;
     });
 
+    invalidateReferenceData();
+
     return NextResponse.json({ ok: true, category: created }, { status: 201 });
   } catch (e: any) {
     if (String(e?.message || "") === "DUPLICATE") {
@@ -60,4 +62,4 @@ export async function POST(req: Request) {
     }
     return NextResponse.json({ ok: false, error: "Server error." }, { status: 500 });
   }
-}
+});
@@ -1,8 +1,10 @@
 import { NextResponse } from "next/server";
-import { prisma } from "@/lib/db";
 import { getSession } from "@/lib/session";
+import { auditedTransaction } from "@/lib/audit";
+import { instrumentRoute } from "@/lib/db";
+import { invalidateReferenceData } from "@/lib/reference-data";
 
-export async function POST(req: Request) {
+export const POST = instrumentRoute("POST /api/admin/categories/delete", async (req: Request) => {
   try {
     const session = await getSession();
     if (!session) return NextResponse.json({ ok: false, error: "Unauthorized" }, { status: 401 });
@@ -25,7 +27,7 @@ export async function POST(req: Request) {
     const ip = req.headers.get("x-forwarded-for") || req.headers.get("x-real-ip") || null;
     const ua = req.headers.get("user-agent") || null;
 
-    const deleted = await prisma.$transaction(async (tx) => {
+    const deleted = await auditedTransaction(async (tx, audit) => {
       const cat = await tx.category.findUnique({
         where: { category_id: categoryId },
         select: { category_id: true, category_name: true },
@@ -41,22 +43,22 @@ export async function POST(req: Request) {
 
       await tx.category.delete({ where: { category_id: categoryId } });
 
-      await tx.auditLog.create({
-        data: {
-          actor_user_id: actorUserId,
-          action: "ADMIN_CATEGORY_DELETE",
-          entity_type: "Category",
-          entity_id: categoryId,
-          summary: `Deleted category "${cat.category_name}"`,
-          meta: { category_id: categoryId, category_name: cat.category_name },
-          ip,
-          user_agent: ua,
-        },
+      audit({
+        actor_user_id: actorUserId,
+        action: "ADMIN_CATEGORY_DELETE",
+        entity_type: "Category",
+        entity_id: categoryId,
+        summary: `Deleted category "${cat.category_name}"`,
+        meta: { category_id: categoryId, category_name: cat.category_name },
+        ip,
+        user_agent: ua,
       });
 
       return cat;
     });
 
+    invalidateReferenceData();
+
     return NextResponse.json({ ok: true, deleted }, { status: 200 });
   } catch (e: any) {
     const msg = String(e?.message || "");
@@ -64,4 +66,4 @@ export async function POST(req: Request) {
     if (msg === "IN_USE") return NextResponse.json({ ok: false, error: "Category is in use and cannot be deleted." }, { status: 409 });
     return NextResponse.json({ ok: false, error: "Server error." }, { status: 500 });
   }
-}
+});
@@ -1,8 +1,11 @@
 import { NextResponse } from "next/server";
-import { prisma } from "@/lib/db";
 import { getSession } from "@/lib/session";
+import { invalidateStaffReport } from "@/lib/reports";
+import { invalidateReferenceData } from "@/lib/reference-data";
+import { auditedTransaction } from "@/lib/audit";
+import { instrumentRoute } from "@/lib/db";
 
-export async function POST(req: Request) {
+export const POST = instrumentRoute("POST /api/admin/categories/update", async (req: Request) => {
   try {
     const session = await getSession();
     if (!session) {
@@ -36,7 +39,7 @@ export async function POST(req: Request) {
     const ip = req.headers.get("x-forwarded-for") || req.headers.get("x-real-ip") || null;
     const ua = req.headers.get("user-agent") || null;
 
-    const updated = await prisma.$transaction(async (tx) => {
+    const updated = await auditedTransaction(async (tx, audit) => {
       const before = await tx.category.findUnique({
         where: { category_id: categoryId },
         select: { category_id: true, category_name: true },
@@ -52,26 +55,27 @@ export async function POST(req: Request) {
         select: { category_id: true, category_name: true },
       });
 
-      await tx.auditLog.create({
-        data: {
-          actor_user_id: actorUserId,
-          action: "ADMIN_CATEGORY_UPDATE",
-          entity_type: "Category",
-          entity_id: categoryId,
-          summary: `Renamed category "${before.category_name}" -> "${after.category_name}"`,
-          meta: {
-            category_id: categoryId,
-            from: before.category_name,
-            to: after.category_name,
-          },
-          ip,
-          user_agent: ua,
+      audit({
+        actor_user_id: actorUserId,
+        action: "ADMIN_CATEGORY_UPDATE",
+        entity_type: "Category",
+        entity_id: categoryId,
+        summary: `Renamed category "${before.category_name}" -> "${after.category_name}"`,
+        meta: {
+          category_id: categoryId,
+          from: before.category_name,
+          to: after.category_name,
         },
+        ip,
+        user_agent: ua,
       });
 
       return after;
     });
 
+    invalidateStaffReport();
+    invalidateReferenceData();
+
     return NextResponse.json({ ok: true, category: updated }, { status: 200 });
   } catch (e: any) {
     const msg = String(e?.message || "");
@@ -87,4 +91,4 @@ export async function POST(req: Request) {
 
     return NextResponse.json({ ok: false, error: "Server error." }, { status: 500 });
   }
-}
+});
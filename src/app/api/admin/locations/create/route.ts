@@ -1,8 +1,10 @@
 import { NextResponse } from "next/server";
-import { prisma } from "@/lib/db";
 import { getSession } from "@/lib/session";
+import { auditedTransaction } from "@/lib/audit";
+import { instrumentRoute } from "@/lib/db";
+import { invalidateReferenceData } from "@/lib/reference-data";
 
-export async function POST(req: Request) {
+export const POST = instrumentRoute("POST /api/admin/locations/create", async (req: Request) => {
   try {
     const session = await getSession();
     if (!session) return NextResponse.json({ ok: false, error: "Unauthorized" }, { status: 401 });
@@ -31,7 +33,7 @@ export async function POST(req: Request) {
 
     const ua = req.headers.get("user-agent") || null;
 
-    const created = await prisma.$transaction(async (tx) => {
+    const created = await auditedTransaction(async (tx, audit) => {
       const loc = await tx.location.create({
         data: {
           location_name: locationName,
@@ -40,26 +42,26 @@ export async function POST(req: Request) {
         select: { location_id: true, location_name: true, description: true },
       });
 
-      await tx.auditLog.create({
-        data: {
-          actor_user_id: actorUserId,
-          action: "ADMIN_LOCATION_CREATE",
-          entity_type: "Location",
-          entity_id: loc.location_id,
-          summary: `Created location "${loc.location_name}"`,
-          meta: {
-            location_id: loc.location_id,
-            location_name: loc.location_name,
-            description: loc.description,
-          },
-          ip,
-          user_agent: ua,
+      audit({
+        actor_user_id: actorUserId,
+        action: "ADMIN_LOCATION_CREATE",
+        entity_type: "Location",
+        entity_id: loc.location_id,
+        summary: `Created location "${loc.location_name}"`,
+        meta: {
+          location_id: loc.location_id,
+          location_name: loc.location_name,
+          description: loc.description,
         },
+        ip,
+        user_agent: ua,
       });
 
       return loc;
     });
 
+    invalidateReferenceData();
+
     return NextResponse.json({ ok: true, created }, { status: 201 });
   } catch (e: any) {
     const code = String(e?.code || "");
@@ -68,4 +70,4 @@ export async function POST(req: Request) {
     }
     return NextResponse.json({ ok: false, error: "Server error." }, { status: 500 });
   }
-}
+});
@@ -1,8 +1,10 @@
 import { NextResponse } from "next/server";
-import { prisma } from "@/lib/db";
 import { getSession } from "@/lib/session";
+import { auditedTransaction } from "@/lib/audit";
+import { instrumentRoute } from "@/lib/db";
+import { invalidateReferenceData } from "@/lib/reference-data";
 
-export async function POST(req: Request) {
+export const POST = instrumentRoute("POST /api/admin/locations/delete", async (req: Request) => {
   try {
     const session = await getSession();
     if (!session) return NextResponse.json({ ok: false, error: "Unauthorized" }, { status: 401 });
@@ -29,7 +31,7 @@ export async function POST(req: Request) {
 
     const ua = req.headers.get("user-agent") || null;
 
-    const deleted = await prisma.$transaction(async (tx) => {
+    const deleted = await auditedTransaction(async (tx, audit) => {
       const loc = await tx.location.findUnique({
         where: { location_id: locationId },
         select: { location_id: true, location_name: true, description: true },
@@ -46,28 +48,28 @@ export async function POST(req: Request) {
 
       await tx.location.delete({ where: { location_id: locationId } });
 
-      await tx.auditLog.create({
-        data: {
-          actor_user_id: actorUserId,
-          action: "ADMIN_LOCATION_DELETE",
-          entity_type: "Location",
-          entity_id: locationId,
-          summary: `Deleted location "${loc.location_name}"`,
-          meta: {
-            location_id: loc.location_id,
-            location_name: loc.location_name,
-            description: loc.description,
-            lostCount,
-            foundCount,
-          },
-          ip,
-          user_agent: ua,
+      audit({
+        actor_user_id: actorUserId,
+        action: "ADMIN_LOCATION_DELETE",
+        entity_type: "Location",
+        entity_id: locationId,
+        summary: `Deleted location "${loc.location_name}"`,
+        meta: {
+          location_id: loc.location_id,
+          location_name: loc.location_name,
+          description: loc.description,
+          lostCount,
+          foundCount,
         },
+        ip,
+        user_agent: ua,
       });
 
       return loc;
     });
 
+    invalidateReferenceData();
+
     return NextResponse.json({ ok: true, deleted }, { status: 200 });
   } catch (e: any) {
     const msg = String(e?.message || "");
@@ -82,4 +84,4 @@ export async function POST(req: Request) {
     }
     return NextResponse.json({ ok: false, error: "Server error." }, { status: 500 });
   }
-}
+});
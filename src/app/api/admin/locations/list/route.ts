@@ -1,8 +1,8 @@
 import { NextResponse } from "next/server";
-import { prisma } from "@/lib/db";
+import { instrumentRoute, prisma } from "@/lib/db";
 import { getSession } from "@/lib/session";
 
-export async function GET(req: Request) {
+export const GET = instrumentRoute("GET /api/admin/locations/list", async (req: Request) => {
   try {
     const session = await getSession();
     if (!session) {
@@ -64,4 +64,4 @@ export async function GET(req: Request) {
   } catch {
     return NextResponse.json({ ok: false, error: "Server error." }, { status: 500 });
   }
-}
+});
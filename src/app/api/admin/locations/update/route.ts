@@ -1,8 +1,11 @@
 import { NextResponse } from "next/server";
-import { prisma } from "@/lib/db";
 import { getSession } from "@/lib/session";
+import { invalidateStaffReport } from "@/lib/reports";
+import { invalidateReferenceData } from "@/lib/reference-data";
+import { auditedTransaction } from "@/lib/audit";
+import { instrumentRoute } from "@/lib/db";
 
-export async function POST(req: Request) {
+export const POST = instrumentRoute("POST /api/admin/locations/update", async (req: Request) => {
   try {
     const session = await getSession();
     if (!session) {
@@ -35,7 +38,7 @@ export async function POST(req: Request) {
     const ip = req.headers.get("x-forwarded-for") || req.headers.get("x-real-ip") || null;
     const ua = req.headers.get("user-agent") || null;
 
-    const updated = await prisma.$transaction(async (tx) => {
+    const updated = await auditedTransaction(async (tx, audit) => {
       const before = await tx.location.findUnique({
         where: { location_id: locationId },
         select: { location_id: true, location_name: true, description: true },
@@ -60,25 +63,26 @@ export async function POST(req: Request) {
         changes.description = { from: before.description ?? null, to: loc.description ?? null };
       }
 
-      await tx.auditLog.create({
-        data: {
-          actor_user_id: actorUserId,
-          action: "ADMIN_LOCATION_UPDATE",
-          entity_type: "Location",
-          entity_id: locationId,
-          summary: `Updated location "${loc.location_name}"`,
-          meta: {
-            location_id: locationId,
-            changes,
-          },
-          ip,
-          user_agent: ua,
+      audit({
+        actor_user_id: actorUserId,
+        action: "ADMIN_LOCATION_UPDATE",
+        entity_type: "Location",
+        entity_id: locationId,
+        summary: `Updated location "${loc.location_name}"`,
+        meta: {
+          location_id: locationId,
+          changes,
         },
+        ip,
+        user_agent: ua,
       });
 
       return loc;
     });
 
+    invalidateStaffReport();
+    invalidateReferenceData();
+
     return NextResponse.json({ ok: true, location: updated }, { status: 200 });
   } catch (e: any) {
     const msg = String(e?.message || "");
@@ -93,4 +97,4 @@ export async function POST(req: Request) {
     }
     return NextResponse.json({ ok: false, error: "Server error." }, { status: 500 });
   }
-}
+});
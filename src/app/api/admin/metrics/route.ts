@@ -0,0 +1,45 @@
+import { NextResponse } from "next/server";
+import { getSession } from "@/lib/session";
+import { renderDbMetrics } from "@/lib/db";
+import { getAuditStats } from "@/lib/audit";
+
+export const runtime = "nodejs";
+export const dynamic = "force-dynamic";
+
+function auditMetrics() {
+  const s = getAuditStats();
+  return [
+    "# HELP foundit_audit_buffered Audit entries queued for the next flush (AUDIT_MODE=buffered).",
+    "# TYPE foundit_audit_buffered gauge",
+    `foundit_audit_buffered{mode="${s.mode}"} ${s.buffered}`,
+    "# HELP foundit_audit_entries_total Audit entries by outcome.",
+    "# TYPE foundit_audit_entries_total counter",
+    `foundit_audit_entries_total{outcome="written"} ${s.written}`,
+    `foundit_audit_entries_total{outcome="failed"} ${s.failed}`,
+    `foundit_audit_entries_total{outcome="dropped"} ${s.dropped}`,
+  ].join("\n") + "\n";
+}
+
+/** Prometheus text snapshot of this server process (DB queries, pool, audit sink). */
+export async function GET() {
+  try {
+    const session = await getSession();
+    if (!session) {
+      return NextResponse.json({ ok: false, error: "Unauthorized" }, { status: 401 });
+    }
+
+    const role = String(session.role || "").toUpperCase();
+    if (role !== "ADMIN") {
+      return NextResponse.json({ ok: false, error: "Forbidden" }, { status: 403 });
+    }
+
+    return new Response(renderDbMetrics() + auditMetrics(), {
+      headers: {
+        "content-type": "text/plain; version=0.0.4; charset=utf-8",
+        "cache-control": "no-store",
+      },
+    });
+  } catch {
+    return NextResponse.json({ ok: false, error: "Server error." }, { status: 500 });
+  }
+}
@@ -1,8 +1,8 @@
 import { NextResponse } from "next/server";
-import { prisma } from "@/lib/db";
+import { instrumentRoute, prisma } from "@/lib/db";
 import { getSession } from "@/lib/session";
 
-export async function GET(req: Request) {
+export const GET = instrumentRoute("GET /api/admin/users/list", async (req: Request) => {
   try {
     const session = await getSession();
     if (!session) {
@@ -71,4 +71,4 @@ export async function GET(req: Request) {
       { status: 500 }
     );
   }
-}
+});
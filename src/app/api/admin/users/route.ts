@@ -1,6 +1,8 @@
 import { NextResponse } from "next/server";
-import { prisma } from "@/lib/db";
+import { instrumentRoute, prisma } from "@/lib/db";
 import { getSession } from "@/lib/session";
+import { auditedTransaction } from "@/lib/audit";
+import { revokeUserSessions } from "@/lib/auth";
 
 const MAX_PAGE_SIZE = 50;
 
@@ -9,7 +11,7 @@ function toInt(v: string | null, fallback: number) {
   return Number.isFinite(n) ? n : fallback;
 }
 
-export async function GET(req: Request) {
+export const GET = instrumentRoute("GET /api/admin/users", async (req: Request) => {
   try {
     const session = await getSession();
     if (!session) {
@@ -87,9 +89,9 @@ export async function GET(req: Request) {
   } catch {
     return NextResponse.json({ ok: false, error: "Server error." }, { status: 500 });
   }
-}
+});
 
-export async function POST(req: Request) {
+export const POST = instrumentRoute("POST /api/admin/users", async (req: Request) => {
   try {
     const session = await getSession();
     if (!session) {
@@ -128,7 +130,14 @@ export async function POST(req: Request) {
       null;
     const ua = req.headers.get("user-agent") || null;
 
-    const updated = await prisma.$transaction(async (tx) => {
+    let accessChanged = false;
+
+    const updated = await auditedTransaction(async (tx, audit) => {
+      const before = await tx.user.findUnique({
+        where: { user_id: userId },
+        select: { status: true, role: { select: { role_name: true } } },
+      });
+
       const data: any = {};
 
       if (nextStatus) data.status = nextStatus;
@@ -156,29 +165,32 @@ export async function POST(req: Request) {
         },
       });
 
+      accessChanged = before?.status !== u.status || before?.role.role_name !== u.role.role_name;
+
       // audit
-      await tx.auditLog.create({
-        data: {
-          actor_user_id: adminId,
-          action: "USER_UPDATED",
-          entity_type: "User",
-          entity_id: userId,
-          summary: `Updated user "${u.full_name}"`,
-          meta: {
-            user_id: userId,
-            changes: {
-              ...(nextStatus ? { status: nextStatus } : {}),
-              ...(nextRoleName ? { role: nextRoleName } : {}),
-            },
+      audit({
+        actor_user_id: adminId,
+        action: "USER_UPDATED",
+        entity_type: "User",
+        entity_id: userId,
+        summary: `Updated user "${u.full_name}"`,
+        meta: {
+          user_id: userId,
+          changes: {
+            ...(nextStatus ? { status: nextStatus } : {}),
+            ...(nextRoleName ? { role: nextRoleName } : {}),
           },
-          ip,
-          user_agent: ua,
         },
+        ip,
+        user_agent: ua,
       });
 
       return u;
     });
 
+    // Their current token still carries the old role/status: make them sign in again
+    if (accessChanged) revokeUserSessions(userId);
+
     return NextResponse.json({ ok: true, user: updated }, { status: 200 });
   } catch (e: any) {
     if (String(e?.message || "") === "INVALID_ROLE") {
@@ -186,4 +198,4 @@ export async function POST(req: Request) {
     }
     return NextResponse.json({ ok: false, error: "Server error." }, { status: 500 });
   }
-}
+});
@@ -1,6 +1,8 @@
 import { NextResponse } from "next/server";
-import { prisma } from "@/lib/db";
 import { getSession } from "@/lib/session";
+import { auditedTransaction } from "@/lib/audit";
+import { revokeUserSessions } from "@/lib/auth";
+import { instrumentRoute } from "@/lib/db";
 
 const ROLE_ALLOWED = new Set(["USER", "STAFF", "ADMIN"]);
 
@@ -14,7 +16,7 @@ function normalizeStatus(s: string) {
   return t;
 }
 
-export async function POST(req: Request) {
+export const POST = instrumentRoute("POST /api/admin/users/update", async (req: Request) => {
   try {
     const session = await getSession();
     if (!session) {
@@ -74,7 +76,9 @@ export async function POST(req: Request) {
 
     const ua = req.headers.get("user-agent") || null;
 
-    const updated = await prisma.$transaction(async (tx) => {
+    let accessChanged = false;
+
+    const updated = await auditedTransaction(async (tx, audit) => {
       const before = await tx.user.findUnique({
         where: { user_id: userId },
         select: {
@@ -119,22 +123,25 @@ export async function POST(req: Request) {
       if (nextStatus) changes.status = { from: before.status, to: user.status };
       if (nextRoleRaw) changes.role = { from: before.role.role_name, to: user.role.role_name };
 
-      await tx.auditLog.create({
-        data: {
-          actor_user_id: actorUserId,
-          action: "ADMIN_USER_UPDATE",
-          entity_type: "User",
-          entity_id: userId,
-          summary: `Updated user ${user.email}`,
-          meta: { user_id: userId, email: user.email, changes },
-          ip,
-          user_agent: ua,
-        },
+      accessChanged = before.status !== user.status || before.role.role_name !== user.role.role_name;
+
+      audit({
+        actor_user_id: actorUserId,
+        action: "ADMIN_USER_UPDATE",
+        entity_type: "User",
+        entity_id: userId,
+        summary: `Updated user ${user.email}`,
+        meta: { user_id: userId, email: user.email, changes },
+        ip,
+        user_agent: ua,
       });
 
       return user;
     });
 
+    // Their current token still carries the old role/status: make them sign in again
+    if (accessChanged) revokeUserSessions(userId);
+
     // Return BOTH shapes so UI won’t break:
     return NextResponse.json({ ok: true, updated, user: updated }, { status: 200 });
   } catch (e: any) {
@@ -147,4 +154,4 @@ export async function POST(req: Request) {
     }
     return NextResponse.json({ ok: false, error: "Server error." }, { status: 500 });
   }
-}
+});
@@ -1,8 +1,8 @@
 import { NextResponse } from "next/server";
-import { prisma } from "@/lib/db";
+import { instrumentRoute, prisma } from "@/lib/db";
 import { getSession } from "@/lib/session";
 
-export async function POST(req: Request) {
+export const POST = instrumentRoute("POST /api/audit/smoke", async (req: Request) => {
   try {
     const session = await getSession().catch(() => null);
 
@@ -41,4 +41,4 @@ export async function POST(req: Request) {
       { status: 500 }
     );
   }
-}
+});
@@ -1,9 +1,26 @@
 import { NextResponse } from "next/server";
-import { prisma } from "@/lib/db";
-import { verifyPassword } from "@/lib/auth";
+import { instrumentRoute, prisma } from "@/lib/db";
+import { hashPassword, passwordNeedsRehash, PasswordPoolBusyError, verifyPassword } from "@/lib/auth";
 import { setSession } from "@/lib/session";
 
-export async function POST(req: Request) {
+function busy() {
+  return NextResponse.json(
+    { error: "Too many sign-ins right now. Please try again in a moment." },
+    { status: 503, headers: { "retry-after": "2" } }
+  );
+}
+
+// Upgrade a hash made with an older BCRYPT_COST. Best effort, off the response path;
+// skipped if the password changed in the meantime.
+function rehashInBackground(userId: number, password: string, oldHash: string) {
+  void hashPassword(password)
+    .then((hashed) =>
+      prisma.user.updateMany({ where: { user_id: userId, password: oldHash }, data: { password: hashed } })
+    )
+    .catch(() => {});
+}
+
+export const POST = instrumentRoute("POST /api/auth/login", async (req: Request) => {
   try {
     const body = await req.json();
     const email = String(body.email || "").trim().toLowerCase();
@@ -39,6 +56,10 @@ export async function POST(req: Request) {
       return NextResponse.json({ error: "Invalid credentials." }, { status: 401 });
     }
 
+    if (passwordNeedsRehash(user.password)) {
+      rehashInBackground(user.user_id, password, user.password);
+    }
+
     await setSession({
       userId: user.user_id,
       role: user.role.role_name as "USER" | "STAFF" | "ADMIN",
@@ -60,7 +81,8 @@ export async function POST(req: Request) {
       { status: 200 }
     );
   } catch (e) {
+    if (e instanceof PasswordPoolBusyError) return busy();
     console.error("Login error:", e);
     return NextResponse.json({ error: "Server error." }, { status: 500 });
   }
-}
+});
@@ -1,7 +1,8 @@
 import { NextResponse } from "next/server";
 import { clearSession } from "@/lib/session";
+import { instrumentRoute } from "@/lib/db";
 
-export async function POST() {
+export const POST = instrumentRoute("POST /api/auth/logout", async () => {
   await clearSession();
   return NextResponse.json({ ok: true }, { status: 200 });
-}
+});
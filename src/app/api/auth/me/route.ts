@@ -1,7 +1,8 @@
 import { NextResponse } from "next/server";
 import { getSession } from "@/lib/session";
+import { instrumentRoute } from "@/lib/db";
 
-export async function GET() {
+export const GET = instrumentRoute("GET /api/auth/me", async () => {
   const session = await getSession();
   return NextResponse.json({ session }, { status: 200 });
-}
+});
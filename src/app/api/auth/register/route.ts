@@ -1,9 +1,17 @@
 import { NextResponse } from "next/server";
-import { prisma } from "@/lib/db";
-import { hashPassword } from "@/lib/auth";
+import { instrumentRoute, prisma } from "@/lib/db";
+import { hashPassword, PasswordPoolBusyError } from "@/lib/auth";
 import { setSession } from "@/lib/session";
+import { getReferenceData } from "@/lib/reference-data";
 
-export async function POST(req: Request) {
+function busy() {
+  return NextResponse.json(
+    { error: "Too many sign-ups right now. Please try again in a moment." },
+    { status: 503, headers: { "retry-after": "2" } }
+  );
+}
+
+export const POST = instrumentRoute("POST /api/auth/register", async (req: Request) => {
   try {
     const body = await req.json();
     const fullName = String(body.fullName || "").trim();
@@ -32,8 +40,8 @@ export async function POST(req: Request) {
       );
     }
 
-    const userRole = await prisma.role.findFirst({ where: { role_name: "USER" } });
-    if (!userRole) {
+    const userRoleId = (await getReferenceData()).roleIds.get("USER");
+    if (!userRoleId) {
       return NextResponse.json({ error: "USER role not found." }, { status: 500 });
     }
 
@@ -41,7 +49,7 @@ export async function POST(req: Request) {
 
     const user = await prisma.user.create({
       data: {
-        role_id: userRole.role_id,
+        role_id: userRoleId,
         full_name: fullName,
         id_number: idNumber,
         email,
@@ -67,6 +75,7 @@ export async function POST(req: Request) {
 
     return NextResponse.json({ ok: true, user }, { status: 201 });
   } catch (e) {
+    if (e instanceof PasswordPoolBusyError) return busy();
     return NextResponse.json({ error: "Server error." }, { status: 500 });
   }
-}
+});
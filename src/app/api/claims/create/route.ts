@@ -1,9 +1,10 @@
 import { NextResponse } from "next/server";
-import { prisma } from "@/lib/db";
+import { instrumentRoute, prisma } from "@/lib/db";
 import { getSession } from "@/lib/session";
-import { getReqIp, getReqUA } from "@/lib/audit";
+import { auditedTransaction, getReqIp, getReqUA } from "@/lib/audit";
+import { invalidateStaffReport } from "@/lib/reports";
 
-export async function POST(req: Request) {
+export const POST = instrumentRoute("POST /api/claims/create", async (req: Request) => {
   try {
     const session = await getSession();
     if (!session) {
@@ -68,7 +69,7 @@ export async function POST(req: Request) {
       );
     }
 
-    const result = await prisma.$transaction(async (tx) => {
+    const result = await auditedTransaction(async (tx, audit) => {
       const created = await tx.claim.create({
         data: {
           found_id: foundId,
@@ -79,22 +80,20 @@ export async function POST(req: Request) {
         select: { claim_id: true, claim_status: true, date_claimed: true },
       });
 
-      await tx.auditLog.create({
-        data: {
-          actor_user_id: session.userId,
-          action: "CLAIM_SUBMITTED",
-          entity_type: "Claim",
-          entity_id: created.claim_id,
-          summary: `Submitted claim for found item #${foundId} (${found.item_name})`,
-          meta: {
-            claim_id: created.claim_id,
-            found_id: foundId,
-            claim_status: created.claim_status,
-            proof_len: claimDetails.length,
-          },
-          ip,
-          user_agent: ua,
+      audit({
+        actor_user_id: session.userId,
+        action: "CLAIM_SUBMITTED",
+        entity_type: "Claim",
+        entity_id: created.claim_id,
+        summary: `Submitted claim for found item #${foundId} (${found.item_name})`,
+        meta: {
+          claim_id: created.claim_id,
+          found_id: foundId,
+          claim_status: created.claim_status,
+          proof_len: claimDetails.length,
         },
+        ip,
+        user_agent: ua,
       });
 
       // Notify STAFF + ADMIN
@@ -129,9 +128,11 @@ export async function POST(req: Request) {
       return created;
     });
 
+    invalidateStaffReport();
+
     return NextResponse.json({ ok: true, claim: result }, { status: 201 });
   } catch (err) {
     console.error(err);
     return NextResponse.json({ ok: false, error: "Server error." }, { status: 500 });
   }
-}
+});
@@ -1,11 +1,12 @@
 import { NextResponse } from "next/server";
-import { prisma } from "@/lib/db";
+import { instrumentRoute, prisma } from "@/lib/db";
 import { getSession } from "@/lib/session";
-import { getReqIp, getReqUA } from "@/lib/audit";
+import { auditedTransaction, getReqIp, getReqUA } from "@/lib/audit";
+import { invalidateStaffReport } from "@/lib/reports";
 
 type Decision = "APPROVE" | "DENY";
 
-export async function POST(req: Request) {
+export const POST = instrumentRoute("POST /api/claims/decision", async (req: Request) => {
   try {
     const session = await getSession();
     if (!session) {
@@ -54,7 +55,7 @@ export async function POST(req: Request) {
 
     const itemName = claim.found_item?.item_name || "your item";
 
-    const result = await prisma.$transaction(async (tx) => {
+    const result = await auditedTransaction(async (tx, audit) => {
       if (decision === "DENY") {
         const updated = await tx.claim.update({
           where: { claim_id: claimId },
@@ -78,21 +79,19 @@ export async function POST(req: Request) {
         });
 
         // ✅ Audit log
-        await tx.auditLog.create({
-          data: {
-            actor_user_id: session.userId,
-            action: "CLAIM_DENIED",
-            entity_type: "Claim",
-            entity_id: claimId,
-            summary: `Denied claim for "${itemName}"`,
-            meta: {
-              claim_id: claimId,
-              found_id: claim.found_id,
-              claimant_id: claim.claimant_id,
-            },
-            ip,
-            user_agent: ua,
+        audit({
+          actor_user_id: session.userId,
+          action: "CLAIM_DENIED",
+          entity_type: "Claim",
+          entity_id: claimId,
+          summary: `Denied claim for "${itemName}"`,
+          meta: {
+            claim_id: claimId,
+            found_id: claim.found_id,
+            claimant_id: claim.claimant_id,
           },
+          ip,
+          user_agent: ua,
         });
 
         return { decision: "DENIED", updated };
@@ -140,29 +139,29 @@ export async function POST(req: Request) {
       });
 
       // ✅ Audit log
-      await tx.auditLog.create({
-        data: {
-          actor_user_id: session.userId,
-          action: "CLAIM_APPROVED",
-          entity_type: "Claim",
-          entity_id: claimId,
-          summary: `Approved claim for "${itemName}"`,
-          meta: {
-            claim_id: claimId,
-            found_id: claim.found_id,
-            claimant_id: claim.claimant_id,
-            auto_denied_count: deniedOthers.count,
-          },
-          ip,
-          user_agent: ua,
+      audit({
+        actor_user_id: session.userId,
+        action: "CLAIM_APPROVED",
+        entity_type: "Claim",
+        entity_id: claimId,
+        summary: `Approved claim for "${itemName}"`,
+        meta: {
+          claim_id: claimId,
+          found_id: claim.found_id,
+          claimant_id: claim.claimant_id,
+          auto_denied_count: deniedOthers.count,
         },
+        ip,
+        user_agent: ua,
       });
 
       return { decision: "APPROVED", updated: approved };
     });
 
+    invalidateStaffReport();
+
     return NextResponse.json({ ok: true, ...result }, { status: 200 });
   } catch {
     return NextResponse.json({ ok: false, error: "Server error." }, { status: 500 });
   }
-}
+});
@@ -1,8 +1,8 @@
 import { NextResponse } from "next/server";
-import { prisma } from "@/lib/db";
+import { instrumentRoute, prisma } from "@/lib/db";
 import { getSession } from "@/lib/session";
 
-export async function GET() {
+export const GET = instrumentRoute("GET /api/claims/mine", async () => {
   try {
     const session = await getSession();
     if (!session) {
@@ -35,4 +35,4 @@ export async function GET() {
   } catch {
     return NextResponse.json({ ok: false, error: "Server error." }, { status: 500 });
   }
-}
+});
@@ -0,0 +1,121 @@
+import { NextResponse } from "next/server";
+import { getSession } from "@/lib/session";
+import { getReqIp, getReqUA } from "@/lib/audit";
+import { invalidateStaffReport } from "@/lib/reports";
+import { instrumentRoute } from "@/lib/db";
+import { INTAKE_MAX_ROWS, csvRecords, intakeFoundItems, validateIntakeRows } from "@/lib/found-intake";
+
+const MAX_BODY_BYTES = 2 * 1024 * 1024;
+
+/**
+ * Read the body as UTF-8, counting bytes as they arrive. Returns null (and stops reading)
+ * as soon as maxBytes is exceeded, so a body without an honest content-length is never
+ * buffered past the limit.
+ */
+async function readTextCapped(req: Request, maxBytes: number): Promise<string | null> {
+  if (!req.body) return "";
+  const reader = req.body.getReader();
+  const decoder = new TextDecoder();
+  let size = 0;
+  let text = "";
+  for (;;) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    size += value.byteLength;
+    if (size > maxBytes) {
+      await reader.cancel().catch(() => {});
+      return null;
+    }
+    text += decoder.decode(value, { stream: true });
+  }
+  return text + decoder.decode();
+}
+
+// POST /api/found/bulk
+// Body: text/csv (header row + one item per line) or JSON { items: [...] }.
+// Columns/keys: itemName, description, category (id or name), location (id or name),
+//               storageLocation, dateFound (optional, default today), image (optional URL).
+// ?dryRun=1 validates only. Invalid rows are skipped and listed in `errors` (row numbers from 1).
+export const POST = instrumentRoute("POST /api/found/bulk", async (req: Request) => {
+  try {
+    const session = await getSession();
+    if (!session) {
+      return NextResponse.json({ ok: false, error: "Unauthorized" }, { status: 401 });
+    }
+
+    const role = String(session.role || "").toUpperCase();
+    if (role !== "STAFF" && role !== "ADMIN") {
+      return NextResponse.json({ ok: false, error: "Forbidden" }, { status: 403 });
+    }
+
+    const declared = Number(req.headers.get("content-length") || 0);
+    if (declared > MAX_BODY_BYTES) {
+      return NextResponse.json({ ok: false, error: "Upload is too large (max 2 MB)." }, { status: 413 });
+    }
+
+    const text = await readTextCapped(req, MAX_BODY_BYTES);
+    if (text === null) {
+      return NextResponse.json({ ok: false, error: "Upload is too large (max 2 MB)." }, { status: 413 });
+    }
+
+    const contentType = String(req.headers.get("content-type") || "").toLowerCase();
+    let raw: Array<Record<string, unknown>>;
+    if (contentType.includes("text/csv")) {
+      raw = csvRecords(text);
+    } else {
+      let body: any = null;
+      try {
+        body = JSON.parse(text);
+      } catch {
+        body = null;
+      }
+      if (!Array.isArray(body?.items)) {
+        return NextResponse.json({ ok: false, error: "Expected CSV or JSON { items: [...] }." }, { status: 400 });
+      }
+      raw = body.items;
+    }
+
+    if (raw.length === 0) {
+      return NextResponse.json({ ok: false, error: "No rows found." }, { status: 400 });
+    }
+    if (raw.length > INTAKE_MAX_ROWS) {
+      return NextResponse.json(
+        { ok: false, error: `Too many rows (max ${INTAKE_MAX_ROWS} per upload).` },
+        { status: 400 }
+      );
+    }
+
+    const { items, errors } = await validateIntakeRows(raw);
+
+    const url = new URL(req.url);
+    if (url.searchParams.get("dryRun") === "1") {
+      return NextResponse.json({ ok: true, dryRun: true, valid: items.length, errors }, { status: 200 });
+    }
+
+    if (items.length === 0) {
+      return NextResponse.json({ ok: false, error: "No valid rows.", errors }, { status: 400 });
+    }
+
+    const result = await intakeFoundItems(items, {
+      userId: session.userId,
+      ip: getReqIp(req),
+      ua: getReqUA(req),
+    });
+
+    if (result.created.length) invalidateStaffReport();
+
+    return NextResponse.json(
+      {
+        ok: true,
+        created: result.created,
+        errors: [...errors, ...result.errors].sort((a, b) => a.row - b.row),
+        matchesInserted: result.matchesInserted,
+        notificationsInserted: result.notificationsInserted,
+      },
+      { status: result.created.length ? 201 : 200 }
+    );
+  } catch (err) {
+    console.error(err);
+    return NextResponse.json({ ok: false, error: "Server error." }, { status: 500 });
+  }
+});
@@ -1,10 +1,12 @@
 import { NextResponse } from "next/server";
-import { prisma } from "@/lib/db";
 import { getSession } from "@/lib/session";
-import { scoreLostVsFound } from "@/lib/matching";
-import { getReqIp, getReqUA } from "@/lib/audit";
+import { matchTokens } from "@/lib/matching";
+import { foundIndexInput, rankLostForFound } from "@/lib/match-index";
+import { auditedTransaction, getReqIp, getReqUA } from "@/lib/audit";
+import { invalidateStaffReport } from "@/lib/reports";
+import { instrumentRoute } from "@/lib/db";
 
-export async function POST(req: Request) {
+export const POST = instrumentRoute("POST /api/found/create", async (req: Request) => {
   try {
     const session = await getSession();
     if (!session) {
@@ -47,7 +49,7 @@ export async function POST(req: Request) {
     const ip = getReqIp(req);
     const ua = getReqUA(req);
 
-    const created = await prisma.$transaction(async (tx) => {
+    const created = await auditedTransaction(async (tx, audit) => {
       let matchesInserted = 0;
       let notificationsInserted = 0;
 
@@ -63,6 +65,7 @@ export async function POST(req: Request) {
           storage_location: storageLocation,
           image: image && image.length ? image : null,
           status: "NEWLY_FOUND",
+          match_tokens: matchTokens(itemName, description),
         },
         select: {
           found_id: true,
@@ -72,58 +75,22 @@ export async function POST(req: Request) {
           image: true,
           category_id: true,
           location_id: true,
+          match_tokens: true,
         },
       });
 
-      // 2) Find candidate LOST reports (active only) in same category OR location
-      const lostCandidates = await tx.lostItem.findMany({
-        where: {
-          status: "REPORTED_LOST",
-          OR: [{ category_id: categoryId }, { location_id: locationId }],
-        },
-        take: 80,
-        select: {
-          lost_id: true,
-          user_id: true,
-          item_name: true,
-          description: true,
-          category_id: true,
-          location_id: true,
-          date_lost: true,
-        },
-      });
-
-      // 3) Score candidates
-      const foundInput = {
-        item_name: found.item_name,
-        description: found.description,
-        category_id: found.category_id,
-        location_id: found.location_id,
-        date: new Date(found.date_found),
-      };
-
-      const scoredAll = lostCandidates.map((l) => {
-        const lostInput = {
-          item_name: l.item_name,
-          description: l.description,
-          category_id: l.category_id,
-          location_id: l.location_id,
-          date: new Date(l.date_lost),
-        };
-        const { score, reasons } = scoreLostVsFound(lostInput, foundInput);
-        return { l, score, reasons };
-      });
-
+      // 2) Score every active LOST report against the new item in one batch pass (top 30, >= 20)
       // A) Persist suggested matches (write to `matches`)
-      const scoredForMatches = scoredAll
-        .filter((x) => x.score >= 20)
-        .sort((a, b) => b.score - a.score)
-        .slice(0, 30);
+      const scoredForMatches = await rankLostForFound(tx, foundIndexInput(found), {
+        where: { status: "REPORTED_LOST" },
+        k: 30,
+        minScore: 20,
+      });
 
       if (scoredForMatches.length) {
         const mres = await tx.match.createMany({
           data: scoredForMatches.map((s) => ({
-            lost_id: s.l.lost_id,
+            lost_id: s.id,
             found_id: found.found_id,
             match_score: s.score.toFixed(2),
           })),
@@ -133,19 +100,23 @@ export async function POST(req: Request) {
       }
 
       // B) Notifications only for strong matches
-      const scoredForNotifs = scoredAll
-        .filter((x) => x.score >= 40)
-        .sort((a, b) => b.score - a.score)
-        .slice(0, 10);
+      const scoredForNotifs = scoredForMatches.filter((x) => x.score >= 40).slice(0, 10);
 
       if (scoredForNotifs.length) {
+        const owners = await tx.lostItem.findMany({
+          where: { lost_id: { in: scoredForNotifs.map((s) => s.id) } },
+          select: { lost_id: true, user_id: true },
+        });
+        const ownerOf = new Map(owners.map((o) => [o.lost_id, o.user_id] as const));
+
         // avoid spamming: 1 notif per user (best match only)
         const bestPerUser = new Map<number, { lost_id: number; score: number; reasons: string[] }>();
         for (const s of scoredForNotifs) {
-          const uid = s.l.user_id;
+          const uid = ownerOf.get(s.id);
+          if (uid === undefined) continue;
           const existing = bestPerUser.get(uid);
           if (!existing || s.score > existing.score) {
-            bestPerUser.set(uid, { lost_id: s.l.lost_id, score: s.score, reasons: s.reasons });
+            bestPerUser.set(uid, { lost_id: s.id, score: s.score, reasons: s.reasons });
           }
         }
 
@@ -165,34 +136,34 @@ export async function POST(req: Request) {
       }
 
       // ✅ Audit log
-      await tx.auditLog.create({
-        data: {
-          actor_user_id: session.userId,
-          action: "FOUND_ITEM_CREATED",
-          entity_type: "FoundItem",
-          entity_id: found.found_id,
-          summary: `Created found item: "${found.item_name}"`,
-          meta: {
-            found_id: found.found_id,
-            category_id: categoryId,
-            location_id: locationId,
-            status: "NEWLY_FOUND",
-            date_found: dateFound.toISOString(),
-            storage_location: storageLocation,
-            has_image: Boolean(found.image),
-            matches_inserted: matchesInserted,
-            notifications_inserted: notificationsInserted,
-          },
-          ip,
-          user_agent: ua,
+      audit({
+        actor_user_id: session.userId,
+        action: "FOUND_ITEM_CREATED",
+        entity_type: "FoundItem",
+        entity_id: found.found_id,
+        summary: `Created found item: "${found.item_name}"`,
+        meta: {
+          found_id: found.found_id,
+          category_id: categoryId,
+          location_id: locationId,
+          status: "NEWLY_FOUND",
+          date_found: dateFound.toISOString(),
+          storage_location: storageLocation,
+          has_image: Boolean(found.image),
+          matches_inserted: matchesInserted,
+          notifications_inserted: notificationsInserted,
         },
+        ip,
+        user_agent: ua,
       });
 
       return found;
     });
 
+    invalidateStaffReport();
+
     return NextResponse.json({ ok: true, found: created }, { status: 201 });
   } catch {
     return NextResponse.json({ ok: false, error: "Server error." }, { status: 500 });
   }
-}
+});
@@ -1,7 +1,8 @@
 import { NextResponse } from "next/server";
-import { prisma } from "@/lib/db";
+import { instrumentRoute, prisma } from "@/lib/db";
 import { getSession } from "@/lib/session";
-import { getReqIp, getReqUA } from "@/lib/audit";
+import { auditedTransaction, getReqIp, getReqUA } from "@/lib/audit";
+import { invalidateStaffReport } from "@/lib/reports";
 
 type Mode = "RETURN" | "DELETE";
 
@@ -10,7 +11,7 @@ function getActorUserId(session: any): number | null {
   return Number.isFinite(id) ? id : null;
 }
 
-export async function POST(req: Request) {
+export const POST = instrumentRoute("POST /api/found/delete", async (req: Request) => {
   try {
     const session = await getSession();
     if (!session) {
@@ -54,7 +55,7 @@ export async function POST(req: Request) {
     const itemName = found.item_name || "item";
     const prevStatus = String(found.status || "").toUpperCase();
 
-    const result = await prisma.$transaction(async (tx) => {
+    const result = await auditedTransaction(async (tx, audit) => {
       if (mode === "RETURN") {
         if (prevStatus === "RETURNED") {
           return { blocked: true, reason: "This item has already been returned and is no longer available." };
@@ -102,36 +103,32 @@ export async function POST(req: Request) {
           });
 
           // Audit each denied claim (optional but nice for traceability)
-          await tx.auditLog.createMany({
-            data: pending.map((p) => ({
-              actor_user_id: actorUserId,
-              action: "CLAIM_DENIED",
-              entity_type: "Claim",
-              entity_id: p.claim_id,
-              summary: `Auto-denied claim (item returned) for "${itemName}"`,
-              meta: { claim_id: p.claim_id, found_id: foundId, reason: "ITEM_RETURNED" },
-              ip,
-              user_agent: ua,
-            })),
-          });
-        }
-
-        await tx.auditLog.create({
-          data: {
+          audit(pending.map((p) => ({
             actor_user_id: actorUserId,
-            action: "FOUND_ITEM_RETURNED",
-            entity_type: "FoundItem",
-            entity_id: foundId,
-            summary: `Marked found item as RETURNED: "${itemName}"`,
-            meta: {
-              found_id: foundId,
-              prev_status: prevStatus,
-              matches_deleted: matchesDeleted.count,
-              pending_claims_denied: deniedPendingCount,
-            },
+            action: "CLAIM_DENIED",
+            entity_type: "Claim",
+            entity_id: p.claim_id,
+            summary: `Auto-denied claim (item returned) for "${itemName}"`,
+            meta: { claim_id: p.claim_id, found_id: foundId, reason: "ITEM_RETURNED" },
             ip,
             user_agent: ua,
+          }));
+        }
+
+        audit({
+          actor_user_id: actorUserId,
+          action: "FOUND_ITEM_RETURNED",
+          entity_type: "FoundItem",
+          entity_id: foundId,
+          summary: `Marked found item as RETURNED: "${itemName}"`,
+          meta: {
+            found_id: foundId,
+            prev_status: prevStatus,
+            matches_deleted: matchesDeleted.count,
+            pending_claims_denied: deniedPendingCount,
           },
+          ip,
+          user_agent: ua,
         });
 
         return {
@@ -155,17 +152,15 @@ export async function POST(req: Request) {
       await tx.match.deleteMany({ where: { found_id: foundId } });
       await tx.foundItem.delete({ where: { found_id: foundId } });
 
-      await tx.auditLog.create({
-        data: {
-          actor_user_id: actorUserId,
-          action: "FOUND_ITEM_DELETED",
-          entity_type: "FoundItem",
-          entity_id: foundId,
-          summary: `Deleted found item: "${itemName}"`,
-          meta: { found_id: foundId, prev_status: prevStatus },
-          ip,
-          user_agent: ua,
-        },
+      audit({
+        actor_user_id: actorUserId,
+        action: "FOUND_ITEM_DELETED",
+        entity_type: "FoundItem",
+        entity_id: foundId,
+        summary: `Deleted found item: "${itemName}"`,
+        meta: { found_id: foundId, prev_status: prevStatus },
+        ip,
+        user_agent: ua,
       });
 
       return { mode, deleted: true };
@@ -178,8 +173,10 @@ export async function POST(req: Request) {
       );
     }
 
+    invalidateStaffReport();
+
     return NextResponse.json({ ok: true, ...result }, { status: 200 });
   } catch {
     return NextResponse.json({ ok: false, error: "Server error." }, { status: 500 });
   }
-}
+});
@@ -0,0 +1,105 @@
+import { NextResponse } from "next/server";
+import { instrumentRoute, prismaRead } from "@/lib/db";
+import { getSession } from "@/lib/session";
+import { Prisma } from "@/generated/prisma/client";
+import { foundSearchMatch } from "@/lib/search";
+import { foundItemFilters } from "@/lib/list-filters";
+import { getReferenceData } from "@/lib/reference-data";
+import { exportResponse, keysetChunks, parseExportFormat, type ExportColumn } from "@/lib/export";
+
+type Row = Awaited<ReturnType<typeof findItems>>[number];
+
+function findItems(where: any, take?: number) {
+  return prismaRead.foundItem.findMany({
+    where,
+    orderBy: { found_id: "asc" },
+    take,
+    select: {
+      found_id: true,
+      item_name: true,
+      description: true,
+      category_id: true,
+      location_id: true,
+      storage_location: true,
+      date_found: true,
+      date_created: true,
+      status: true,
+      image: true,
+      user_id: true,
+    },
+  });
+}
+
+const day = (d: Date) => d.toISOString().slice(0, 10);
+
+// GET /api/found/export?format=csv|ndjson + the /api/found/list filters (staff/admin inventory export)
+export const GET = instrumentRoute("GET /api/found/export", async (req: Request) => {
+  try {
+    const session = await getSession();
+    if (!session) {
+      return NextResponse.json({ ok: false, error: "Unauthorized" }, { status: 401 });
+    }
+
+    const role = String(session.role || "").toUpperCase();
+    if (role !== "STAFF" && role !== "ADMIN") {
+      return NextResponse.json({ ok: false, error: "Forbidden" }, { status: 403 });
+    }
+
+    const url = new URL(req.url);
+    const format = parseExportFormat(url.searchParams.get("format"));
+    if (!format) {
+      return NextResponse.json({ ok: false, error: "Invalid format. Allowed: csv, ndjson" }, { status: 400 });
+    }
+
+    const filters = foundItemFilters(url.searchParams, true);
+    if (!filters.ok) {
+      return NextResponse.json({ ok: false, error: filters.error }, { status: 400 });
+    }
+
+    const { where, sqlConds, tsq, empty } = filters;
+    const { categoryNames, locationNames } = await getReferenceData();
+
+    const columns: ExportColumn<Row>[] = [
+      { header: "found_id", value: (r) => r.found_id },
+      { header: "item_name", value: (r) => r.item_name },
+      { header: "status", value: (r) => r.status },
+      { header: "category", value: (r) => categoryNames.get(r.category_id) },
+      { header: "location", value: (r) => locationNames.get(r.location_id) },
+      { header: "storage_location", value: (r) => r.storage_location },
+      { header: "date_found", value: (r) => day(r.date_found) },
+      { header: "date_created", value: (r) => day(r.date_created) },
+      { header: "reported_by_user_id", value: (r) => r.user_id },
+      { header: "image", value: (r) => r.image },
+      { header: "description", value: (r) => r.description },
+    ];
+
+    const fetchChunk = async (afterId: number | null, take: number): Promise<Row[]> => {
+      if (empty) return [];
+      const after = afterId ?? 0;
+
+      if (!tsq) {
+        return findItems({ AND: [where, { found_id: { gt: after } }] }, take);
+      }
+
+      // Keyword: ids from the search_vector GIN index, then hydrate the chunk
+      const filter = Prisma.join([foundSearchMatch(tsq), ...sqlConds], " AND ");
+      const hits = await prismaRead.$queryRaw<Array<{ found_id: number }>>`
+        SELECT f.found_id FROM found_items f
+        WHERE ${filter} AND f.found_id > ${after}
+        ORDER BY f.found_id
+        LIMIT ${take}
+      `;
+      if (!hits.length) return [];
+      return findItems({ found_id: { in: hits.map((h) => h.found_id) } });
+    };
+
+    return exportResponse({
+      filename: "found-items",
+      format,
+      columns,
+      chunks: keysetChunks(fetchChunk, (r) => r.found_id),
+    });
+  } catch {
+    return NextResponse.json({ ok: false, error: "Server error." }, { status: 500 });
+  }
+});
@@ -1,7 +1,7 @@
 import { NextResponse } from "next/server";
-import { prisma } from "@/lib/db";
+import { instrumentRoute, prisma } from "@/lib/db";
 
-export async function GET(req: Request) {
+export const GET = instrumentRoute("GET /api/found/get", async (req: Request) => {
   try {
     const url = new URL(req.url);
     const foundIdRaw = url.searchParams.get("foundId");
@@ -34,4 +34,4 @@ export async function GET(req: Request) {
   } catch {
     return NextResponse.json({ ok: false, error: "Server error." }, { status: 500 });
   }
-}
+});
@@ -1,39 +1,32 @@
 import { NextResponse } from "next/server";
-import { prisma } from "@/lib/db";
+import { instrumentRoute, prismaRead } from "@/lib/db";
 import { getSession } from "@/lib/session";
-
-type SortBy = "date_created" | "date_found";
+import { Prisma } from "@/generated/prisma/client";
+import { foundSearchMatch, foundSearchRank } from "@/lib/search";
+import { foundItemFilters } from "@/lib/list-filters";
+import { cursorDate, decodeCursor, encodeCursor, parseTotalMode, resolveTotal } from "@/lib/pagination";
+
+// Public (non-staff) results depend only on the URL, so browsers/CDNs may reuse them briefly and
+// revalidate in the background. Vary: Cookie keeps a signed-in staff view out of shared entries.
+const PUBLIC_CACHE = {
+  "cache-control": "public, max-age=15, s-maxage=30, stale-while-revalidate=60",
+  vary: "Cookie",
+};
+const PRIVATE_CACHE = { "cache-control": "private, no-store" };
+
+type SortBy = "date_created" | "date_found" | "relevance";
 type SortDir = "asc" | "desc";
 
-const ALLOWED_STATUSES = ["NEWLY_FOUND", "CLAIMED", "RETURNED"] as const;
-type AllowedStatus = (typeof ALLOWED_STATUSES)[number];
-
-function isAllowedStatus(s: string): s is AllowedStatus {
-  return (ALLOWED_STATUSES as readonly string[]).includes(s);
-}
-
-export async function GET(req: Request) {
+export const GET = instrumentRoute("GET /api/found/list", async (req: Request) => {
   try {
     const url = new URL(req.url);
 
-    const q = (url.searchParams.get("q") || "").trim();
-    const categoryIdRaw = url.searchParams.get("categoryId");
-    const locationIdRaw = url.searchParams.get("locationId");
-    const statusRaw = (url.searchParams.get("status") || "").trim().toUpperCase();
-    const includeClaimedRaw = (url.searchParams.get("includeClaimed") || "").trim().toLowerCase();
-
-    const dateFromRaw = (url.searchParams.get("dateFrom") || "").trim();
-    const dateToRaw = (url.searchParams.get("dateTo") || "").trim();
-
     const sortByRaw = (url.searchParams.get("sortBy") || "date_created").trim() as SortBy;
     const sortDirRaw = (url.searchParams.get("sortDir") || "desc").trim() as SortDir;
 
     const pageRaw = url.searchParams.get("page") || "1";
     const pageSizeRaw = url.searchParams.get("pageSize") || "12";
 
-    const categoryId = categoryIdRaw ? Number(categoryIdRaw) : null;
-    const locationId = locationIdRaw ? Number(locationIdRaw) : null;
-
     let page = Number(pageRaw);
     let pageSize = Number(pageSizeRaw);
 
@@ -44,115 +37,189 @@ export async function GET(req: Request) {
     const session = await getSession();
     const role = String(session?.role || "").toUpperCase();
     const isPrivileged = role === "STAFF" || role === "ADMIN";
-    const includeClaimed = includeClaimedRaw === "1" || includeClaimedRaw === "true" || includeClaimedRaw === "yes";
-
-    const where: any = {};
-
-    if (categoryId && Number.isFinite(categoryId)) where.category_id = categoryId;
-    if (locationId && Number.isFinite(locationId)) where.location_id = locationId;
-
-    // Status rules:
-    // - If status is explicitly RETURNED and user is NOT privileged: return 200 with empty results (no 403).
-    // - If no explicit status filter:
-    //     - Public: hide RETURNED and CLAIMED by default (unless includeClaimed=1)
-    //     - Staff/Admin: show everything
-    if (statusRaw && statusRaw !== "ALL") {
-      if (!isAllowedStatus(statusRaw)) {
-        return NextResponse.json(
-          { ok: false, error: `Invalid status. Allowed: ALL, ${ALLOWED_STATUSES.join(", ")}` },
-          { status: 400 }
-        );
-      }
-
-      if (statusRaw === "RETURNED" && !isPrivileged) {
-        return NextResponse.json(
-          { ok: true, items: [], page, pageSize, total: 0, totalPages: 1 },
-          { status: 200 }
-        );
-      }
+    const cacheHeaders = isPrivileged ? PRIVATE_CACHE : PUBLIC_CACHE;
 
-      where.status = statusRaw;
-    } else {
-      if (!isPrivileged) {
-        if (includeClaimed) {
-          where.status = { not: "RETURNED" };
-        } else {
-          where.status = { notIn: ["RETURNED", "CLAIMED"] };
-        }
-      }
+    // Same filters (and status rules) as /api/found/export
+    const filters = foundItemFilters(url.searchParams, isPrivileged);
+    if (!filters.ok) {
+      return NextResponse.json({ ok: false, error: filters.error }, { status: 400 });
     }
+    if (filters.empty) {
+      return NextResponse.json(
+        { ok: true, items: [], page, pageSize, total: 0, totalPages: 1 },
+        { status: 200, headers: cacheHeaders }
+      );
+    }
+
+    // sqlConds: the same filters as raw SQL, for the full-text search path (see below)
+    const { where, sqlConds, tsq } = filters;
+
+    // relevance only makes sense with a keyword; otherwise fall back to newest added
+    const sortBy: SortBy =
+      sortByRaw === "date_found" ? "date_found" : sortByRaw === "relevance" && tsq ? "relevance" : "date_created";
+    const sortDir: SortDir = sortDirRaw === "asc" ? "asc" : "desc";
+
+    const skip = (page - 1) * pageSize;
 
-    if (q) {
-      where.OR = [
-        { item_name: { contains: q, mode: "insensitive" as const } },
-        { description: { contains: q, mode: "insensitive" as const } },
-        { storage_location: { contains: q, mode: "insensitive" as const } },
-      ];
+    // Keyset mode: ?mode=cursor for the first page, then ?cursor=<nextCursor>.
+    // Page-number callers keep skip/take + an exact total unless they ask otherwise (?total=).
+    const cursorRaw = url.searchParams.get("cursor");
+    const cursorMode = url.searchParams.get("mode") === "cursor" || Boolean(cursorRaw);
+    const totalMode = parseTotalMode(url.searchParams.get("total"), cursorMode ? "none" : "exact");
+
+    const cursor = cursorMode ? decodeCursor(cursorRaw, 2) : null;
+    const cursorId = cursor ? Number(cursor[1]) : null;
+    const cursorKey =
+      cursor && sortBy === "relevance" ? Number(cursor[0]) : cursor ? cursorDate(cursor[0]) : null;
+    if (cursorRaw && (!cursor || !Number.isFinite(cursorId) || cursorKey === null || Number.isNaN(cursorKey))) {
+      return NextResponse.json({ ok: false, error: "Invalid cursor." }, { status: 400 });
     }
 
-    if (dateFromRaw || dateToRaw) {
-      const dateFoundFilter: any = {};
-
-      if (dateFromRaw) {
-        const d = new Date(dateFromRaw);
-        if (Number.isNaN(d.getTime())) {
-          return NextResponse.json(
-            { ok: false, error: "Invalid dateFrom. Use YYYY-MM-DD or ISO date." },
-            { status: 400 }
-          );
-        }
-        dateFoundFilter.gte = d;
+    let items: Awaited<ReturnType<typeof findItems>>;
+    let totalInfo: { total: number | null; totalIsEstimate: boolean };
+    let nextCursor: string | null = null;
+
+    if (tsq) {
+      // Full-text path: GIN index on search_vector; ids in one pass, then hydrate the page.
+      sqlConds.unshift(foundSearchMatch(tsq));
+      const filter = Prisma.join(sqlConds, " AND ");
+
+      const desc = sortBy === "relevance" || sortDir === "desc";
+      const keyExpr =
+        sortBy === "relevance"
+          ? Prisma.sql`${foundSearchRank(tsq)}::float8`
+          : sortBy === "date_found"
+            ? Prisma.sql`f.date_found`
+            : Prisma.sql`f.date_created`;
+      const dir = desc ? Prisma.sql`DESC` : Prisma.sql`ASC`;
+
+      const keyset =
+        cursorKey === null
+          ? Prisma.sql`TRUE`
+          : Prisma.sql`(${keyExpr}, f.found_id) ${desc ? Prisma.sql`<` : Prisma.sql`>`} (${
+              cursorKey instanceof Date
+                ? Prisma.sql`${cursorKey.toISOString().slice(0, 10)}::date`
+                : Prisma.sql`${cursorKey}::float8`
+            }, ${cursorId})`;
+
+      // Exact total for page callers comes for free from a window count over the same scan
+      const withWindow = !cursorMode && totalMode === "exact";
+
+      const hits = await prismaRead.$queryRaw<Array<{ found_id: number; sort_key: Date | number; total: number | null }>>`
+        SELECT f.found_id, ${keyExpr} AS sort_key,
+               ${withWindow ? Prisma.sql`(count(*) OVER())::int` : Prisma.sql`NULL::int`} AS total
+        FROM found_items f
+        WHERE ${filter} AND ${keyset}
+        ORDER BY ${keyExpr} ${dir}, f.found_id ${dir}
+        OFFSET ${cursorMode ? 0 : skip}
+        LIMIT ${cursorMode ? pageSize + 1 : pageSize}
+      `;
+
+      const pageHits = hits.slice(0, pageSize);
+      if (cursorMode && hits.length > pageSize) {
+        const last = pageHits[pageHits.length - 1];
+        nextCursor = encodeCursor([
+          last.sort_key instanceof Date ? last.sort_key.toISOString() : last.sort_key,
+          last.found_id,
+        ]);
       }
 
-      if (dateToRaw) {
-        const d = new Date(dateToRaw);
-        if (Number.isNaN(d.getTime())) {
-          return NextResponse.json(
-            { ok: false, error: "Invalid dateTo. Use YYYY-MM-DD or ISO date." },
-            { status: 400 }
-          );
-        }
-        dateFoundFilter.lte = d;
+      const countSql = (take?: number) =>
+        prismaRead.$queryRaw<Array<{ n: number }>>`
+          SELECT count(*)::int AS n FROM (
+            SELECT 1 FROM found_items f WHERE ${filter}
+            ${take ? Prisma.sql`LIMIT ${take}` : Prisma.empty}
+          ) s
+        `.then((r) => r[0].n);
+
+      totalInfo =
+        withWindow && pageHits.length
+          ? { total: pageHits[0].total ?? 0, totalIsEstimate: false }
+          : await resolveTotal(totalMode, { exact: () => countSql(), capped: (take) => countSql(take) });
+
+      const ids = pageHits.map((h) => h.found_id);
+      const rows = await findItems({ found_id: { in: ids } });
+      const byId = new Map(rows.map((r) => [r.found_id, r] as const));
+      items = ids.flatMap((id) => {
+        const r = byId.get(id);
+        return r ? [r] : [];
+      });
+    } else {
+      const dateKey = sortBy === "date_found" ? "date_found" : "date_created";
+      const orderBy = [{ [dateKey]: sortDir }, { found_id: sortDir }];
+      const op = sortDir === "asc" ? "gt" : "lt";
+
+      const pageWhere =
+        cursorKey instanceof Date
+          ? {
+              AND: [
+                where,
+                {
+                  OR: [
+                    { [dateKey]: { [op]: cursorKey } },
+                    { [dateKey]: cursorKey, found_id: { [op]: cursorId } },
+                  ],
+                },
+              ],
+            }
+          : where;
+
+      const [rows, t] = await Promise.all([
+        findItems(pageWhere, cursorMode ? { orderBy, take: pageSize + 1 } : { orderBy, skip, take: pageSize }),
+        resolveTotal(totalMode, {
+          exact: () => prismaRead.foundItem.count({ where }),
+          capped: (take) => prismaRead.foundItem.count({ where, take }),
+          table: Object.keys(where).length ? undefined : "found_items",
+        }),
+      ]);
+
+      items = rows.slice(0, pageSize);
+      totalInfo = t;
+      if (cursorMode && rows.length > pageSize) {
+        const last = items[items.length - 1];
+        nextCursor = encodeCursor([last[dateKey].toISOString(), last.found_id]);
       }
-
-      where.date_found = dateFoundFilter;
     }
 
-    const sortBy: SortBy = sortByRaw === "date_found" ? "date_found" : "date_created";
-    const sortDir: SortDir = sortDirRaw === "asc" ? "asc" : "desc";
+    const { total, totalIsEstimate } = totalInfo;
 
-    const skip = (page - 1) * pageSize;
+    if (cursorMode) {
+      return NextResponse.json(
+        { ok: true, items, pageSize, nextCursor, total, totalIsEstimate },
+        { status: 200, headers: cacheHeaders }
+      );
+    }
 
-    const [total, items] = await Promise.all([
-      prisma.foundItem.count({ where }),
-      prisma.foundItem.findMany({
-        where,
-        orderBy: { [sortBy]: sortDir },
-        skip,
-        take: pageSize,
-        select: {
-          found_id: true,
-          item_name: true,
-          description: true,
-          date_found: true,
-          storage_location: true,
-          image: true,
-          status: true,
-          date_created: true,
-          category: { select: { category_name: true } },
-          location: { select: { location_name: true } },
-        },
-      }),
-    ]);
-
-    const totalPages = Math.max(1, Math.ceil(total / pageSize));
+    const totalPages = total === null ? null : Math.max(1, Math.ceil(total / pageSize));
 
     return NextResponse.json(
-      { ok: true, items, page, pageSize, total, totalPages },
-      { status: 200 }
+      { ok: true, items, page, pageSize, total, totalPages, totalIsEstimate },
+      { status: 200, headers: cacheHeaders }
     );
   } catch (err) {
     console.error(err);
     return NextResponse.json({ ok: false, error: "Server error." }, { status: 500 });
   }
+});
+
+function findItems(
+  where: any,
+  page?: { orderBy: Array<Record<string, "asc" | "desc">>; skip?: number; take: number }
+) {
+  return prismaRead.foundItem.findMany({
+    where,
+    ...page,
+    select: {
+      found_id: true,
+      item_name: true,
+      description: true,
+      date_found: true,
+      storage_location: true,
+      image: true,
+      status: true,
+      date_created: true,
+      category: { select: { category_name: true } },
+      location: { select: { location_name: true } },
+    },
+  });
 }
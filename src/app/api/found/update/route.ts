@@ -1,7 +1,10 @@
 import { NextResponse } from "next/server";
-import { prisma } from "@/lib/db";
+import { instrumentRoute, prisma } from "@/lib/db";
 import { getSession } from "@/lib/session";
-import { getReqIp, getReqUA } from "@/lib/audit";
+import { auditedTransaction, getReqIp, getReqUA } from "@/lib/audit";
+import { matchTokens } from "@/lib/matching";
+import { invalidateStaffReport } from "@/lib/reports";
+import { localVariantUrls } from "@/lib/image-variants";
 import { promises as fs } from "fs";
 import path from "path";
 
@@ -35,19 +38,34 @@ function isLocalFoundUpload(u: string | null | undefined): u is string {
   return typeof u === "string" && u.startsWith("/uploads/found/");
 }
 
-async function safeUnlinkPublicUpload(urlPath: string) {
+// Uploads are content-addressed: a same-bytes upload reuses the file (and re-stamps its mtime)
+// before its own row is saved, so a file touched this recently may be about to gain a reference.
+// Skipped files are removed later by prisma/sweep-uploads.ts.
+const UPLOAD_DELETE_GRACE_MS = 15 * 60 * 1000;
+
+function publicUploadPath(urlPath: string) {
   // urlPath like "/uploads/found/<file>.jpg"
   const rel = urlPath.replace(/^\/+/, ""); // "uploads/found/<file>.jpg"
   const full = path.resolve(process.cwd(), "public", rel);
   const base = path.resolve(process.cwd(), "public", "uploads", "found");
 
   // Must stay inside /public/uploads/found
-  if (!(full === base || full.startsWith(base + path.sep))) return;
+  return full !== base && full.startsWith(base + path.sep) ? full : null;
+}
+
+async function uploadIsSettled(urlPath: string) {
+  const full = publicUploadPath(urlPath);
+  if (!full) return false;
+  const st = await fs.stat(full).catch(() => null);
+  return Boolean(st && Date.now() - st.mtimeMs > UPLOAD_DELETE_GRACE_MS);
+}
 
-  await fs.unlink(full).catch(() => {});
+async function safeUnlinkPublicUpload(urlPath: string) {
+  const full = publicUploadPath(urlPath);
+  if (full) await fs.unlink(full).catch(() => {});
 }
 
-export async function POST(req: Request) {
+export const POST = instrumentRoute("POST /api/found/update", async (req: Request) => {
   try {
     const session = await getSession();
     if (!session) {
@@ -184,7 +202,15 @@ export async function POST(req: Request) {
     const patchMeta = normalizePatchForMeta(data);
     const beforeMeta = pickBeforeForMeta(before as any, keys);
 
-    const updated = await prisma.$transaction(async (tx) => {
+    // Keep the match token index in sync with the text it was built from
+    if ("item_name" in data || "description" in data) {
+      data.match_tokens = matchTokens(
+        data.item_name ?? before.item_name,
+        data.description ?? before.description
+      );
+    }
+
+    const updated = await auditedTransaction(async (tx, audit) => {
       const updated = await tx.foundItem.update({
         where: { found_id: foundId },
         data,
@@ -202,22 +228,20 @@ export async function POST(req: Request) {
         },
       });
 
-      await tx.auditLog.create({
-        data: {
-          actor_user_id: session.userId,
-          action: "FOUND_ITEM_UPDATED",
-          entity_type: "FoundItem",
-          entity_id: foundId,
-          summary: `Updated found item "${before.item_name}"`,
-          meta: {
-            found_id: foundId,
-            fields: keys,
-            before: beforeMeta,
-            after: patchMeta,
-          },
-          ip,
-          user_agent: ua,
+      audit({
+        actor_user_id: session.userId,
+        action: "FOUND_ITEM_UPDATED",
+        entity_type: "FoundItem",
+        entity_id: foundId,
+        summary: `Updated found item "${before.item_name}"`,
+        meta: {
+          found_id: foundId,
+          fields: keys,
+          before: beforeMeta,
+          after: patchMeta,
         },
+        ip,
+        user_agent: ua,
       });
 
       return updated;
@@ -228,11 +252,17 @@ export async function POST(req: Request) {
       const oldImg = before.image;
       const newImg = updated.image;
 
-      if (isLocalFoundUpload(oldImg) && oldImg !== newImg) {
-        await safeUnlinkPublicUpload(oldImg);
+      // Another item may point at the same file, or an in-flight upload may be about to
+      if (isLocalFoundUpload(oldImg) && oldImg !== newImg && (await uploadIsSettled(oldImg))) {
+        const stillUsed = await prisma.foundItem.count({ where: { image: oldImg } });
+        if (stillUsed === 0) {
+          for (const u of [oldImg, ...localVariantUrls(oldImg)]) await safeUnlinkPublicUpload(u);
+        }
       }
     }
 
+    invalidateStaffReport();
+
     return NextResponse.json({ ok: true, updated }, { status: 200 });
   } catch (err) {
     const msg = String((err as any)?.message || "");
@@ -242,4 +272,4 @@ export async function POST(req: Request) {
     console.error(err);
     return NextResponse.json({ ok: false, error: "Server error." }, { status: 500 });
   }
-}
+});
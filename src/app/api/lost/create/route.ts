@@ -1,10 +1,12 @@
 import { NextResponse } from "next/server";
-import { prisma } from "@/lib/db";
 import { requireSession } from "@/lib/rbac";
-import { scoreLostVsFound } from "@/lib/matching";
-import { getReqIp, getReqUA } from "@/lib/audit";
+import { matchTokens } from "@/lib/matching";
+import { lostIndexInput, rankFoundForLost } from "@/lib/match-index";
+import { auditedTransaction, getReqIp, getReqUA } from "@/lib/audit";
+import { invalidateStaffReport } from "@/lib/reports";
+import { instrumentRoute } from "@/lib/db";
 
-export async function POST(req: Request) {
+export const POST = instrumentRoute("POST /api/lost/create", async (req: Request) => {
   try {
     const session = await requireSession();
     const body = await req.json();
@@ -29,7 +31,7 @@ export async function POST(req: Request) {
     const ip = getReqIp(req);
     const ua = getReqUA(req);
 
-    const created = await prisma.$transaction(async (tx) => {
+    const created = await auditedTransaction(async (tx, audit) => {
       // 1) Create the lost report
       const lost = await tx.lostItem.create({
         data: {
@@ -41,6 +43,7 @@ export async function POST(req: Request) {
           date_lost: new Date(`${dateLost}T00:00:00.000Z`),
           last_seen_location: lastSeenLocation,
           image,
+          match_tokens: matchTokens(itemName, description),
         },
         select: {
           lost_id: true,
@@ -49,72 +52,41 @@ export async function POST(req: Request) {
           date_created: true,
 
           // needed for scoring
-          description: true,
           category_id: true,
           location_id: true,
           date_lost: true,
+          match_tokens: true,
         },
       });
 
-      // 2) Find candidate FOUND items to match against (still available)
-      const candidates = await tx.foundItem.findMany({
-        where: {
-          status: "NEWLY_FOUND",
-          OR: [{ category_id: lost.category_id }, { location_id: lost.location_id }],
-        },
-        take: 100,
-        select: {
-          found_id: true,
-          item_name: true,
-          description: true,
-          category_id: true,
-          location_id: true,
-          date_found: true,
-        },
-      });
-
-      // 3) Score candidates
-      const lostInput = {
-        item_name: lost.item_name,
-        description: lost.description,
-        category_id: lost.category_id,
-        location_id: lost.location_id,
-        date: new Date(lost.date_lost),
-      };
-
-      const scoredAll = candidates.map((f) => {
-        const foundInput = {
-          item_name: f.item_name,
-          description: f.description,
-          category_id: f.category_id,
-          location_id: f.location_id,
-          date: new Date(f.date_found),
-        };
-        const { score, reasons } = scoreLostVsFound(lostInput, foundInput);
-        return { found_id: f.found_id, item_name: f.item_name, score, reasons };
+      // 2) Score every FOUND item still available in one batch pass (top 30, >= 20)
+      const toStore = await rankFoundForLost(tx, lostIndexInput(lost), {
+        where: { status: "NEWLY_FOUND" },
+        k: 30,
+        minScore: 20,
       });
 
-      // 4) Persist top suggestions into `matches`
-      const toStore = scoredAll
-        .filter((x) => x.score >= 20)
-        .sort((a, b) => b.score - a.score)
-        .slice(0, 30);
-
+      // 3) Persist top suggestions into `matches`
       if (toStore.length) {
         await tx.match.createMany({
           data: toStore.map((m) => ({
             lost_id: lost.lost_id,
-            found_id: m.found_id,
+            found_id: m.id,
             match_score: m.score.toFixed(2),
           })),
           skipDuplicates: true,
         });
       }
 
-      // 5) Notify the reporting user if there are strong matches
-      const bestStrong = scoredAll
-        .filter((x) => x.score >= 40)
-        .sort((a, b) => b.score - a.score)[0];
+      // 4) Notify the reporting user if there are strong matches
+      const best = toStore.length && toStore[0].score >= 40 ? toStore[0] : null;
+      const bestFound = best
+        ? await tx.foundItem.findUnique({ where: { found_id: best.id }, select: { item_name: true } })
+        : null;
+      const bestStrong =
+        best && bestFound
+          ? { found_id: best.id, item_name: bestFound.item_name, score: best.score, reasons: best.reasons }
+          : null;
 
       if (bestStrong) {
         await tx.notification.create({
@@ -132,25 +104,23 @@ export async function POST(req: Request) {
       }
 
       // Audit log (lost report created)
-      await tx.auditLog.create({
-        data: {
-          actor_user_id: session.userId,
-          action: "LOST_ITEM_CREATED",
-          entity_type: "LostItem",
-          entity_id: lost.lost_id,
-          summary: `Created lost report: "${lost.item_name}"`,
-          meta: {
-            lost_id: lost.lost_id,
-            category_id: lost.category_id,
-            location_id: lost.location_id,
-            match_saved_count: toStore.length,
-            notified: Boolean(bestStrong),
-            best_match_found_id: bestStrong?.found_id ?? null,
-            best_match_score: bestStrong?.score ?? null,
-          },
-          ip,
-          user_agent: ua,
+      audit({
+        actor_user_id: session.userId,
+        action: "LOST_ITEM_CREATED",
+        entity_type: "LostItem",
+        entity_id: lost.lost_id,
+        summary: `Created lost report: "${lost.item_name}"`,
+        meta: {
+          lost_id: lost.lost_id,
+          category_id: lost.category_id,
+          location_id: lost.location_id,
+          match_saved_count: toStore.length,
+          notified: Boolean(bestStrong),
+          best_match_found_id: bestStrong?.found_id ?? null,
+          best_match_score: bestStrong?.score ?? null,
         },
+        ip,
+        user_agent: ua,
       });
 
       // Return the original response shape
@@ -162,8 +132,10 @@ export async function POST(req: Request) {
       };
     });
 
+    invalidateStaffReport();
+
     return NextResponse.json({ ok: true, lost: created }, { status: 201 });
   } catch {
     return NextResponse.json({ error: "Server error." }, { status: 500 });
   }
-}
+});
@@ -1,9 +1,10 @@
 import { NextResponse } from "next/server";
-import { prisma } from "@/lib/db";
+import { instrumentRoute, prisma } from "@/lib/db";
 import { requireSession } from "@/lib/rbac";
-import { getReqIp, getReqUA } from "@/lib/audit";
+import { auditedTransaction, getReqIp, getReqUA } from "@/lib/audit";
+import { invalidateStaffReport } from "@/lib/reports";
 
-export async function POST(req: Request) {
+export const POST = instrumentRoute("POST /api/lost/withdraw", async (req: Request) => {
   try {
     const session = await requireSession();
     const body = await req.json();
@@ -36,36 +37,36 @@ export async function POST(req: Request) {
       return NextResponse.json({ ok: true, status: "CANCELLED" }, { status: 200 });
     }
 
-    const updated = await prisma.$transaction(async (tx) => {
+    const updated = await auditedTransaction(async (tx, audit) => {
       const updated = await tx.lostItem.update({
         where: { lost_id: lostId },
         data: { status: "CANCELLED" },
         select: { lost_id: true, status: true },
       });
 
-      await tx.auditLog.create({
-        data: {
-          actor_user_id: session.userId,
-          action: "LOST_REPORT_WITHDRAWN",
-          entity_type: "LostItem",
-          entity_id: lostId,
-          summary: `Withdrew lost report "${report.item_name || "item"}"`,
-          meta: {
-            lost_id: lostId,
-            owner_user_id: report.user_id,
-            prev_status: report.status,
-            new_status: "CANCELLED",
-          },
-          ip,
-          user_agent: ua,
+      audit({
+        actor_user_id: session.userId,
+        action: "LOST_REPORT_WITHDRAWN",
+        entity_type: "LostItem",
+        entity_id: lostId,
+        summary: `Withdrew lost report "${report.item_name || "item"}"`,
+        meta: {
+          lost_id: lostId,
+          owner_user_id: report.user_id,
+          prev_status: report.status,
+          new_status: "CANCELLED",
         },
+        ip,
+        user_agent: ua,
       });
 
       return updated;
     });
 
+    invalidateStaffReport();
+
     return NextResponse.json({ ok: true, lost: updated }, { status: 200 });
   } catch {
     return NextResponse.json({ error: "Server error." }, { status: 500 });
   }
-}
+});
@@ -1,9 +1,46 @@
 import { NextResponse } from "next/server";
-import { prisma } from "@/lib/db";
+import { instrumentRoute, prisma } from "@/lib/db";
 import { getSession } from "@/lib/session";
-import { scoreLostVsFound } from "@/lib/matching";
+import { scoreIndexed } from "@/lib/matching";
+import { foundIndexInput, lostIndexInput, rankFoundForLost } from "@/lib/match-index";
 
-export async function GET(req: Request) {
+const FOUND_CARD_SELECT = {
+  found_id: true,
+  item_name: true,
+  status: true,
+  date_found: true,
+  image: true,
+  category: { select: { category_name: true } },
+  location: { select: { location_name: true } },
+} as const;
+
+function toMatchRow(
+  f: {
+    found_id: number;
+    item_name: string;
+    status: string;
+    date_found: Date;
+    image: string | null;
+    category: { category_name: string };
+    location: { location_name: string };
+  },
+  score: number,
+  reasons: string[]
+) {
+  return {
+    found_id: f.found_id,
+    item_name: f.item_name,
+    status: f.status,
+    date_found: f.date_found.toISOString(),
+    image: f.image || null,
+    category: f.category,
+    location: f.location,
+    score,
+    reasons,
+  };
+}
+
+export const GET = instrumentRoute("GET /api/matches/suggest", async (req: Request) => {
   try {
     const session = await getSession();
     if (!session) {
@@ -22,11 +59,11 @@ export async function GET(req: Request) {
         lost_id: true,
         user_id: true,
         item_name: true,
-        description: true,
         category_id: true,
         location_id: true,
         date_lost: true,
         status: true,
+        match_tokens: true,
       },
     });
 
@@ -41,68 +78,79 @@ export async function GET(req: Request) {
       return NextResponse.json({ ok: false, error: "Forbidden" }, { status: 403 });
     }
 
-    // Candidate found items: same category OR same location
-    // (we allow any status; UI will disable claim if already claimed)
-    const candidates = await prisma.foundItem.findMany({
-      where: {
-        OR: [{ category_id: lost.category_id }, { location_id: lost.location_id }],
-      },
-      take: 100,
-      select: {
-        found_id: true,
-        item_name: true,
-        description: true,
-        category_id: true,
-        location_id: true,
-        date_found: true,
-        image: true,
-        status: true,
-        category: { select: { category_name: true } },
-        location: { select: { location_name: true } },
-      },
-    });
+    // Matches only exist between open reports and unclaimed items (same policy as the create
+    // routes and prisma/rematch.ts, which prunes everything else)
+    if (lost.status !== "REPORTED_LOST") {
+      return NextResponse.json(
+        { ok: true, lost: { lost_id: lost.lost_id, item_name: lost.item_name }, matches: [] },
+        { status: 200 }
+      );
+    }
 
-    const lostInput = {
-      item_name: lost.item_name,
-      description: lost.description,
-      category_id: lost.category_id,
-      location_id: lost.location_id,
-      date: new Date(lost.date_lost),
-    };
-
-    const scoredAll = candidates.map((f) => {
-      const foundInput = {
-        item_name: f.item_name,
-        description: f.description,
-        category_id: f.category_id,
-        location_id: f.location_id,
-        date: new Date(f.date_found),
-      };
-      const { score, reasons } = scoreLostVsFound(lostInput, foundInput);
-      return {
-        found_id: f.found_id,
-        item_name: f.item_name,
-        status: f.status,
-        date_found: f.date_found.toISOString(),
-        image: f.image || null,
-        category: f.category,
-        location: f.location,
-        score,
-        reasons,
-      };
-    });
+    const lostInput = lostIndexInput(lost);
+    const refresh = url.searchParams.get("refresh") === "1";
+
+    // Default: cheap read of stored matches (kept fresh by create routes + prisma/rematch.ts).
+    // Reasons are rebuilt from stored tokens, no re-tokenizing.
+    if (!refresh) {
+      const stored = await prisma.match.findMany({
+        where: { lost_id: lostId, found_item: { status: "NEWLY_FOUND" } },
+        orderBy: { match_score: "desc" },
+        take: 30,
+        select: {
+          found_item: {
+            select: {
+              ...FOUND_CARD_SELECT,
+              category_id: true,
+              location_id: true,
+              match_tokens: true,
+            },
+          },
+        },
+      });
+
+      // Nothing stored yet (report not scored by the create route or a rematch run):
+      // fall through and score live, exactly like a refresh
+      if (stored.length) {
+        const toShow = stored
+          .map(({ found_item: f }) => ({ f, ...scoreIndexed(lostInput, foundIndexInput(f)) }))
+          .filter((x) => x.score >= 25)
+          .sort((a, b) => b.score - a.score)
+          .slice(0, 10)
+          .map(({ f, score, reasons }) => toMatchRow(f, score, reasons));
+
+        return NextResponse.json(
+          {
+            ok: true,
+            lost: { lost_id: lost.lost_id, item_name: lost.item_name },
+            matches: toShow,
+          },
+          { status: 200 }
+        );
+      }
+    }
 
+    // Refresh (or no stored matches): score the unclaimed inventory in one batch pass.
     // Persist a wider net for later UI/analytics (top 30, >= 20)
-    const toStore = scoredAll
-      .filter((x) => x.score >= 20)
-      .sort((a, b) => b.score - a.score)
-      .slice(0, 30);
+    const toStore = await rankFoundForLost(prisma, lostInput, {
+      where: { status: "NEWLY_FOUND" },
+      k: 30,
+      minScore: 20,
+    });
 
     // For display (top 10, >= 25)
-    const toShow = scoredAll
-      .filter((x) => x.score >= 25)
-      .sort((a, b) => b.score - a.score)
-      .slice(0, 10);
+    const ranked = toStore.filter((x) => x.score >= 25).slice(0, 10);
+
+    const details = await prisma.foundItem.findMany({
+      where: { found_id: { in: ranked.map((m) => m.id) } },
+      select: FOUND_CARD_SELECT,
+    });
+    const byId = new Map(details.map((f) => [f.found_id, f] as const));
+
+    const toShow = ranked.flatMap((m) => {
+      const f = byId.get(m.id);
+      return f ? [toMatchRow(f, m.score, m.reasons)] : [];
+    });
 
     // Overwrite stored matches for this lost report so Refresh actually refreshes
     await prisma.$transaction(async (tx) => {
@@ -112,7 +160,7 @@ export async function GET(req: Request) {
         await tx.match.createMany({
           data: toStore.map((m) => ({
             lost_id: lostId,
-            found_id: m.found_id,
+            found_id: m.id,
             match_score: m.score.toFixed(2),
           })),
         });
@@ -130,4 +178,4 @@ export async function GET(req: Request) {
   } catch {
     return NextResponse.json({ ok: false, error: "Server error." }, { status: 500 });
   }
-}
+});
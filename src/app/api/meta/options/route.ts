@@ -1,21 +1,30 @@
 import { NextResponse } from "next/server";
-import { prisma } from "@/lib/db";
+import { instrumentRoute } from "@/lib/db";
+import { getReferenceData } from "@/lib/reference-data";
 
-export async function GET() {
+// Clients fetch with `cache: "no-cache"`: the browser revalidates every time and gets a 304
+// while the version is unchanged.
+const CACHE_HEADERS = { "cache-control": "private, no-cache" };
+
+function matchesEtag(header: string | null, etag: string) {
+  if (!header) return false;
+  return header.split(",").some((t) => t.trim() === etag || t.trim() === "*");
+}
+
+export const GET = instrumentRoute("GET /api/meta/options", async (req: Request) => {
   try {
-    const [categories, locations] = await Promise.all([
-      prisma.category.findMany({
-        orderBy: { category_id: "asc" },
-        select: { category_id: true, category_name: true },
-      }),
-      prisma.location.findMany({
-        orderBy: { location_id: "asc" },
-        select: { location_id: true, location_name: true },
-      }),
-    ]);
+    const { categories, locations, version } = await getReferenceData();
+    const etag = `W/"ref-${version}"`;
 
-    return NextResponse.json({ ok: true, categories, locations }, { status: 200 });
+    if (matchesEtag(req.headers.get("if-none-match"), etag)) {
+      return new Response(null, { status: 304, headers: { ...CACHE_HEADERS, etag } });
+    }
+
+    return NextResponse.json(
+      { ok: true, categories, locations },
+      { status: 200, headers: { ...CACHE_HEADERS, etag } }
+    );
   } catch {
     return NextResponse.json({ ok: false, error: "Server error." }, { status: 500 });
   }
-}
+});
@@ -1,8 +1,9 @@
 import { NextResponse } from "next/server";
-import { prisma } from "@/lib/db";
+import { instrumentRoute, prisma } from "@/lib/db";
 import { getSession } from "@/lib/session";
+import { getUnreadCount, invalidateUnreadCount } from "@/lib/notifications";
 
-export async function POST(req: Request) {
+export const POST = instrumentRoute("POST /api/notifications/mark-read", async (req: Request) => {
   try {
     const session = await getSession();
     if (!session) {
@@ -37,12 +38,12 @@ export async function POST(req: Request) {
       }
     }
 
-    const unreadCount = await prisma.notification.count({
-      where: { user_id: session.userId, is_read: false },
-    });
+    // Don't wait for the change feed to drop our own cached count
+    invalidateUnreadCount(session.userId);
+    const unreadCount = await getUnreadCount(session.userId);
 
     return NextResponse.json({ ok: true, unreadCount }, { status: 200 });
   } catch {
     return NextResponse.json({ ok: false, error: "Server error." }, { status: 500 });
   }
-}
+});
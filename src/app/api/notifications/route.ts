@@ -1,8 +1,9 @@
 import { NextResponse } from "next/server";
-import { prisma } from "@/lib/db";
+import { instrumentRoute, prisma } from "@/lib/db";
 import { getSession } from "@/lib/session";
+import { getUnreadCount } from "@/lib/notifications";
 
-export async function GET(req: Request) {
+export const GET = instrumentRoute("GET /api/notifications", async (req: Request) => {
   try {
     const session = await getSession();
     if (!session) {
@@ -14,9 +15,7 @@ export async function GET(req: Request) {
     const limit = Math.min(50, Math.max(1, Number.isFinite(limitRaw) ? limitRaw : 20));
 
     const [unreadCount, rows] = await Promise.all([
-      prisma.notification.count({
-        where: { user_id: session.userId, is_read: false },
-      }),
+      getUnreadCount(session.userId),
       prisma.notification.findMany({
         where: { user_id: session.userId },
         orderBy: { created_at: "desc" },
@@ -44,4 +43,4 @@ export async function GET(req: Request) {
   } catch {
     return NextResponse.json({ ok: false, error: "Server error." }, { status: 500 });
   }
-}
+});
@@ -0,0 +1,105 @@
+import { NextResponse } from "next/server";
+import { getSession, getSessionToken } from "@/lib/session";
+import { verifySessionToken } from "@/lib/auth";
+import { getUnreadCount, notificationsLive, subscribeNotifications } from "@/lib/notifications";
+import { instrumentRoute } from "@/lib/db";
+
+export const runtime = "nodejs";
+export const dynamic = "force-dynamic";
+
+// Keeps proxies from closing an idle stream
+const HEARTBEAT_MS = 25_000;
+// Collapse bursts (e.g. a claim decision fanning out) into one recount per connection
+const DEBOUNCE_MS = 250;
+
+/**
+ * Server-Sent Events: `event: unread` with { unreadCount } on connect and whenever
+ * the user's notifications change. Idle connections cost no queries.
+ * The session is re-checked on every heartbeat; the stream closes once it has expired or been
+ * revoked (role/status change), and the client's reconnect then gets a 401.
+ */
+export const GET = instrumentRoute("GET /api/notifications/stream", async (req: Request) => {
+  const session = await getSession();
+  if (!session) {
+    return NextResponse.json({ ok: false, error: "Unauthorized" }, { status: 401 });
+  }
+
+  const userId = session.userId;
+  const token = await getSessionToken();
+  const encoder = new TextEncoder();
+  let cleanup = () => {};
+
+  const stream = new ReadableStream<Uint8Array>({
+    start(controller) {
+      let closed = false;
+      let timer: ReturnType<typeof setTimeout> | null = null;
+
+      const send = (chunk: string) => {
+        if (!closed) controller.enqueue(encoder.encode(chunk));
+      };
+
+      const push = async () => {
+        timer = null;
+        try {
+          const unreadCount = await getUnreadCount(userId);
+          send(`event: unread\ndata: ${JSON.stringify({ unreadCount })}\n\n`);
+        } catch {
+          // next change or heartbeat tries again
+        }
+      };
+
+      const schedule = () => {
+        if (!timer && !closed) timer = setTimeout(push, DEBOUNCE_MS);
+      };
+
+      const unsubscribe = subscribeNotifications(userId, schedule);
+      const stillSignedIn = async () => {
+        if (!token) return false;
+        try {
+          return (await verifySessionToken(token)).userId === userId;
+        } catch {
+          return false;
+        }
+      };
+
+      const heartbeat = setInterval(async () => {
+        if (!(await stillSignedIn())) {
+          cleanup();
+          return;
+        }
+        send(": ping\n\n");
+        // No change feed right now: fall back to a slow recount
+        if (!notificationsLive()) schedule();
+      }, HEARTBEAT_MS);
+
+      cleanup = () => {
+        if (closed) return;
+        closed = true;
+        unsubscribe();
+        clearInterval(heartbeat);
+        if (timer) clearTimeout(timer);
+        try {
+          controller.close();
+        } catch {
+          // already closed by the client
+        }
+      };
+      req.signal.addEventListener("abort", cleanup);
+
+      send("retry: 5000\n\n");
+      void push();
+    },
+    cancel() {
+      cleanup();
+    },
+  });
+
+  return new Response(stream, {
+    headers: {
+      "content-type": "text/event-stream; charset=utf-8",
+      "cache-control": "no-cache, no-transform",
+      connection: "keep-alive",
+      "x-accel-buffering": "no",
+    },
+  });
+});
@@ -1,6 +1,7 @@
 import { NextResponse } from "next/server";
-import { prisma } from "@/lib/db";
+import { instrumentRoute, prisma } from "@/lib/db";
 import { getSession, setSession } from "@/lib/session";
+import { recordAudit } from "@/lib/audit";
 
 function cleanString(v: unknown) {
   return String(v ?? "").trim();
@@ -16,7 +17,7 @@ function isValidAvatarUrl(v: string) {
   return v.startsWith("/uploads/avatars/");
 }
 
-export async function PATCH(req: Request) {
+export const PATCH = instrumentRoute("PATCH /api/profile/avatar", async (req: Request) => {
   try {
     const session = await getSession();
     if (!session) {
@@ -66,20 +67,18 @@ export async function PATCH(req: Request) {
     });
 
     try {
-      await prisma.auditLog.create({
-        data: {
-          actor_user_id: session.userId,
-          action: "PROFILE_AVATAR_UPDATE",
-          entity_type: "User",
-          entity_id: updated.user_id,
-          summary: "User updated profile avatar",
-          meta: {
-            before,
-            after: { avatar_url: updated.avatar_url },
-          },
-          ip: getIp(req),
-          user_agent: req.headers.get("user-agent") || null,
+      await recordAudit({
+        actor_user_id: session.userId,
+        action: "PROFILE_AVATAR_UPDATE",
+        entity_type: "User",
+        entity_id: updated.user_id,
+        summary: "User updated profile avatar",
+        meta: {
+          before,
+          after: { avatar_url: updated.avatar_url },
         },
+        ip: getIp(req),
+        user_agent: req.headers.get("user-agent") || null,
       });
     } catch (e) {
       console.warn("AuditLog write failed:", e);
@@ -90,4 +89,4 @@ export async function PATCH(req: Request) {
     console.error(err);
     return NextResponse.json({ ok: false, error: "Server error." }, { status: 500 });
   }
-}
+});
@@ -1,6 +1,7 @@
 import { NextResponse } from "next/server";
-import { prisma } from "@/lib/db";
+import { instrumentRoute, prisma } from "@/lib/db";
 import { getSession, setSession } from "@/lib/session";
+import { recordAudit } from "@/lib/audit";
 
 function cleanString(v: unknown) {
   return String(v ?? "").trim();
@@ -12,7 +13,7 @@ function getIp(req: Request) {
   return req.headers.get("x-real-ip") || null;
 }
 
-export async function GET() {
+export const GET = instrumentRoute("GET /api/profile", async () => {
   try {
     const session = await getSession();
     if (!session) {
@@ -59,9 +60,9 @@ export async function GET() {
     console.error(err);
     return NextResponse.json({ ok: false, error: "Server error." }, { status: 500 });
   }
-}
+});
 
-export async function PATCH(req: Request) {
+export const PATCH = instrumentRoute("PATCH /api/profile", async (req: Request) => {
   try {
     const session = await getSession();
     if (!session) {
@@ -120,20 +121,18 @@ export async function PATCH(req: Request) {
 
     // ✅ Audit log (best effort)
     try {
-      await prisma.auditLog.create({
-        data: {
-          actor_user_id: session.userId,
-          action: "PROFILE_UPDATE",
-          entity_type: "User",
-          entity_id: updated.user_id,
-          summary: "User updated profile",
-          meta: {
-            before,
-            after: { full_name: updated.full_name, department: updated.department },
-          },
-          ip: getIp(req),
-          user_agent: req.headers.get("user-agent") || null,
+      await recordAudit({
+        actor_user_id: session.userId,
+        action: "PROFILE_UPDATE",
+        entity_type: "User",
+        entity_id: updated.user_id,
+        summary: "User updated profile",
+        meta: {
+          before,
+          after: { full_name: updated.full_name, department: updated.department },
         },
+        ip: getIp(req),
+        user_agent: req.headers.get("user-agent") || null,
       });
     } catch (e) {
       console.warn("AuditLog write failed:", e);
@@ -161,4 +160,4 @@ export async function PATCH(req: Request) {
     console.error(err);
     return NextResponse.json({ ok: false, error: "Server error." }, { status: 500 });
   }
-}
+});
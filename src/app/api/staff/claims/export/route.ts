@@ -0,0 +1,83 @@
+import { NextResponse } from "next/server";
+import { instrumentRoute, prismaRead } from "@/lib/db";
+import { getSession } from "@/lib/session";
+import { claimWhere } from "@/lib/list-filters";
+import { exportResponse, keysetChunks, parseExportFormat, type ExportColumn } from "@/lib/export";
+
+type Row = Awaited<ReturnType<typeof fetchChunk>>[number];
+
+function fetchChunk(where: any, afterId: number | null, take: number) {
+  return prismaRead.claim.findMany({
+    where: afterId === null ? where : { AND: [where, { claim_id: { gt: afterId } }] },
+    orderBy: { claim_id: "asc" },
+    take,
+    select: {
+      claim_id: true,
+      claim_status: true,
+      date_claimed: true,
+      reviewed_at: true,
+      proof_description: true,
+      claimant: { select: { user_id: true, full_name: true, email: true } },
+      verifier: { select: { user_id: true, full_name: true } },
+      found_item: {
+        select: {
+          found_id: true,
+          item_name: true,
+          status: true,
+          category: { select: { category_name: true } },
+          location: { select: { location_name: true } },
+        },
+      },
+    },
+  });
+}
+
+const COLUMNS: ExportColumn<Row>[] = [
+  { header: "claim_id", value: (r) => r.claim_id },
+  { header: "claim_status", value: (r) => r.claim_status },
+  { header: "date_claimed", value: (r) => r.date_claimed },
+  { header: "reviewed_at", value: (r) => r.reviewed_at },
+  { header: "claimant_user_id", value: (r) => r.claimant.user_id },
+  { header: "claimant_name", value: (r) => r.claimant.full_name },
+  { header: "claimant_email", value: (r) => r.claimant.email },
+  { header: "verifier_user_id", value: (r) => r.verifier?.user_id },
+  { header: "verifier_name", value: (r) => r.verifier?.full_name },
+  { header: "found_id", value: (r) => r.found_item.found_id },
+  { header: "item_name", value: (r) => r.found_item.item_name },
+  { header: "item_status", value: (r) => r.found_item.status },
+  { header: "category", value: (r) => r.found_item.category.category_name },
+  { header: "location", value: (r) => r.found_item.location.location_name },
+  { header: "proof_description", value: (r) => r.proof_description },
+];
+
+// GET /api/staff/claims/export?format=csv|ndjson + the /api/staff/claims filters (status, q)
+export const GET = instrumentRoute("GET /api/staff/claims/export", async (req: Request) => {
+  try {
+    const session = await getSession();
+    if (!session) {
+      return NextResponse.json({ ok: false, error: "Unauthorized" }, { status: 401 });
+    }
+
+    const role = String(session.role || "").toUpperCase();
+    if (role !== "STAFF" && role !== "ADMIN") {
+      return NextResponse.json({ ok: false, error: "Forbidden" }, { status: 403 });
+    }
+
+    const url = new URL(req.url);
+    const format = parseExportFormat(url.searchParams.get("format"));
+    if (!format) {
+      return NextResponse.json({ ok: false, error: "Invalid format. Allowed: csv, ndjson" }, { status: 400 });
+    }
+
+    const { where } = claimWhere(url.searchParams);
+
+    return exportResponse({
+      filename: "claims",
+      format,
+      columns: COLUMNS,
+      chunks: keysetChunks((afterId, take) => fetchChunk(where, afterId, take), (r) => r.claim_id),
+    });
+  } catch {
+    return NextResponse.json({ ok: false, error: "Server error." }, { status: 500 });
+  }
+});
@@ -1,10 +1,9 @@
 import { NextResponse } from "next/server";
-import { prisma } from "@/lib/db";
+import { instrumentRoute, prisma } from "@/lib/db";
 import { getSession } from "@/lib/session";
+import { claimWhere } from "@/lib/list-filters";
 
-const ALLOWED = new Set(["ALL", "PENDING", "APPROVED", "DENIED"]);
-
-export async function GET(req: Request) {
+export const GET = instrumentRoute("GET /api/staff/claims", async (req: Request) => {
   try {
     const session = await getSession();
     if (!session) {
@@ -17,30 +16,8 @@ export async function GET(req: Request) {
     }
 
     const url = new URL(req.url);
-    const statusRaw = String(url.searchParams.get("status") || "PENDING").toUpperCase();
-    const status = ALLOWED.has(statusRaw) ? statusRaw : "PENDING";
-    const q = String(url.searchParams.get("q") || "").trim();
-
-    const where: any = {};
-
-    if (status !== "ALL") {
-      where.claim_status = status;
-    }
-
-    if (q.length > 0) {
-      where.AND = [
-        {
-          OR: [
-            { proof_description: { contains: q, mode: "insensitive" } },
-            { claimant: { full_name: { contains: q, mode: "insensitive" } } },
-            { claimant: { email: { contains: q, mode: "insensitive" } } },
-            { found_item: { item_name: { contains: q, mode: "insensitive" } } },
-            { found_item: { category: { category_name: { contains: q, mode: "insensitive" } } } },
-            { found_item: { location: { location_name: { contains: q, mode: "insensitive" } } } },
-          ],
-        },
-      ];
-    }
+    // Same filters as /api/staff/claims/export
+    const { status, where } = claimWhere(url.searchParams);
 
     const orderBy =
       status === "PENDING"
@@ -87,4 +64,4 @@ export async function GET(req: Request) {
   } catch {
     return NextResponse.json({ ok: false, error: "Server error." }, { status: 500 });
   }
-}
+});
@@ -1,12 +1,13 @@
 import { NextResponse } from "next/server";
 import { getSession } from "@/lib/session";
-import { storeImage, UploadError } from "@/lib/uploads";
+import { storeImageFromRequest, UploadError } from "@/lib/uploads";
+import { instrumentRoute } from "@/lib/db";
 
 export const runtime = "nodejs";
 export const dynamic = "force-dynamic";
 
 const MAX_BYTES = 5 * 1024 * 1024; // 5MB
-export async function POST(req: Request) {
+export const POST = instrumentRoute("POST /api/uploads/lost", async (req: Request) => {
   // Any logged-in user can upload a LOST image
   const session = await getSession();
   if (!session) {
@@ -14,19 +15,9 @@ export async function POST(req: Request) {
   }
 
   try {
-    const form = await req.formData();
-    const entry = form.get("file");
-
-    if (!entry || typeof entry === "string") {
-      return NextResponse.json(
-        { ok: false, error: "Missing file (field name must be 'file')." },
-        { status: 400 }
-      );
-    }
-
-    const file = entry as File;
-    const { url, filename } = await storeImage({ file, folder: "lost", maxBytes: MAX_BYTES });
-    return NextResponse.json({ ok: true, url, filename });
+    // Raw image body (streamed) or legacy multipart `file` field
+    const { url, filename, variants } = await storeImageFromRequest(req, { folder: "lost", maxBytes: MAX_BYTES });
+    return NextResponse.json({ ok: true, url, filename, variants });
   } catch (err: unknown) {
     if (err instanceof UploadError) {
       return NextResponse.json({ ok: false, error: err.message }, { status: err.status });
@@ -34,4 +25,4 @@ export async function POST(req: Request) {
     console.error("Upload failed:", err);
     return NextResponse.json({ ok: false, error: "Upload failed" }, { status: 500 });
   }
-}
+});
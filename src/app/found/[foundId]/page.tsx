@@ -44,6 +44,7 @@ export default async function FoundDetailPage({
       category_id: true,
       location_id: true,
       date_found: true,
+      match_tokens: true,
       storage_location: true,
       image: true,
       status: true,
@@ -400,6 +401,7 @@ export default async function FoundDetailPage({
               category_id: item.category_id,
               location_id: item.location_id,
               date_found: new Date(item.date_found),
+              match_tokens: item.match_tokens,
             }}
           />
         </div>
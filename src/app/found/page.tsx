@@ -1,6 +1,6 @@
 "use client";
 
-import { Suspense, useEffect, useMemo, useState } from "react";
+import { Suspense, useEffect, useMemo, useRef, useState } from "react";
 import Link from "next/link";
 import Image from "next/image";
 import { useSearchParams } from "next/navigation";
@@ -31,6 +31,8 @@ import {
   SelectTrigger,
   SelectValue,
 } from "@/components/ui/select";
+import { imageVariant } from "@/lib/image-variants";
+import { createQueryCache, isAbortError } from "@/lib/query-cache";
 
 type Category = { category_id: number; category_name: string };
 type Location = { location_id: number; location_name: string };
@@ -48,6 +50,8 @@ type FoundItem = {
   location: { location_name: string };
 };
 
+type FoundListResponse = { ok: true; items: FoundItem[]; page: number; totalPages: number | null };
+
 type SessionPayload = {
   userId: number;
   role: "USER" | "STAFF" | "ADMIN";
@@ -55,7 +59,7 @@ type SessionPayload = {
   name: string;
 };
 
-type SortKey = "created_desc" | "created_asc" | "found_desc" | "found_asc";
+type SortKey = "created_desc" | "created_asc" | "found_desc" | "found_asc" | "relevance";
 
 const STATUS_OPTIONS: Array<{ value: string; label: string }> = [
   { value: "NEWLY_FOUND", label: "Newly found" },
@@ -70,6 +74,7 @@ const SORT_OPTIONS: Array<{ value: SortKey; label: string }> = [
   { value: "created_asc", label: "Oldest added" },
   { value: "found_desc", label: "Newest found date" },
   { value: "found_asc", label: "Oldest found date" },
+  { value: "relevance", label: "Best match (keyword)" },
 ];
 
 function FoundBrowseContent() {
@@ -101,6 +106,10 @@ function FoundBrowseContent() {
   const [page, setPage] = useState(1);
   const [totalPages, setTotalPages] = useState(1);
 
+  // Per mount: results depend on who is signed in, so they shouldn't outlive the page
+  const [listCache] = useState(() => createQueryCache<FoundListResponse>({ max: 50, ttlMs: 60_000 }));
+  const listRequest = useRef<AbortController | null>(null);
+
   const fmt = useMemo(
     () =>
       new Intl.DateTimeFormat("en-PH", {
@@ -124,7 +133,7 @@ function FoundBrowseContent() {
   async function loadOptions() {
     setOptionsLoading(true);
     try {
-      const res = await fetch("/api/meta/options", { cache: "no-store" });
+      const res = await fetch("/api/meta/options", { cache: "no-cache" });
       const data = await res.json();
       if (!res.ok || !data?.ok) {
         toast.error("Failed to load filters.");
@@ -140,6 +149,11 @@ function FoundBrowseContent() {
   }
 
   function applySortParams(sp: URLSearchParams, key: SortKey) {
+    if (key === "relevance") {
+      sp.set("sortBy", "relevance");
+      sp.set("sortDir", "desc");
+      return;
+    }
     if (key === "created_desc") {
       sp.set("sortBy", "date_created");
       sp.set("sortDir", "desc");
@@ -196,25 +210,46 @@ function FoundBrowseContent() {
 
       applySortParams(sp, sortEff);
 
-      sp.set("page", String(nextPage));
       sp.set("pageSize", "12");
 
-      const res = await fetch(`/api/found/list?${sp.toString()}`, {
-        cache: "no-store",
-      });
-      const data = await res.json();
-
-      if (!res.ok || !data?.ok) {
-        toast.error(data?.error || "Failed to load found items.");
+      const pageUrl = (n: number) => {
+        sp.set("page", String(n));
+        return `/api/found/list?${sp.toString()}`;
+      };
+      const url = pageUrl(nextPage);
+
+      const apply = (data: FoundListResponse) => {
+        const current = data.page || 1;
+        const pages = data.totalPages || 1;
+        setItems(data.items || []);
+        setPage(current);
+        setTotalPages(pages);
+        // Warm the next page so "Next" is instant
+        if (current < pages) listCache.prefetch(pageUrl(current + 1));
+      };
+
+      // A newer load supersedes this one: stop waiting for (and maybe abort) the old request
+      listRequest.current?.abort();
+      const controller = new AbortController();
+      listRequest.current = controller;
+
+      const cached = listCache.peek(url);
+      if (cached) {
+        apply(cached);
+        setLoading(false);
         return;
       }
 
-      setItems(data.items || []);
-      setPage(data.page || 1);
-      setTotalPages(data.totalPages || 1);
+      try {
+        apply(await listCache.get(url, controller.signal));
+      } catch (err) {
+        if (isAbortError(err)) return;
+        toast.error((err as Error)?.message || "Failed to load found items.");
+      } finally {
+        if (listRequest.current === controller) setLoading(false);
+      }
     } catch {
       toast.error("Failed to load found items.");
-    } finally {
       setLoading(false);
     }
   }
@@ -480,7 +515,7 @@ function FoundBrowseContent() {
         ) : (
           <div className="grid gap-4 sm:grid-cols-2 lg:grid-cols-3">
             {items.map((it) => {
-              const src = it.image || "/found-placeholder.svg";
+              const src = it.image ? imageVariant(it.image, "md") : "/found-placeholder.svg";
               const statusLabel = statusOptions.find((o) => o.value === it.status)?.label ?? it.status;
 
               const statusKey = String(it.status || "").toUpperCase();
@@ -55,7 +55,7 @@ export default function ReportLostPage() {
     let alive = true;
     (async () => {
       try {
-        const res = await fetch("/api/meta/options", { cache: "no-store" });
+        const res = await fetch("/api/meta/options", { cache: "no-cache" });
         const data = await res.json();
         if (!alive) return;
 
@@ -93,12 +93,10 @@ export default function ReportLostPage() {
     if (!imageFile) return null;
 
     try {
-      const fd = new FormData();
-      fd.append("file", imageFile);
-
       const res = await fetch("/api/uploads/lost", {
         method: "POST",
-        body: fd,
+        headers: { "content-type": imageFile.type },
+        body: imageFile,
       });
       const data = await res.json().catch(() => ({}));
       if (!res.ok || !data?.ok || typeof data?.url !== "string") {
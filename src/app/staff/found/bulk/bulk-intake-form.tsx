@@ -0,0 +1,241 @@
+"use client";
+
+import { useRef, useState } from "react";
+import Link from "next/link";
+import { useRouter } from "next/navigation";
+import { toast } from "sonner";
+
+import { Button } from "@/components/ui/button";
+import { Separator } from "@/components/ui/separator";
+import { Card } from "@/components/ui/card";
+import { Badge } from "@/components/ui/badge";
+import { Textarea } from "@/components/ui/textarea";
+
+type RowError = { row: number; error: string };
+
+type IntakeResponse = {
+  ok: boolean;
+  error?: string;
+  dryRun?: boolean;
+  valid?: number;
+  created?: Array<{ found_id: number; item_name: string }>;
+  errors?: RowError[];
+  matchesInserted?: number;
+  notificationsInserted?: number;
+};
+
+const TEMPLATE =
+  "itemName,description,category,location,storageLocation,dateFound,image\r\n" +
+  '"Black Wallet","Leather wallet with a school ID inside",Wallets,Library,"Security Office - Cabinet A",2026-08-12,\r\n';
+
+const TEMPLATE_HREF = `data:text/csv;charset=utf-8,${encodeURIComponent(TEMPLATE)}`;
+
+export function BulkIntakeForm() {
+  const router = useRouter();
+
+  const [text, setText] = useState("");
+  const [format, setFormat] = useState<"csv" | "json">("csv");
+  const [fileName, setFileName] = useState("");
+  const [busy, setBusy] = useState<"validate" | "import" | null>(null);
+  const [result, setResult] = useState<IntakeResponse | null>(null);
+  const fileRef = useRef<HTMLInputElement | null>(null);
+
+  async function onFile(file: File | null) {
+    setResult(null);
+    if (!file) return;
+    setFileName(file.name);
+    setFormat(file.name.toLowerCase().endsWith(".json") ? "json" : "csv");
+    setText(await file.text());
+  }
+
+  function onPaste(value: string) {
+    setText(value);
+    setResult(null);
+    setFileName("");
+    setFormat(value.trimStart().startsWith("{") || value.trimStart().startsWith("[") ? "json" : "csv");
+  }
+
+  function requestBody() {
+    if (format === "csv") return { contentType: "text/csv", body: text };
+    // Accept a bare array too
+    try {
+      const parsed = JSON.parse(text);
+      return {
+        contentType: "application/json",
+        body: JSON.stringify(Array.isArray(parsed) ? { items: parsed } : parsed),
+      };
+    } catch {
+      return null;
+    }
+  }
+
+  async function submit(dryRun: boolean) {
+    if (!text.trim()) {
+      toast.error("Choose a file or paste rows first.");
+      return;
+    }
+    const req = requestBody();
+    if (!req) {
+      toast.error("That isn't valid JSON.");
+      return;
+    }
+
+    setBusy(dryRun ? "validate" : "import");
+    try {
+      const res = await fetch(`/api/found/bulk${dryRun ? "?dryRun=1" : ""}`, {
+        method: "POST",
+        headers: { "content-type": req.contentType },
+        body: req.body,
+      });
+      const data: IntakeResponse = await res.json().catch(() => ({ ok: false }));
+      setResult(data);
+
+      if (!res.ok || !data?.ok) {
+        toast.error(data?.error || "Import failed.");
+        return;
+      }
+
+      if (dryRun) {
+        toast.success(`${data.valid ?? 0} row(s) ready to import.`);
+        return;
+      }
+
+      toast.success(`Logged ${data.created?.length ?? 0} found item(s).`);
+      router.refresh();
+    } catch {
+      toast.error("Network error.");
+    } finally {
+      setBusy(null);
+    }
+  }
+
+  function reset() {
+    setText("");
+    setFileName("");
+    setResult(null);
+    if (fileRef.current) fileRef.current.value = "";
+  }
+
+  const errors = result?.errors ?? [];
+
+  return (
+    <div className="flex flex-col gap-6">
+      <div className="flex flex-wrap items-center justify-between gap-3 text-sm text-[#6B7280]">
+        <div className="inline-flex items-center gap-2 rounded-full bg-[#F8F7F6] px-3 py-1 ring-1 ring-black/5">
+          Up to <span className="font-semibold text-[#111827]">1000</span> rows per upload. Category and location
+          can be a name or an id.
+        </div>
+        <div className="flex flex-wrap items-center gap-2">
+          <Badge variant="secondary" className="rounded-full px-3 py-1 text-[10px] font-medium uppercase tracking-[0.14em]">
+            /api/found/bulk
+          </Badge>
+          <Badge variant="secondary" className="rounded-full px-3 py-1 text-[10px] font-medium uppercase tracking-[0.14em]">
+            {format.toUpperCase()}
+          </Badge>
+        </div>
+      </div>
+
+      <div className="grid gap-6 lg:grid-cols-[2fr_1fr] lg:items-start">
+        <Card className="rounded-3xl border-0 bg-white/92 p-6 shadow-[0_12px_34px_rgba(0,0,0,0.04)] ring-1 ring-[rgba(0,0,0,0.05)]">
+          <div className="flex flex-wrap items-start justify-between gap-3">
+            <div>
+              <div className="text-sm font-semibold tracking-tight">Rows</div>
+              <div className="mt-1 text-sm text-[#6B7280]">
+                Upload a .csv / .json file or paste the rows below.
+              </div>
+            </div>
+            <Button variant="outline" className="rounded-2xl bg-white/70" asChild>
+              <a href={TEMPLATE_HREF} download="found-items-template.csv">
+                CSV template
+              </a>
+            </Button>
+          </div>
+
+          <Separator className="my-4" />
+
+          <div className="flex flex-col gap-4">
+            <div className="flex flex-wrap items-center gap-3">
+              <input
+                ref={fileRef}
+                type="file"
+                accept=".csv,.json,text/csv,application/json"
+                className="text-sm"
+                onChange={(e) => onFile(e.target.files?.[0] ?? null)}
+              />
+              {fileName ? <span className="text-xs text-[#6B7280]">{fileName}</span> : null}
+            </div>
+
+            <Textarea
+              className="min-h-[260px] rounded-2xl bg-white/80 font-mono text-xs ring-1 ring-black/5"
+              placeholder={TEMPLATE}
+              value={text}
+              onChange={(e) => onPaste(e.target.value)}
+            />
+
+            <div className="flex flex-wrap items-center justify-end gap-2">
+              <Button type="button" variant="ghost" className="rounded-2xl" onClick={reset} disabled={busy !== null}>
+                Clear
+              </Button>
+              <Button
+                type="button"
+                variant="outline"
+                className="rounded-2xl bg-white/70"
+                onClick={() => submit(true)}
+                disabled={busy !== null}
+              >
+                {busy === "validate" ? "Checking…" : "Validate"}
+              </Button>
+              <Button type="button" className="rounded-2xl" onClick={() => submit(false)} disabled={busy !== null}>
+                {busy === "import" ? "Importing…" : "Import"}
+              </Button>
+            </div>
+          </div>
+        </Card>
+
+        <Card className="rounded-3xl border-0 bg-white/92 p-6 shadow-[0_12px_34px_rgba(0,0,0,0.04)] ring-1 ring-[rgba(0,0,0,0.05)]">
+          <div className="text-sm font-semibold tracking-tight">Result</div>
+          <div className="mt-1 text-sm text-[#6B7280]">
+            {result
+              ? result.dryRun
+                ? `${result.valid ?? 0} valid row(s), ${errors.length} with problems.`
+                : result.created
+                  ? `${result.created.length} created · ${result.matchesInserted ?? 0} matches · ${
+                      result.notificationsInserted ?? 0
+                    } notifications`
+                  : result.error || "Nothing imported."
+              : "Validate first to see problems without saving anything."}
+          </div>
+
+          <Separator className="my-4" />
+
+          {errors.length ? (
+            <div className="max-h-[320px] overflow-y-auto rounded-2xl ring-1 ring-black/5">
+              <table className="w-full text-left text-xs">
+                <thead className="bg-[#F8F7F6] text-[#6B7280]">
+                  <tr>
+                    <th className="px-3 py-2 font-medium">Row</th>
+                    <th className="px-3 py-2 font-medium">Problem</th>
+                  </tr>
+                </thead>
+                <tbody>
+                  {errors.map((e, i) => (
+                    <tr key={`${e.row}-${i}`} className="border-t border-black/5">
+                      <td className="px-3 py-2 font-medium">{e.row}</td>
+                      <td className="px-3 py-2 text-[#7F0101]">{e.error}</td>
+                    </tr>
+                  ))}
+                </tbody>
+              </table>
+            </div>
+          ) : result && !result.dryRun && result.created?.length ? (
+            <Button variant="outline" className="w-full rounded-2xl bg-white/70" asChild>
+              <Link href="/staff/found">Open inventory</Link>
+            </Button>
+          ) : (
+            <div className="text-xs text-[#6B7280]">No problems to show.</div>
+          )}
+        </Card>
+      </div>
+    </div>
+  );
+}
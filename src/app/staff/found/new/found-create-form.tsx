@@ -58,7 +58,7 @@ export function FoundCreateForm() {
   async function loadOptions() {
     setOptionsLoading(true);
     try {
-      const res = await fetch("/api/meta/options", { cache: "no-store" });
+      const res = await fetch("/api/meta/options", { cache: "no-cache" });
       const data = await res.json();
       if (!res.ok || !data?.ok) {
         toast.error(data?.error || "Failed to load options.");
@@ -95,12 +95,11 @@ export function FoundCreateForm() {
 
     setUploading(true);
     try {
-      const fd = new FormData();
-      fd.append("file", imageFile);
-
+      // Raw body: the server streams it to disk instead of parsing a multipart form
       const res = await fetch("/api/uploads/found", {
         method: "POST",
-        body: fd,
+        headers: { "content-type": imageFile.type },
+        body: imageFile,
       });
 
       const data = await res.json().catch(() => ({}));
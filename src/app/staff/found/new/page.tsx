@@ -5,7 +5,7 @@ import { getSession } from "@/lib/session";
 import { Card } from "@/components/ui/card";
 import { Button } from "@/components/ui/button";
 import { Badge } from "@/components/ui/badge";
-import { ArrowLeft, PackagePlus, PackageSearch } from "lucide-react";
+import { ArrowLeft, PackagePlus, PackageSearch, FileSpreadsheet } from "lucide-react";
 import { FoundCreateForm } from "./found-create-form";
 
 export default async function StaffFoundNewPage() {
@@ -48,6 +48,12 @@ export default async function StaffFoundNewPage() {
                     Dashboard
                   </Link>
                 </Button>
+                <Button variant="outline" className="rounded-2xl bg-white/70" asChild>
+                  <Link href="/staff/found/bulk">
+                    <FileSpreadsheet className="mr-2 size-4" />
+                    Bulk intake
+                  </Link>
+                </Button>
                 <Button variant="outline" className="rounded-2xl bg-white/70" asChild>
                   <Link href="/staff/found">
                     <PackageSearch className="mr-2 size-4" />
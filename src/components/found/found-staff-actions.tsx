@@ -161,12 +161,13 @@ export function FoundStaffActions({
       return;
     }
 
-    const fd = new FormData();
-    fd.append("file", f);
-
     setImgBusy(true);
     try {
-      const res = await fetch("/api/uploads/found", { method: "POST", body: fd });
+      const res = await fetch("/api/uploads/found", {
+        method: "POST",
+        headers: { "content-type": f.type },
+        body: f,
+      });
       const data = await res.json().catch(() => ({}));
 
       if (!res.ok || !data?.ok || !data?.url) {
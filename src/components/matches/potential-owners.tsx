@@ -5,7 +5,7 @@ import { Button } from "@/components/ui/button";
 import { Separator } from "@/components/ui/separator";
 import { EmptyState } from "@/components/ui/empty-state";
 import { prisma } from "@/lib/db";
-import { scoreLostVsFound } from "@/lib/matching";
+import { scoreIndexed } from "@/lib/matching";
 import { Mail, Sparkles, UserRound, ArrowUpRight } from "lucide-react";
 
 type Role = "USER" | "STAFF" | "ADMIN";
@@ -17,6 +17,7 @@ type FoundInput = {
   category_id: number;
   location_id: number;
   date_found: Date;
+  match_tokens: string[];
 };
 
 function scoreTone(score: number) {
@@ -47,6 +48,7 @@ export async function PotentialOwners({
           item_name: true,
           description: true,
           date_lost: true,
+          match_tokens: true,
           status: true,
           category_id: true,
           location_id: true,
@@ -101,17 +103,15 @@ export async function PotentialOwners({
             const lost = r.lost_item;
 
             // Recompute reasons for display (matches are persisted; reasons are explainability only)
-            const { reasons } = scoreLostVsFound(
+            const { reasons } = scoreIndexed(
               {
-                item_name: lost.item_name,
-                description: lost.description,
+                tokens: lost.match_tokens,
                 category_id: lost.category_id,
                 location_id: lost.location_id,
                 date: new Date(lost.date_lost),
               },
               {
-                item_name: found.item_name,
-                description: found.description,
+                tokens: found.match_tokens,
                 category_id: found.category_id,
                 location_id: found.location_id,
                 date: new Date(found.date_found),
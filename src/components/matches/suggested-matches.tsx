@@ -11,6 +11,7 @@ import { Button } from "@/components/ui/button";
 import { Separator } from "@/components/ui/separator";
 import { EmptyState, LoadingGrid } from "@/components/ui/empty-state";
 import { Sparkles, MapPin, Tag, RefreshCw } from "lucide-react";
+import { imageVariant } from "@/lib/image-variants";
 
 type MatchRow = {
   found_id: number;
@@ -44,10 +45,10 @@ export function SuggestedMatches({ lostId }: { lostId: number }) {
     []
   );
 
-  async function load() {
+  async function load(refresh = false) {
     setLoading(true);
     try {
-      const res = await fetch(`/api/matches/suggest?lostId=${lostId}`, {
+      const res = await fetch(`/api/matches/suggest?lostId=${lostId}${refresh ? "&refresh=1" : ""}`, {
         cache: "no-store",
       });
       const data = await res.json();
@@ -96,7 +97,7 @@ export function SuggestedMatches({ lostId }: { lostId: number }) {
         <Button
           variant="outline"
           className="rounded-xl"
-          onClick={load}
+          onClick={() => load(true)}
           disabled={loading}
         >
           <RefreshCw className="mr-2 size-4" />
@@ -123,7 +124,7 @@ export function SuggestedMatches({ lostId }: { lostId: number }) {
         <div className="grid gap-4 md:grid-cols-2 xl:grid-cols-3">
           {matches.map((m, idx) => {
             const claimable = String(m.status).toUpperCase() === "NEWLY_FOUND";
-            const img = m.image || "/found-placeholder.svg";
+            const img = m.image ? imageVariant(m.image, "md") : "/found-placeholder.svg";
 
             return (
               <motion.div
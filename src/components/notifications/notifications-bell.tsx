@@ -1,7 +1,7 @@
 "use client";
 
 import Link from "next/link";
-import { useEffect, useMemo, useState } from "react";
+import { useEffect, useMemo, useRef, useState } from "react";
 import { motion, AnimatePresence } from "framer-motion";
 import { toast } from "sonner";
 import { Bell, CheckCheck } from "lucide-react";
@@ -41,6 +41,12 @@ export function NotificationsBell({
   const [unreadCount, setUnreadCount] = useState(0);
   const [items, setItems] = useState<Notif[]>([]);
 
+  // Read by the live-update handler without reconnecting the stream on every toggle
+  const openRef = useRef(open);
+  useEffect(() => {
+    openRef.current = open;
+  }, [open]);
+
   const fmt = useMemo(
     () =>
       new Intl.DateTimeFormat("en-PH", {
@@ -114,44 +120,39 @@ export function NotificationsBell({
     }
   }
 
-  // Poll for updates when logged in (and refresh on focus)
+  // Live badge via Server-Sent Events; the list itself is fetched when the popover opens.
+  // Browsers without EventSource fall back to the old 8s poll.
   useEffect(() => {
     if (!isLoggedIn) return;
 
-    let id: number | null = null;
+    load();
 
-    const start = () => {
-      if (id != null) return;
-      id = window.setInterval(() => {
+    if (typeof EventSource === "undefined") {
+      const id = window.setInterval(() => {
         // if popover is open, we already refresh on open; avoid flicker
-        if (!open) load();
+        if (!openRef.current) load();
       }, 8000);
-    };
-
-    const stop = () => {
-      if (id == null) return;
-      window.clearInterval(id);
-      id = null;
-    };
-
-    const onFocus = () => load();
-    const onVisibility = () => {
-      if (document.visibilityState === "visible") load();
-    };
+      return () => window.clearInterval(id);
+    }
 
-    load();
-    start();
+    const es = new EventSource("/api/notifications/stream");
+    let last: number | null = null;
 
-    window.addEventListener("focus", onFocus);
-    document.addEventListener("visibilitychange", onVisibility);
+    es.addEventListener("unread", (e) => {
+      try {
+        const next = Number(JSON.parse((e as MessageEvent).data)?.unreadCount || 0);
+        setUnreadCount(next);
+        // something new arrived while the list is on screen
+        if (openRef.current && last !== null && next > last) load();
+        last = next;
+      } catch {
+        // ignore malformed event
+      }
+    });
 
-    return () => {
-      stop();
-      window.removeEventListener("focus", onFocus);
-      document.removeEventListener("visibilitychange", onVisibility);
-    };
+    return () => es.close();
     // eslint-disable-next-line react-hooks/exhaustive-deps
-  }, [isLoggedIn, open]);
+  }, [isLoggedIn]);
 
 // Refresh when opened
   useEffect(() => {
@@ -111,14 +111,12 @@ export function ProfileView({ initialUser }: { initialUser: ProfileUser }) {
     setAvatarPreview(previewUrl);
     setAvatarBusy(true);
 
-    const form = new FormData();
-    form.append("file", file);
-
     void (async () => {
       try {
         const uploadRes = await fetch("/api/uploads/avatar", {
           method: "POST",
-          body: form,
+          headers: { "content-type": file.type },
+          body: file,
         });
         const uploadJson = await uploadRes.json().catch(() => ({}));
         if (!uploadRes.ok || !uploadJson?.ok || !uploadJson?.url) {
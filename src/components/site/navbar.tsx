@@ -25,6 +25,7 @@ import { Avatar, AvatarFallback, AvatarImage } from "@/components/ui/avatar";
 import { Badge } from "@/components/ui/badge";
 import { NotificationsBell } from "@/components/notifications/notifications-bell";
 import { cn } from "@/lib/utils";
+import { imageVariant } from "@/lib/image-variants";
 
 type Session = {
   userId: number;
@@ -388,7 +389,7 @@ export function Navbar() {
               <motion.div whileHover={{ scale: 1.04 }} whileTap={{ scale: 0.98 }}>
                 <Link href="/profile" aria-label="Open profile" title="Profile">
                   <Avatar className="group size-9 shadow-[0_10px_24px_rgba(127,1,1,0.18)] transition hover:shadow-[0_14px_32px_rgba(127,1,1,0.28)]">
-                    {avatarUrl ? <AvatarImage src={avatarUrl} alt={session.name} /> : null}
+                    {avatarUrl ? <AvatarImage src={imageVariant(avatarUrl, "thumb")} alt={session.name} /> : null}
                     <AvatarFallback className="text-xs">{initials}</AvatarFallback>
                     <span className="pointer-events-none absolute inset-0 rounded-full opacity-0 blur-md transition group-hover:opacity-100 group-hover:blur-xl bg-[#7F0101]/20" />
                   </Avatar>
@@ -47,7 +47,7 @@ export function NewFoundForm() {
   async function loadOptions() {
     setLoadingOptions(true);
     try {
-      const res = await fetch("/api/meta/options", { cache: "no-store" });
+      const res = await fetch("/api/meta/options", { cache: "no-cache" });
       const data = await res.json();
       if (!res.ok || !data?.ok) {
         toast.error(data?.error || "Failed to load options.");
@@ -29,6 +29,7 @@ import { Input } from "@/components/ui/input";
 import { ClaimActions } from "@/components/staff/claim-actions";
 import { EmptyState, LoadingGrid } from "@/components/ui/empty-state";
 import { toast } from "sonner";
+import { imageVariant } from "@/lib/image-variants";
 
 type ClaimRow = {
   claim_id: number;
@@ -357,7 +358,7 @@ export function StaffDashboardView({
                       <div className="flex min-w-0 items-start gap-4">
                         <div className="relative h-24 w-32 overflow-hidden rounded-2xl bg-[#F8F7F6] ring-1 ring-black/5">
                           <Image
-                            src={c.found_item.image || "/found-placeholder.svg"}
+                            src={c.found_item.image ? imageVariant(c.found_item.image, "thumb") : "/found-placeholder.svg"}
                             alt={c.found_item.item_name}
                             fill
                             className="object-contain"
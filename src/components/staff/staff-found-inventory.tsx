@@ -35,6 +35,7 @@ import {
   SelectTrigger,
   SelectValue,
 } from "@/components/ui/select";
+import { imageVariant } from "@/lib/image-variants";
 
 type Category = { category_id: number; category_name: string };
 type Location = { location_id: number; location_name: string };
@@ -135,7 +136,7 @@ export function StaffFoundInventory({ role }: { role: string }) {
   async function loadOptions() {
     setOptionsLoading(true);
     try {
-      const res = await fetch("/api/meta/options", { cache: "no-store" });
+      const res = await fetch("/api/meta/options", { cache: "no-cache" });
       const data = await res.json();
       if (!res.ok || !data?.ok) {
         toast.error(data?.error || "Failed to load filters.");
@@ -706,7 +707,7 @@ export function StaffFoundInventory({ role }: { role: string }) {
         ) : (
           <div className="grid gap-3 sm:grid-cols-2 lg:grid-cols-3">
             {items.map((it) => {
-              const src = it.image || "/found-placeholder.svg";
+              const src = it.image ? imageVariant(it.image, "md") : "/found-placeholder.svg";
               const statusLabel =
                 STATUS_OPTIONS.find((s) => s.value === it.status)?.label ?? String(it.status || "");
               const selected = !!selectedIds[it.found_id];
@@ -8,6 +8,7 @@ import { Card } from "@/components/ui/card";
 import { Separator } from "@/components/ui/separator";
 import { EmptyState } from "@/components/ui/empty-state";
 import { CalendarDays, MapPin, Tag, FileText } from "lucide-react";
+import { imageVariant } from "@/lib/image-variants";
 
 type ReportRow = {
   report_id: number;
@@ -73,7 +74,7 @@ export function StaffReportsView({
       ) : (
         <div className="grid gap-3 sm:grid-cols-2 lg:grid-cols-3">
           {items.map((r, idx) => {
-            const src = r.image || "/found-placeholder.svg";
+            const src = r.image ? imageVariant(r.image, "md") : "/found-placeholder.svg";
             return (
               <motion.div
                 key={r.report_id}
@@ -1,5 +1,8 @@
 import "server-only";
 
+import { prisma } from "@/lib/db";
+import type { Prisma } from "@/generated/prisma/client";
+
 export function getReqIp(req: Request): string | null {
   const xf = req.headers.get("x-forwarded-for");
   if (xf) return xf.split(",")[0]?.trim() || null;
@@ -22,4 +25,230 @@ export type AuditCreate = {
   meta?: any;
   ip?: string | null;
   user_agent?: string | null;
+  created_at?: Date;
+};
+
+/* ---------------- Audit sink ----------------
+ * AUDIT_MODE=durable (default): entries are written inside the caller's transaction,
+ *   as one multi-row insert just before commit. Committed change <=> audit row.
+ * AUDIT_MODE=buffered: entries are queued after the transaction commits and flushed
+ *   in multi-row inserts every AUDIT_FLUSH_MS or AUDIT_BATCH_SIZE entries, and on shutdown.
+ *   Each entry is stamped with created_at when queued, so flush delays don't reorder the log.
+ *   While the database is unreachable, batches are re-queued and retried; when it is reachable
+ *   but a batch still fails, rows are retried one by one and any row that fails on its own is
+ *   logged in full and counted once in stats.failed (it can never succeed, so it isn't retried).
+ *   Cheaper on hot paths, but a hard kill (SIGKILL, OOM, crash) loses what is buffered: about
+ *   AUDIT_FLUSH_MS of entries, more during a database outage (see getAuditStats()).
+ *   On SIGTERM/SIGINT the buffer is flushed (for at most AUDIT_SHUTDOWN_MS) before exiting.
+ *   Under `next start`, set NEXT_MANUAL_SIG_HANDLE=true so Next leaves the signals to us;
+ *   otherwise its own handler exits before the flush finishes.
+ */
+
+type AuditMode = "durable" | "buffered";
+
+function envInt(name: string, fallback: number) {
+  const n = Number(process.env[name]);
+  return Number.isFinite(n) && n > 0 ? Math.floor(n) : fallback;
+}
+
+const AUDIT_MODE: AuditMode =
+  String(process.env.AUDIT_MODE || "").trim().toLowerCase() === "buffered" ? "buffered" : "durable";
+const AUDIT_BATCH_SIZE = envInt("AUDIT_BATCH_SIZE", 200);
+const AUDIT_FLUSH_MS = envInt("AUDIT_FLUSH_MS", 1000);
+// Past this, new entries are dropped (and counted) instead of growing memory without bound
+const AUDIT_MAX_BUFFER = envInt("AUDIT_MAX_BUFFER", 10_000);
+// How long a SIGTERM/SIGINT waits for the final flush before exiting anyway
+const AUDIT_SHUTDOWN_MS = envInt("AUDIT_SHUTDOWN_MS", 5000);
+
+type AuditSinkState = {
+  buffer: AuditCreate[];
+  timer: ReturnType<typeof setTimeout> | null;
+  flushing: Promise<void> | null;
+  hooksInstalled: boolean;
+  stats: { written: number; failed: number; dropped: number };
 };
+
+// Survives dev hot reload, like the Prisma client in db.ts
+const globalForAudit = globalThis as unknown as { auditSink?: AuditSinkState };
+const sink: AuditSinkState = (globalForAudit.auditSink ??= {
+  buffer: [],
+  timer: null,
+  flushing: null,
+  hooksInstalled: false,
+  stats: { written: 0, failed: 0, dropped: 0 },
+});
+
+function enqueue(entries: AuditCreate[]) {
+  const room = Math.max(0, AUDIT_MAX_BUFFER - sink.buffer.length);
+  if (entries.length > room) {
+    sink.stats.dropped += entries.length - room;
+    console.warn(`Audit buffer full: dropped ${entries.length - room} entries`);
+  }
+  // The time of the action, not of the flush
+  const now = new Date();
+  sink.buffer.push(...entries.slice(0, room).map((e) => ({ ...e, created_at: e.created_at ?? now })));
+
+  installShutdownHooks();
+
+  if (sink.buffer.length >= AUDIT_BATCH_SIZE) {
+    void flushAudit();
+  } else if (!sink.timer) {
+    sink.timer = setTimeout(() => void flushAudit(), AUDIT_FLUSH_MS);
+    sink.timer.unref?.();
+  }
+}
+
+// A failed batch goes back to the front of the buffer, as far as AUDIT_MAX_BUFFER allows
+function requeue(batch: AuditCreate[]) {
+  const room = Math.max(0, AUDIT_MAX_BUFFER - sink.buffer.length);
+  const kept = batch.slice(0, room);
+  const lost = batch.slice(room);
+  sink.buffer.unshift(...kept);
+
+  if (lost.length) {
+    sink.stats.dropped += lost.length;
+    // Last record of these rows; log them in full so they can be replayed by hand
+    console.error(`Audit buffer full: dropped ${lost.length} entries after a failed flush`, JSON.stringify(lost));
+  }
+
+  if (!sink.timer) {
+    sink.timer = setTimeout(() => void flushAudit(), AUDIT_FLUSH_MS);
+    sink.timer.unref?.();
+  }
+}
+
+async function databaseReachable() {
+  try {
+    await prisma.$queryRaw`SELECT 1`;
+    return true;
+  } catch {
+    return false;
+  }
+}
+
+/**
+ * Insert one batch. Returns the rows to re-queue (non-empty only while the database is down).
+ * A batch that fails with the database up holds at least one bad row (e.g. a dangling FK):
+ * rows are then inserted one by one and the ones that still fail are dead-lettered to the log.
+ */
+async function writeBatch(batch: AuditCreate[]): Promise<AuditCreate[]> {
+  try {
+    const res = await prisma.auditLog.createMany({ data: batch });
+    sink.stats.written += res.count;
+    return [];
+  } catch (e) {
+    if (!(await databaseReachable())) {
+      console.error("Audit flush failed (database unreachable):", e);
+      return batch;
+    }
+  }
+
+  for (let i = 0; i < batch.length; i++) {
+    try {
+      await prisma.auditLog.create({ data: batch[i] });
+      sink.stats.written++;
+    } catch (e) {
+      if (!(await databaseReachable())) return batch.slice(i);
+      sink.stats.failed++;
+      console.error("Audit entry rejected; dropping it:", JSON.stringify(batch[i]), e);
+    }
+  }
+  return [];
+}
+
+/** Write everything buffered so far. Safe to call concurrently; no-op in durable mode. */
+export async function flushAudit(): Promise<void> {
+  if (sink.timer) {
+    clearTimeout(sink.timer);
+    sink.timer = null;
+  }
+  if (sink.flushing) await sink.flushing;
+  if (!sink.buffer.length) return;
+
+  sink.flushing = (async () => {
+    while (sink.buffer.length) {
+      const batch = sink.buffer.splice(0, AUDIT_BATCH_SIZE);
+      const retry = await writeBatch(batch);
+      if (retry.length) {
+        requeue(retry);
+        // Database is down: retry on the next tick of the timer, not in a tight loop
+        break;
+      }
+    }
+  })();
+
+  try {
+    await sink.flushing;
+  } finally {
+    sink.flushing = null;
+  }
+}
+
+function installShutdownHooks() {
+  if (sink.hooksInstalled || typeof process === "undefined" || typeof process.once !== "function") return;
+  sink.hooksInstalled = true;
+
+  process.once("beforeExit", () => void flushAudit());
+
+  // A signal listener replaces Node's default exit, so exit ourselves once the flush is done
+  // (or AUDIT_SHUTDOWN_MS has passed), with the conventional 128 + signal number status.
+  for (const [signal, signo] of [
+    ["SIGTERM", 15],
+    ["SIGINT", 2],
+  ] as const) {
+    process.once(signal, () => {
+      const deadline = new Promise<void>((resolve) => setTimeout(resolve, AUDIT_SHUTDOWN_MS));
+      void Promise.race([flushAudit(), deadline])
+        .catch((err) => console.error("Audit flush on shutdown failed:", err))
+        .finally(() => {
+          if (sink.buffer.length) {
+            // Last record of these rows; log them in full so they can be replayed by hand
+            console.error(`Audit: exiting with ${sink.buffer.length} entries unflushed`, JSON.stringify(sink.buffer));
+          }
+          process.exit(128 + signo);
+        });
+    });
+  }
+}
+
+export function getAuditStats() {
+  return { mode: AUDIT_MODE, buffered: sink.buffer.length, ...sink.stats };
+}
+
+/**
+ * prisma.$transaction with an audit collector.
+ * Routes call `audit({...})` instead of `tx.auditLog.create(...)`; where the rows go
+ * depends on AUDIT_MODE (see above). Entries from a rolled-back transaction are never written.
+ */
+export async function auditedTransaction<T>(
+  fn: (tx: Prisma.TransactionClient, audit: (entry: AuditCreate | AuditCreate[]) => void) => Promise<T>
+): Promise<T> {
+  const pending: AuditCreate[] = [];
+  const audit = (entry: AuditCreate | AuditCreate[]) => {
+    if (Array.isArray(entry)) pending.push(...entry);
+    else pending.push(entry);
+  };
+
+  const result = await prisma.$transaction(async (tx) => {
+    const out = await fn(tx, audit);
+    if (AUDIT_MODE === "durable" && pending.length) {
+      await tx.auditLog.createMany({ data: pending });
+    }
+    return out;
+  });
+
+  if (AUDIT_MODE === "buffered" && pending.length) enqueue(pending);
+  return result;
+}
+
+/**
+ * Audit outside a transaction (best-effort call sites like profile updates).
+ * Durable mode awaits the insert; buffered mode just queues it.
+ */
+export async function recordAudit(entry: AuditCreate): Promise<void> {
+  if (AUDIT_MODE === "buffered") {
+    enqueue([entry]);
+    return;
+  }
+  await prisma.auditLog.create({ data: entry });
+}
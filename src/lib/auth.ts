@@ -1,19 +1,33 @@
 import "server-only";
-import bcrypt from "bcryptjs";
+import { createHash } from "crypto";
 import { SignJWT, jwtVerify } from "jose";
+import { bcryptCompare, bcryptHash, bcryptRounds } from "@/lib/password-pool";
+
+export { PasswordPoolBusyError } from "@/lib/password-pool";
 
 const secret = process.env.AUTH_SECRET;
 if (!secret) throw new Error("Missing AUTH_SECRET in .env");
 
 const key = new TextEncoder().encode(secret);
 
+// BCRYPT_COST (default 12): hashes made with another cost are upgraded on the next login
+const BCRYPT_COST = (() => {
+  const n = Number(process.env.BCRYPT_COST);
+  return Number.isInteger(n) && n >= 4 && n <= 31 ? n : 12;
+})();
+
+// Both run on the password worker pool and throw PasswordPoolBusyError when it's saturated
 export async function hashPassword(password: string) {
-  // 12 rounds is a good dev/prod default
-  return bcrypt.hash(password, 12);
+  return bcryptHash(password, BCRYPT_COST);
 }
 
 export async function verifyPassword(password: string, hashed: string) {
-  return bcrypt.compare(password, hashed);
+  return bcryptCompare(password, hashed);
+}
+
+export function passwordNeedsRehash(hashed: string) {
+  const rounds = bcryptRounds(hashed);
+  return rounds !== null && rounds !== BCRYPT_COST;
 }
 
 // What we store in the session token
@@ -25,18 +39,98 @@ export type SessionPayload = {
   avatarUrl?: string | null;
 };
 
-export async function createSessionToken(payload: SessionPayload) {
-  // 7 days
-  const expSeconds = 60 * 60 * 24 * 7;
+// 7 days
+const SESSION_TTL_SECONDS = 60 * 60 * 24 * 7;
 
+export async function createSessionToken(payload: SessionPayload) {
   return new SignJWT(payload)
     .setProtectedHeader({ alg: "HS256" })
     .setIssuedAt()
-    .setExpirationTime(`${expSeconds}s`)
+    .setExpirationTime(`${SESSION_TTL_SECONDS}s`)
     .sign(key);
 }
 
+/* ---------------- Verified-token cache ----------------
+ * jwtVerify (HMAC + claim checks) used to run on every getSession() call.
+ * Verified payloads are kept in a bounded LRU keyed by sha256(token) (raw tokens never
+ * sit in memory as keys) and expire with the token's own `exp`.
+ * revokeUserSessions() rejects a user's tokens issued up to now. It only affects THIS process:
+ * with several instances, the others keep accepting the old tokens until they expire.
+ */
+
+const TOKEN_CACHE_MAX = 5_000;
+
+type CachedToken = { payload: SessionPayload; iat: number; expMs: number };
+
+const globalForAuth = globalThis as unknown as {
+  sessionTokenCache?: Map<string, CachedToken>;
+  sessionRevokedAt?: Map<number, number>;
+};
+// Survive dev hot reload, like the Prisma client in db.ts
+const tokenCache = (globalForAuth.sessionTokenCache ??= new Map());
+// userId -> unix seconds; tokens with `iat` at or before it are rejected.
+// Entries are pruned once older than SESSION_TTL_SECONDS: every token they cover has expired.
+const revokedAt = (globalForAuth.sessionRevokedAt ??= new Map());
+
+function tokenKey(token: string) {
+  return createHash("sha256").update(token).digest("base64url");
+}
+
+function isRevoked(userId: number, iat: number) {
+  const cutoff = revokedAt.get(userId);
+  // `iat` has whole-second resolution, so a token from the revocation second is rejected too
+  // (at worst a user who signs in that same second has to sign in once more)
+  return cutoff !== undefined && iat <= cutoff;
+}
+
 export async function verifySessionToken(token: string) {
+  const k = tokenKey(token);
+  const now = Date.now();
+
+  const hit = tokenCache.get(k);
+  if (hit) {
+    tokenCache.delete(k);
+    if (hit.expMs > now) {
+      if (isRevoked(hit.payload.userId, hit.iat)) throw new Error("Session revoked");
+      tokenCache.set(k, hit); // most recently used goes last
+      return hit.payload;
+    }
+  }
+
   const { payload } = await jwtVerify(token, key);
-  return payload as unknown as SessionPayload;
+  const session = Object.freeze({
+    ...(payload as unknown as SessionPayload),
+    role: String(payload.role || "").toUpperCase() as SessionPayload["role"],
+  });
+  const iat = Number(payload.iat || 0);
+
+  if (isRevoked(session.userId, iat)) throw new Error("Session revoked");
+
+  // Tokens without exp aren't cached: nothing bounds how long they'd stay valid
+  if (typeof payload.exp === "number") {
+    tokenCache.set(k, { payload: session, iat, expMs: payload.exp * 1000 });
+    if (tokenCache.size > TOKEN_CACHE_MAX) {
+      const oldest = tokenCache.keys().next().value;
+      if (oldest !== undefined) tokenCache.delete(oldest);
+    }
+  }
+
+  return session;
+}
+
+/**
+ * Invalidate every session token issued to `userId` so far (role/status changed).
+ * The user has to sign in again to get a token with the new role.
+ * Per process: other instances keep accepting old tokens until they expire.
+ */
+export function revokeUserSessions(userId: number) {
+  const nowSeconds = Math.floor(Date.now() / 1000);
+  for (const [uid, cutoff] of revokedAt) {
+    if (cutoff <= nowSeconds - SESSION_TTL_SECONDS) revokedAt.delete(uid);
+  }
+
+  revokedAt.set(userId, nowSeconds);
+  for (const [k, v] of tokenCache) {
+    if (v.payload.userId === userId) tokenCache.delete(k);
+  }
 }
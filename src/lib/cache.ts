@@ -0,0 +1,45 @@
+import "server-only";
+
+/**
+ * Tiny in-process TTL cache around an async loader.
+ * - Concurrent misses share one in-flight load.
+ * - invalidate() drops the value and discards any load that started before it,
+ *   so a write followed by a read never sees pre-write data from this process.
+ * Per process only: other instances catch up when their TTL expires.
+ */
+export function createTtlCache<T>(opts: { ttlMs: number; load: () => Promise<T> }) {
+  let entry: { value: T; at: number } | null = null;
+  let inflight: Promise<{ value: T; at: number }> | null = null;
+  let generation = 0;
+
+  function refresh() {
+    const gen = generation;
+    const p = opts.load().then((value) => {
+      const fresh = { value, at: Date.now() };
+      if (gen === generation) entry = fresh;
+      return fresh;
+    });
+    inflight = p;
+    p.catch(() => {}).finally(() => {
+      if (inflight === p) inflight = null;
+    });
+    return p;
+  }
+
+  return {
+    /** Returns the value and when it was loaded; `fresh` skips the cached value. */
+    async get(fresh = false): Promise<{ value: T; at: number; cached: boolean }> {
+      if (!fresh && entry && Date.now() - entry.at < opts.ttlMs) {
+        return { ...entry, cached: true };
+      }
+      const loaded = await (fresh || !inflight ? refresh() : inflight);
+      return { ...loaded, cached: false };
+    },
+
+    invalidate() {
+      generation++;
+      entry = null;
+      inflight = null;
+    },
+  };
+}
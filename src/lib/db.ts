@@ -1,30 +1,315 @@
 import "server-only";
 
-import { Pool } from "pg";
+import { AsyncLocalStorage } from "async_hooks";
+import { performance } from "perf_hooks";
+import { Pool, type PoolConfig } from "pg";
 import { PrismaPg } from "@prisma/adapter-pg";
 import { PrismaClient } from "@/generated/prisma/client";
 
+/* ---------------- Pools ----------------
+ * Primary (DATABASE_URL): all writes, and reads that must see them.
+ *   DB_POOL_MAX (10), DB_POOL_IDLE_MS (10000), DB_POOL_CONNECT_TIMEOUT_MS (none),
+ *   DB_STATEMENT_TIMEOUT_MS (none), DB_IDLE_TX_TIMEOUT_MS (none).
+ * Replica (DATABASE_REPLICA_URL, optional): `prismaRead`, for list/report/search reads that
+ *   tolerate replication lag. DB_REPLICA_POOL_MAX and DB_REPLICA_STATEMENT_TIMEOUT_MS override
+ *   the primary's values; connects time out after DB_REPLICA_CONNECT_TIMEOUT_MS (2000).
+ *   When the replica can't be reached, checkouts fall back to the primary and the replica is
+ *   retried after DB_REPLICA_RETRY_MS (30000). Without a replica URL, prismaRead === prisma.
+ *
+ * ---------------- Query instrumentation (opt-in) ----------------
+ * DB_METRICS=1: every Prisma operation is timed and attributed to the route that issued it
+ *   (handlers wrapped in instrumentRoute()), and pool checkouts are timed.
+ *   Exposed as Prometheus text by /api/admin/metrics (see renderDbMetrics).
+ * DB_SLOW_QUERY_MS=<ms>: log operations slower than this (also turns instrumentation on).
+ *   Only the argument keys are logged, never values.
+ * Off by default: the clients are then plain PrismaClients and instrumentRoute() is a no-op.
+ */
+
+function envInt(name: string) {
+  const n = Number(process.env[name]);
+  return Number.isFinite(n) && n > 0 ? Math.floor(n) : null;
+}
+
+const SLOW_QUERY_MS = envInt("DB_SLOW_QUERY_MS");
+const METRICS_ON = process.env.DB_METRICS === "1" || process.env.DB_METRICS === "true" || SLOW_QUERY_MS !== null;
+
+const REPLICA_URL = process.env.DATABASE_REPLICA_URL?.trim() || null;
+const REPLICA_RETRY_MS = envInt("DB_REPLICA_RETRY_MS") ?? 30_000;
+
+// Unset values are left out so pg keeps its own defaults
+function poolConfig(connectionString: string | undefined, o: Record<string, number | null>): PoolConfig {
+  const config: PoolConfig = { connectionString, application_name: "foundit" };
+  if (o.max) config.max = o.max;
+  if (o.idle) config.idleTimeoutMillis = o.idle;
+  if (o.connect) config.connectionTimeoutMillis = o.connect;
+  if (o.statement) config.statement_timeout = o.statement;
+  if (o.idleTx) config.idle_in_transaction_session_timeout = o.idleTx;
+  return config;
+}
+
+const PRIMARY_CONFIG = poolConfig(process.env.DATABASE_URL, {
+  max: envInt("DB_POOL_MAX"),
+  idle: envInt("DB_POOL_IDLE_MS"),
+  connect: envInt("DB_POOL_CONNECT_TIMEOUT_MS"),
+  statement: envInt("DB_STATEMENT_TIMEOUT_MS"),
+  idleTx: envInt("DB_IDLE_TX_TIMEOUT_MS"),
+});
+
+const REPLICA_CONFIG = poolConfig(REPLICA_URL ?? undefined, {
+  max: envInt("DB_REPLICA_POOL_MAX") ?? envInt("DB_POOL_MAX"),
+  idle: envInt("DB_POOL_IDLE_MS"),
+  connect: envInt("DB_REPLICA_CONNECT_TIMEOUT_MS") ?? 2_000,
+  statement: envInt("DB_REPLICA_STATEMENT_TIMEOUT_MS") ?? envInt("DB_STATEMENT_TIMEOUT_MS"),
+  idleTx: envInt("DB_IDLE_TX_TIMEOUT_MS"),
+});
+
+// Seconds; shared by query and pool-wait histograms
+const BUCKETS = [0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5];
+
+type Target = "primary" | "replica";
+
+type Histogram = { counts: number[]; sum: number; count: number };
+
+type DbMetricsState = {
+  // `${db}\u0000${route}\u0000${model}\u0000${operation}` -> histogram
+  queries: Map<string, Histogram>;
+  errors: Map<string, number>;
+  slow: number;
+  poolWait: Record<Target, Histogram>;
+  replicaFallbacks: number;
+  replicaDownUntil: number;
+};
+
 const globalForPrisma = globalThis as unknown as {
   prisma?: PrismaClient;
+  prismaRead?: PrismaClient;
   pool?: Pool;
+  replicaPool?: Pool | null;
+  dbMetrics?: DbMetricsState;
 };
 
-export const pool =
-  globalForPrisma.pool ??
-  new Pool({
-    connectionString: process.env.DATABASE_URL,
+// Survives dev hot reload, like the clients below
+const metrics: DbMetricsState = (globalForPrisma.dbMetrics ??= {
+  queries: new Map(),
+  errors: new Map(),
+  slow: 0,
+  poolWait: { primary: newHistogram(), replica: newHistogram() },
+  replicaFallbacks: 0,
+  replicaDownUntil: 0,
+});
+
+const routeScope = new AsyncLocalStorage<string>();
+
+function newHistogram(): Histogram {
+  return { counts: BUCKETS.map(() => 0), sum: 0, count: 0 };
+}
+
+function observe(h: Histogram, seconds: number) {
+  h.sum += seconds;
+  h.count++;
+  for (let i = 0; i < BUCKETS.length; i++) if (seconds <= BUCKETS[i]) h.counts[i]++;
+}
+
+function recordQuery(db: Target, model: string, operation: string, ms: number, failed: boolean, args: unknown) {
+  const route = routeScope.getStore() ?? "unattributed";
+  const key = `${db}\u0000${route}\u0000${model}\u0000${operation}`;
+
+  let h = metrics.queries.get(key);
+  if (!h) metrics.queries.set(key, (h = newHistogram()));
+  observe(h, ms / 1000);
+  if (failed) metrics.errors.set(key, (metrics.errors.get(key) || 0) + 1);
+
+  if (SLOW_QUERY_MS !== null && ms >= SLOW_QUERY_MS) {
+    metrics.slow++;
+    const keys = args && typeof args === "object" ? Object.keys(args).join(",") : "";
+    console.warn(`[slow-query] ${ms.toFixed(1)}ms ${model}.${operation} db=${db} route=${route} args={${keys}}`);
+  }
+}
+
+type ConnectCallback = (...a: unknown[]) => void;
+type Connect = (cb?: ConnectCallback) => Promise<unknown> | void;
+
+/** Replace pool.connect (which pool.query also goes through) with `wrap(original)`. */
+function wrapConnect(p: Pool, wrap: (connect: () => Promise<unknown>) => () => Promise<unknown>) {
+  const original = p.connect.bind(p) as Connect;
+  const next = wrap(() => original() as Promise<unknown>);
+  p.connect = ((cb?: ConnectCallback) => {
+    if (!cb) return next();
+    next().then(
+      (client) => cb(undefined, client, (client as { release: (e?: unknown) => void }).release.bind(client)),
+      (err) => cb(err)
+    );
+  }) as Pool["connect"];
+}
+
+function createPool(target: Target, config: PoolConfig) {
+  const p = new Pool(config);
+  if (!METRICS_ON) return p;
+
+  // Time from asking for a connection to getting one
+  wrapConnect(p, (connect) => async () => {
+    const t0 = performance.now();
+    const client = await connect();
+    observe(metrics.poolWait[target], (performance.now() - t0) / 1000);
+    return client;
   });
+  return p;
+}
 
-const adapter = new PrismaPg(pool);
+/**
+ * Checkouts from the replica fall back to a primary connection while the replica is unreachable.
+ * Only connection failures fall back; a query that already started is never re-run elsewhere.
+ */
+function withPrimaryFallback(replica: Pool, primary: Pool) {
+  wrapConnect(replica, (connect) => async () => {
+    if (Date.now() < metrics.replicaDownUntil) {
+      metrics.replicaFallbacks++;
+      return primary.connect();
+    }
+    try {
+      return await connect();
+    } catch (err) {
+      console.error(`Read replica unreachable, using primary for ${REPLICA_RETRY_MS}ms:`, err);
+      metrics.replicaDownUntil = Date.now() + REPLICA_RETRY_MS;
+      metrics.replicaFallbacks++;
+      return primary.connect();
+    }
+  });
+  return replica;
+}
 
-export const prisma =
-  globalForPrisma.prisma ??
-  new PrismaClient({
+function createClient(target: Target, adapter: PrismaPg) {
+  const base = new PrismaClient({
     adapter,
   });
+  if (!METRICS_ON) return base;
+
+  // Query-only extension: the client API is unchanged, so it keeps the plain client type
+  return base.$extends({
+    query: {
+      async $allOperations({ model, operation, args, query }) {
+        const t0 = performance.now();
+        let failed = false;
+        try {
+          return await query(args);
+        } catch (err) {
+          failed = true;
+          throw err;
+        } finally {
+          recordQuery(target, model ?? "$raw", operation, performance.now() - t0, failed, args);
+        }
+      },
+    },
+  }) as unknown as PrismaClient;
+}
+
+export const pool = globalForPrisma.pool ?? createPool("primary", PRIMARY_CONFIG);
+
+export const prisma = globalForPrisma.prisma ?? createClient("primary", new PrismaPg(pool));
+
+const replicaPool =
+  globalForPrisma.replicaPool !== undefined
+    ? globalForPrisma.replicaPool
+    : REPLICA_URL
+      ? withPrimaryFallback(createPool("replica", REPLICA_CONFIG), pool)
+      : null;
+
+/**
+ * Read-only client for list/report/search queries that can tolerate replication lag.
+ * Never use it for reads that must see the caller's own just-committed write.
+ */
+export const prismaRead: PrismaClient =
+  globalForPrisma.prismaRead ?? (replicaPool ? createClient("replica", new PrismaPg(replicaPool)) : prisma);
 
 // Prevent exhausting connections in dev (hot reload)
 if (process.env.NODE_ENV !== "production") {
   globalForPrisma.prisma = prisma;
+  globalForPrisma.prismaRead = prismaRead;
   globalForPrisma.pool = pool;
+  globalForPrisma.replicaPool = replicaPool;
+}
+
+/**
+ * Attribute the queries a route handler runs to `route` (e.g. "GET /api/found/list").
+ * Returns the handler itself when instrumentation is off.
+ */
+export function instrumentRoute<A extends unknown[], R>(
+  route: string,
+  handler: (...args: A) => Promise<R>
+): (...args: A) => Promise<R> {
+  if (!METRICS_ON) return handler;
+  return (...args: A) => routeScope.run(route, () => handler(...args));
+}
+
+function esc(v: string) {
+  return v.replace(/\\/g, "\\\\").replace(/"/g, '\\"').replace(/\n/g, "\\n");
+}
+
+function histogramLines(name: string, labels: string, h: Histogram) {
+  const lines = BUCKETS.map((le, i) => `${name}_bucket{${labels},le="${le}"} ${h.counts[i]}`);
+  lines.push(`${name}_bucket{${labels},le="+Inf"} ${h.count}`);
+  lines.push(`${name}_sum{${labels}} ${h.sum.toFixed(6)}`);
+  lines.push(`${name}_count{${labels}} ${h.count}`);
+  return lines;
+}
+
+function queryLabels(key: string) {
+  const [db, route, model, operation] = key.split("\u0000");
+  return `db="${db}",route="${esc(route)}",model="${esc(model)}",operation="${esc(operation)}"`;
+}
+
+/** Prometheus text exposition of the query/pool metrics above. */
+export function renderDbMetrics() {
+  const out: string[] = [];
+  const pools: Array<[Target, Pool]> = replicaPool ? [["primary", pool], ["replica", replicaPool]] : [["primary", pool]];
+
+  out.push("# HELP foundit_db_instrumented Whether query instrumentation is on (DB_METRICS / DB_SLOW_QUERY_MS).");
+  out.push("# TYPE foundit_db_instrumented gauge");
+  out.push(`foundit_db_instrumented ${METRICS_ON ? 1 : 0}`);
+
+  out.push("# HELP foundit_db_query_duration_seconds Prisma operation duration by database, route, model and operation.");
+  out.push("# TYPE foundit_db_query_duration_seconds histogram");
+  for (const [key, h] of metrics.queries) {
+    out.push(...histogramLines("foundit_db_query_duration_seconds", queryLabels(key), h));
+  }
+
+  out.push("# HELP foundit_db_query_errors_total Prisma operations that threw.");
+  out.push("# TYPE foundit_db_query_errors_total counter");
+  for (const [key, n] of metrics.errors) {
+    out.push(`foundit_db_query_errors_total{${queryLabels(key)}} ${n}`);
+  }
+
+  out.push(`# HELP foundit_db_slow_queries_total Operations slower than DB_SLOW_QUERY_MS (${SLOW_QUERY_MS ?? "unset"}).`);
+  out.push("# TYPE foundit_db_slow_queries_total counter");
+  out.push(`foundit_db_slow_queries_total ${metrics.slow}`);
+
+  out.push("# HELP foundit_db_pool_wait_seconds Time spent waiting for a pooled connection.");
+  out.push("# TYPE foundit_db_pool_wait_seconds histogram");
+  for (const [target] of pools) {
+    out.push(...histogramLines("foundit_db_pool_wait_seconds", `pool="${target}"`, metrics.poolWait[target]));
+  }
+
+  out.push("# HELP foundit_db_pool_connections Pooled connections by state.");
+  out.push("# TYPE foundit_db_pool_connections gauge");
+  for (const [target, p] of pools) {
+    out.push(`foundit_db_pool_connections{pool="${target}",state="in_use"} ${p.totalCount - p.idleCount}`);
+    out.push(`foundit_db_pool_connections{pool="${target}",state="idle"} ${p.idleCount}`);
+  }
+
+  out.push("# HELP foundit_db_pool_waiting_requests Checkouts queued for a free connection right now.");
+  out.push("# TYPE foundit_db_pool_waiting_requests gauge");
+  for (const [target, p] of pools) {
+    out.push(`foundit_db_pool_waiting_requests{pool="${target}"} ${p.waitingCount}`);
+  }
+
+  if (replicaPool) {
+    out.push("# HELP foundit_db_replica_fallbacks_total Replica checkouts served by the primary instead.");
+    out.push("# TYPE foundit_db_replica_fallbacks_total counter");
+    out.push(`foundit_db_replica_fallbacks_total ${metrics.replicaFallbacks}`);
+    out.push("# HELP foundit_db_replica_up Whether the read replica is currently in use.");
+    out.push("# TYPE foundit_db_replica_up gauge");
+    out.push(`foundit_db_replica_up ${Date.now() < metrics.replicaDownUntil ? 0 : 1}`);
+  }
+
+  return out.join("\n") + "\n";
 }
@@ -0,0 +1,132 @@
+import "server-only";
+
+/* ---------------- Streaming exports ----------------
+ * CSV / NDJSON downloads of whole tables (audit logs, inventory, claims) in constant memory.
+ * Rows are read in keyset chunks (`id > last ORDER BY id LIMIT n`), one chunk per stream pull,
+ * so a slow client applies backpressure to the database reads instead of buffering the table.
+ *
+ * Each chunk is its own short query rather than one DECLARE CURSOR transaction: a download can
+ * take minutes, and a cursor would hold a pooled connection and an old snapshot for all of it.
+ * The trade-off is that rows written mid-export may or may not appear (ids only move forward,
+ * so nothing is duplicated or skipped).
+ *
+ * EXPORT_CHUNK_SIZE: rows per query (default 1000).
+ */
+
+export type ExportFormat = "csv" | "ndjson";
+
+export type ExportColumn<T> = { header: string; value: (row: T) => unknown };
+
+const CHUNK_SIZE = (() => {
+  const n = Number(process.env.EXPORT_CHUNK_SIZE);
+  return Number.isFinite(n) && n >= 100 ? Math.min(10_000, Math.floor(n)) : 1000;
+})();
+
+export function parseExportFormat(raw: string | null): ExportFormat | null {
+  const f = String(raw || "csv").trim().toLowerCase();
+  if (f === "csv" || f === "ndjson") return f;
+  return null;
+}
+
+/**
+ * Read a table in ascending-id chunks. `fetchChunk(afterId, take)` must filter `id > afterId`
+ * (no filter when null) and order by id ascending.
+ */
+export async function* keysetChunks<T>(
+  fetchChunk: (afterId: number | null, take: number) => Promise<T[]>,
+  idOf: (row: T) => number
+): AsyncGenerator<T[]> {
+  let afterId: number | null = null;
+  for (;;) {
+    const rows = await fetchChunk(afterId, CHUNK_SIZE);
+    // Stop on an empty chunk, not a short one: a chunk hydrated from ids can come back short
+    // when rows are deleted mid-export.
+    if (!rows.length) return;
+    yield rows;
+    afterId = idOf(rows[rows.length - 1]);
+  }
+}
+
+function cellText(v: unknown): string {
+  if (v === null || v === undefined) return "";
+  if (v instanceof Date) return v.toISOString();
+  if (typeof v === "object") return JSON.stringify(v);
+  return String(v);
+}
+
+// Spreadsheet apps run cells starting with these as formulas; user text must stay text
+const FORMULA_START = /^[=+\-@\t\r]/;
+
+function csvCell(v: unknown): string {
+  let s = cellText(v);
+  if (typeof v === "string" && FORMULA_START.test(s)) s = `'${s}`;
+  return /[",\r\n]/.test(s) ? `"${s.replace(/"/g, '""')}"` : s;
+}
+
+function jsonValue(v: unknown): unknown {
+  if (v === undefined) return null;
+  if (v instanceof Date) return v.toISOString();
+  return v;
+}
+
+function encodeRows<T>(format: ExportFormat, columns: ExportColumn<T>[], rows: T[]): string {
+  if (format === "csv") {
+    return rows.map((r) => columns.map((c) => csvCell(c.value(r))).join(",") + "\r\n").join("");
+  }
+  return rows
+    .map((r) => JSON.stringify(Object.fromEntries(columns.map((c) => [c.header, jsonValue(c.value(r))]))) + "\n")
+    .join("");
+}
+
+/**
+ * Stream `chunks` as a file download. Headers go out before the first query; a database error
+ * mid-stream aborts the body (the client sees a truncated download, not a 200 that looks complete).
+ */
+export function exportResponse<T>(opts: {
+  filename: string;
+  format: ExportFormat;
+  columns: ExportColumn<T>[];
+  chunks: AsyncGenerator<T[]>;
+}): Response {
+  const { format, columns, chunks } = opts;
+  const encoder = new TextEncoder();
+  let headerSent = format !== "csv";
+
+  const body = new ReadableStream<Uint8Array>({
+    async pull(controller) {
+      try {
+        if (!headerSent) {
+          headerSent = true;
+          // BOM so Excel reads UTF-8 names correctly
+          controller.enqueue(encoder.encode("\uFEFF" + columns.map((c) => csvCell(c.header)).join(",") + "\r\n"));
+          return;
+        }
+
+        const next = await chunks.next();
+        if (next.done) {
+          controller.close();
+          return;
+        }
+        controller.enqueue(encoder.encode(encodeRows(format, columns, next.value)));
+      } catch (err) {
+        console.error(`[export] ${opts.filename} failed:`, err);
+        controller.error(err);
+      }
+    },
+    async cancel() {
+      // Client went away: stop issuing chunk queries
+      await chunks.return(undefined);
+    },
+  });
+
+  const stamp = new Date().toISOString().slice(0, 10);
+  return new Response(body, {
+    status: 200,
+    headers: {
+      "content-type": format === "csv" ? "text/csv; charset=utf-8" : "application/x-ndjson; charset=utf-8",
+      "content-disposition": `attachment; filename="${opts.filename}-${stamp}.${format}"`,
+      "cache-control": "no-store",
+      "x-content-type-options": "nosniff",
+    },
+  });
+}
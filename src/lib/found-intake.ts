@@ -0,0 +1,359 @@
+import "server-only";
+
+import { prisma } from "@/lib/db";
+import { matchTokens } from "@/lib/matching";
+import { foundIndexInput, rankLostForFounds } from "@/lib/match-index";
+import { auditedTransaction } from "@/lib/audit";
+import { getReferenceData } from "@/lib/reference-data";
+
+/* ---------------- Bulk found-item intake ----------------
+ * Rows are validated up front, then inserted in chunks of INTAKE_CHUNK_ROWS, one transaction
+ * per chunk: one multi-row insert, one candidate load + scoring pass for the whole chunk
+ * (rankLostForFounds), one match insert, one summarizing audit row.
+ * A failed chunk is reported row by row and the rest of the batch carries on.
+ * Notifications go out once all chunks are done, so each user gets one for their best match
+ * across the whole batch rather than whatever the first chunk happened to contain.
+ */
+
+export const INTAKE_MAX_ROWS = 1000;
+const INTAKE_CHUNK_ROWS = 100;
+
+// Same thresholds as POST /api/found/create
+const MATCH_K = 30;
+const MATCH_MIN_SCORE = 20;
+const NOTIFY_MIN_SCORE = 40;
+const NOTIFY_PER_ITEM = 10;
+
+export type IntakeRowError = { row: number; error: string };
+
+export type IntakeItem = {
+  row: number;
+  categoryId: number;
+  locationId: number;
+  itemName: string;
+  description: string;
+  storageLocation: string;
+  dateFound: Date;
+  image: string | null;
+};
+
+export type IntakeResult = {
+  created: Array<{ found_id: number; item_name: string }>;
+  errors: IntakeRowError[];
+  matchesInserted: number;
+  notificationsInserted: number;
+};
+
+/* ---------- Parsing ---------- */
+
+/** RFC 4180 CSV: quoted fields may contain commas, quotes ("") and newlines. */
+export function parseCsv(text: string): string[][] {
+  const rows: string[][] = [];
+  let row: string[] = [];
+  let field = "";
+  let quoted = false;
+
+  const src = text.charCodeAt(0) === 0xfeff ? text.slice(1) : text;
+  for (let i = 0; i < src.length; i++) {
+    const c = src[i];
+    if (quoted) {
+      if (c === '"' && src[i + 1] === '"') {
+        field += '"';
+        i++;
+      } else if (c === '"') {
+        quoted = false;
+      } else {
+        field += c;
+      }
+    } else if (c === '"') {
+      quoted = true;
+    } else if (c === ",") {
+      row.push(field);
+      field = "";
+    } else if (c === "\n" || c === "\r") {
+      if (c === "\r" && src[i + 1] === "\n") i++;
+      row.push(field);
+      rows.push(row);
+      row = [];
+      field = "";
+    } else {
+      field += c;
+    }
+  }
+  if (field !== "" || row.length) {
+    row.push(field);
+    rows.push(row);
+  }
+
+  // Blank lines (e.g. a trailing newline) are not rows
+  return rows.filter((r) => r.some((f) => f.trim() !== ""));
+}
+
+/** CSV with a header line -> one object per data row, keyed by header. */
+export function csvRecords(text: string): Record<string, string>[] {
+  const [header, ...rows] = parseCsv(text);
+  if (!header) return [];
+  return rows.map((r) => Object.fromEntries(header.map((h, i) => [h, r[i] ?? ""])));
+}
+
+/* ---------- Validation ---------- */
+
+// "Item Name", "item_name" and "itemName" are all the same column
+const normKey = (k: string) => k.toLowerCase().replace(/[^a-z]/g, "");
+
+const FIELD_ALIASES: Record<string, string> = {
+  itemname: "itemName",
+  name: "itemName",
+  description: "description",
+  storagelocation: "storageLocation",
+  storage: "storageLocation",
+  datefound: "dateFound",
+  date: "dateFound",
+  categoryid: "category",
+  category: "category",
+  locationid: "location",
+  location: "location",
+  image: "image",
+  imageurl: "image",
+};
+
+function canonical(raw: Record<string, unknown>) {
+  const out: Record<string, string> = {};
+  for (const [k, v] of Object.entries(raw)) {
+    const field = FIELD_ALIASES[normKey(k)];
+    if (field && v !== null && v !== undefined) out[field] = String(v).trim();
+  }
+  return out;
+}
+
+// Category/location by id or by (case-insensitive) name
+function resolveRef(value: string | undefined, names: Map<number, string>) {
+  if (!value) return null;
+  const id = Number(value);
+  if (Number.isInteger(id) && names.has(id)) return id;
+  const lower = value.toLowerCase();
+  for (const [refId, name] of names) {
+    if (name.toLowerCase() === lower) return refId;
+  }
+  return null;
+}
+
+/**
+ * Check every row with the same rules as POST /api/found/create (plus the column lengths).
+ * Rows are numbered from 1 in input order.
+ */
+export async function validateIntakeRows(raw: Array<Record<string, unknown>>) {
+  const { categoryNames, locationNames } = await getReferenceData();
+  const items: IntakeItem[] = [];
+  const errors: IntakeRowError[] = [];
+
+  raw.forEach((r, i) => {
+    const row = i + 1;
+    const fail = (error: string) => errors.push({ row, error });
+    const f = canonical(r && typeof r === "object" ? r : {});
+
+    const categoryId = resolveRef(f.category, categoryNames);
+    const locationId = resolveRef(f.location, locationNames);
+    const itemName = f.itemName ?? "";
+    const description = f.description ?? "";
+    const storageLocation = f.storageLocation ?? "";
+    const image = f.image ? f.image : null;
+
+    if (categoryId === null) return fail("Unknown category.");
+    if (locationId === null) return fail("Unknown location.");
+    if (itemName.length < 2) return fail("Item name is required.");
+    if (itemName.length > 100) return fail("Item name is too long (max 100).");
+    if (description.length < 5) return fail("Description is required.");
+    if (storageLocation.length < 2) return fail("Storage location is required.");
+    if (storageLocation.length > 200) return fail("Storage location is too long (max 200).");
+    if (image && image.length > 200) return fail("Image URL is too long (max 200).");
+
+    const dateFound = f.dateFound ? new Date(f.dateFound) : new Date();
+    if (Number.isNaN(dateFound.getTime())) return fail("Invalid dateFound.");
+
+    items.push({ row, categoryId, locationId, itemName, description, storageLocation, dateFound, image });
+  });
+
+  return { items, errors };
+}
+
+/* ---------- Insert ---------- */
+
+// One strong match, resolved to the lost report's owner
+type StrongHit = { userId: number; lostId: number; score: number; reasons: string[]; itemName: string; foundId: number };
+
+type UserHit = { lostId: number; score: number; reasons: string[]; itemName: string; items: Set<number> };
+
+// Fold a match into the user's running best (best match wins; items are counted across the batch)
+function addHit(perUser: Map<number, UserHit>, hit: StrongHit) {
+  const cur = perUser.get(hit.userId);
+  if (!cur) {
+    perUser.set(hit.userId, {
+      lostId: hit.lostId,
+      score: hit.score,
+      reasons: hit.reasons,
+      itemName: hit.itemName,
+      items: new Set([hit.foundId]),
+    });
+    return;
+  }
+  cur.items.add(hit.foundId);
+  if (hit.score > cur.score) {
+    Object.assign(cur, { lostId: hit.lostId, score: hit.score, reasons: hit.reasons, itemName: hit.itemName });
+  }
+}
+
+function notificationFor(userId: number, hit: UserHit) {
+  if (hit.items.size === 1) {
+    return {
+      user_id: userId,
+      type: "MATCH_SUGGESTED",
+      title: "Possible match found",
+      message: `A newly found item "${hit.itemName}" may match your lost report (score ${hit.score}). Reasons: ${hit.reasons
+        .slice(0, 2)
+        .join(", ")}`,
+      href: `/lost/${hit.lostId}`,
+      is_read: false,
+    };
+  }
+  return {
+    user_id: userId,
+    type: "MATCH_SUGGESTED",
+    title: "Possible matches found",
+    message:
+      `${hit.items.size} newly found items may match your lost reports. ` +
+      `Best match: "${hit.itemName}" (score ${hit.score}).`,
+    href: `/lost/${hit.lostId}`,
+    is_read: false,
+  };
+}
+
+async function intakeChunk(
+  chunk: IntakeItem[],
+  ctx: { userId: number; ip: string | null; ua: string | null; chunk: number; chunks: number }
+) {
+  return auditedTransaction(async (tx, audit) => {
+    const found = await tx.foundItem.createManyAndReturn({
+      data: chunk.map((it) => ({
+        user_id: ctx.userId,
+        category_id: it.categoryId,
+        location_id: it.locationId,
+        item_name: it.itemName,
+        description: it.description,
+        date_found: it.dateFound,
+        storage_location: it.storageLocation,
+        image: it.image,
+        status: "NEWLY_FOUND",
+        match_tokens: matchTokens(it.itemName, it.description),
+      })),
+      select: {
+        found_id: true,
+        item_name: true,
+        category_id: true,
+        location_id: true,
+        date_found: true,
+        match_tokens: true,
+      },
+    });
+
+    // One candidate load + scoring pass for the whole chunk
+    const ranked = await rankLostForFounds(tx, found.map(foundIndexInput), {
+      where: { status: "REPORTED_LOST" },
+      k: MATCH_K,
+      minScore: MATCH_MIN_SCORE,
+    });
+
+    const matchRows = found.flatMap((f, i) =>
+      ranked[i].map((s) => ({ lost_id: s.id, found_id: f.found_id, match_score: s.score.toFixed(2) }))
+    );
+    const matchesInserted = matchRows.length
+      ? (await tx.match.createMany({ data: matchRows, skipDuplicates: true })).count
+      : 0;
+
+    // Strong matches, resolved to their owners (notified after the last chunk)
+    const strong = found.flatMap((f, i) =>
+      ranked[i]
+        .filter((s) => s.score >= NOTIFY_MIN_SCORE)
+        .slice(0, NOTIFY_PER_ITEM)
+        .map((s) => ({ found: f, s }))
+    );
+
+    const hits: StrongHit[] = [];
+    if (strong.length) {
+      const owners = await tx.lostItem.findMany({
+        where: { lost_id: { in: [...new Set(strong.map((x) => x.s.id))] } },
+        select: { lost_id: true, user_id: true },
+      });
+      const ownerOf = new Map(owners.map((o) => [o.lost_id, o.user_id] as const));
+
+      for (const { found: f, s } of strong) {
+        const userId = ownerOf.get(s.id);
+        if (userId === undefined) continue;
+        hits.push({ userId, lostId: s.id, score: s.score, reasons: s.reasons, itemName: f.item_name, foundId: f.found_id });
+      }
+    }
+
+    audit({
+      actor_user_id: ctx.userId,
+      action: "FOUND_ITEMS_BULK_CREATED",
+      entity_type: "FoundItem",
+      entity_id: null,
+      summary: `Bulk intake: created ${found.length} found item(s) (chunk ${ctx.chunk} of ${ctx.chunks})`,
+      meta: {
+        found_ids: found.map((f) => f.found_id),
+        rows: [chunk[0].row, chunk[chunk.length - 1].row],
+        status: "NEWLY_FOUND",
+        matches_inserted: matchesInserted,
+      },
+      ip: ctx.ip,
+      user_agent: ctx.ua,
+    });
+
+    return {
+      created: found.map((f) => ({ found_id: f.found_id, item_name: f.item_name })),
+      hits,
+      matchesInserted,
+    };
+  });
+}
+
+/** Insert validated rows chunk by chunk. Chunks that fail are reported per row; the rest commit. */
+export async function intakeFoundItems(
+  items: IntakeItem[],
+  ctx: { userId: number; ip: string | null; ua: string | null }
+): Promise<IntakeResult> {
+  const result: IntakeResult = { created: [], errors: [], matchesInserted: 0, notificationsInserted: 0 };
+  // Best strong match per user over every committed chunk
+  const perUser = new Map<number, UserHit>();
+  const chunks = Math.ceil(items.length / INTAKE_CHUNK_ROWS);
+
+  for (let c = 0; c < chunks; c++) {
+    const chunk = items.slice(c * INTAKE_CHUNK_ROWS, (c + 1) * INTAKE_CHUNK_ROWS);
+    try {
+      const out = await intakeChunk(chunk, { ...ctx, chunk: c + 1, chunks });
+      result.created.push(...out.created);
+      result.matchesInserted += out.matchesInserted;
+      for (const hit of out.hits) addHit(perUser, hit);
+    } catch (err) {
+      console.error(`[found-intake] chunk ${c + 1}/${chunks} failed:`, err);
+      for (const it of chunk) {
+        result.errors.push({ row: it.row, error: "Not saved: this chunk failed. Retry these rows." });
+      }
+    }
+  }
+
+  // One notification per user for the whole batch. The items are already committed, so a
+  // failure here is logged rather than reported as failed rows.
+  if (perUser.size) {
+    try {
+      const res = await prisma.notification.createMany({
+        data: Array.from(perUser.entries()).map(([uid, hit]) => notificationFor(uid, hit)),
+      });
+      result.notificationsInserted = res.count;
+    } catch (err) {
+      console.error("[found-intake] notifications failed:", err);
+    }
+  }
+
+  return result;
+}
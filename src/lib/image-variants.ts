@@ -0,0 +1,44 @@
+// Shared by server (upload pipeline) and client (image consumers): no server-only imports.
+
+export type ImageVariant = "thumb" | "md";
+
+// Target widths; never upscaled
+export const IMAGE_VARIANT_WIDTHS: Record<ImageVariant, number> = {
+  thumb: 320,
+  md: 960,
+};
+
+// Local uploads named by content hash have WebP variants next to them:
+//   /uploads/found/<hash>.jpg -> /uploads/found/<hash>.thumb.webp
+// Older uuid-named uploads (and "-raw" ones stored without an image library) don't.
+const LOCAL_HASHED = /^(\/uploads\/(?:found|lost|avatars)\/[a-f0-9]{32})\.(?:jpg|png|webp|gif)$/;
+
+export function localVariantName(hash: string, variant: ImageVariant) {
+  return `${hash}.${variant}.webp`;
+}
+
+/** Stored variant URLs for a hashed local upload (none for anything else). */
+export function localVariantUrls(src: string): string[] {
+  const local = LOCAL_HASHED.exec(src);
+  if (!local) return [];
+  return (Object.keys(IMAGE_VARIANT_WIDTHS) as ImageVariant[]).map((v) => localVariantName(local[1], v));
+}
+
+/**
+ * URL of a smaller rendition of a stored image (FoundItem.image / LostItem.image / avatar_url).
+ * Falls back to the original when no variant exists.
+ */
+export function imageVariant(src: string, variant: ImageVariant): string {
+  const local = LOCAL_HASHED.exec(src);
+  if (local) return `${local[1]}.${variant}.webp`;
+
+  // Cloudinary resizes on its CDN
+  if (src.startsWith("https://res.cloudinary.com/") && src.includes("/image/upload/")) {
+    return src.replace(
+      "/image/upload/",
+      `/image/upload/c_limit,w_${IMAGE_VARIANT_WIDTHS[variant]},f_webp,q_auto/`
+    );
+  }
+
+  return src;
+}
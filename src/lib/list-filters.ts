@@ -0,0 +1,206 @@
+import "server-only";
+
+import { Prisma } from "@/generated/prisma/client";
+import { toPrefixTsQuery } from "@/lib/search";
+
+/* ---------------- List filters ----------------
+ * Query-string filters shared by the list routes and their CSV/NDJSON exports, so an export
+ * always contains exactly what the matching list shows.
+ */
+
+/* ---------- Audit logs (/api/admin/audit/list) ---------- */
+
+export function auditLogWhere(params: URLSearchParams) {
+  const q = String(params.get("q") || "").trim();
+  const action = String(params.get("action") || "ALL").trim();
+  const entityType = String(params.get("entityType") || "ALL").trim();
+  const actorUserIdRaw = String(params.get("actorUserId") || "").trim();
+
+  const fromRaw = String(params.get("from") || "").trim(); // ISO date/time
+  const toRaw = String(params.get("to") || "").trim();
+
+  const where: any = {};
+
+  if (action && action !== "ALL") where.action = action;
+  if (entityType && entityType !== "ALL") where.entity_type = entityType;
+
+  const actorUserId = Number(actorUserIdRaw);
+  if (actorUserIdRaw && Number.isFinite(actorUserId)) {
+    where.actor_user_id = actorUserId;
+  }
+
+  if (fromRaw || toRaw) {
+    where.created_at = {};
+    if (fromRaw) {
+      const from = new Date(fromRaw);
+      if (!Number.isNaN(from.getTime())) where.created_at.gte = from;
+    }
+    if (toRaw) {
+      const to = new Date(toRaw);
+      if (!Number.isNaN(to.getTime())) where.created_at.lte = to;
+    }
+    // cleanup if invalid
+    if (Object.keys(where.created_at).length === 0) delete where.created_at;
+  }
+
+  if (q.length > 0) {
+    where.OR = [
+      { action: { contains: q, mode: "insensitive" } },
+      { entity_type: { contains: q, mode: "insensitive" } },
+      { summary: { contains: q, mode: "insensitive" } },
+      {
+        actor: {
+          OR: [
+            { full_name: { contains: q, mode: "insensitive" } },
+            { email: { contains: q, mode: "insensitive" } },
+          ],
+        },
+      },
+    ];
+  }
+
+  return where;
+}
+
+/* ---------- Claims (/api/staff/claims) ---------- */
+
+const CLAIM_STATUSES = new Set(["ALL", "PENDING", "APPROVED", "DENIED"]);
+
+export function claimWhere(params: URLSearchParams) {
+  const statusRaw = String(params.get("status") || "PENDING").toUpperCase();
+  const status = CLAIM_STATUSES.has(statusRaw) ? statusRaw : "PENDING";
+  const q = String(params.get("q") || "").trim();
+
+  const where: any = {};
+
+  if (status !== "ALL") {
+    where.claim_status = status;
+  }
+
+  if (q.length > 0) {
+    where.AND = [
+      {
+        OR: [
+          { proof_description: { contains: q, mode: "insensitive" } },
+          { claimant: { full_name: { contains: q, mode: "insensitive" } } },
+          { claimant: { email: { contains: q, mode: "insensitive" } } },
+          { found_item: { item_name: { contains: q, mode: "insensitive" } } },
+          { found_item: { category: { category_name: { contains: q, mode: "insensitive" } } } },
+          { found_item: { location: { location_name: { contains: q, mode: "insensitive" } } } },
+        ],
+      },
+    ];
+  }
+
+  return { status, where };
+}
+
+/* ---------- Found items (/api/found/list) ---------- */
+
+export const FOUND_STATUSES = ["NEWLY_FOUND", "CLAIMED", "RETURNED"] as const;
+type FoundStatus = (typeof FOUND_STATUSES)[number];
+
+function isFoundStatus(s: string): s is FoundStatus {
+  return (FOUND_STATUSES as readonly string[]).includes(s);
+}
+
+export type FoundFilters =
+  | { ok: false; error: string }
+  | {
+      ok: true;
+      /** Prisma filter (no keyword). */
+      where: any;
+      /** The same filter as raw SQL over `found_items f`, for the full-text path. */
+      sqlConds: Prisma.Sql[];
+      /** Prefix tsquery for `q`, or null when there is no keyword. */
+      tsq: string | null;
+      /** Nothing can match (RETURNED for the public, or a keyword with nothing searchable). */
+      empty: boolean;
+    };
+
+/**
+ * Status rules:
+ * - If status is explicitly RETURNED and user is NOT privileged: empty results (no 403).
+ * - If no explicit status filter:
+ *     - Public: hide RETURNED and CLAIMED by default (unless includeClaimed=1)
+ *     - Staff/Admin: show everything
+ */
+export function foundItemFilters(params: URLSearchParams, isPrivileged: boolean): FoundFilters {
+  const q = (params.get("q") || "").trim();
+  const categoryIdRaw = params.get("categoryId");
+  const locationIdRaw = params.get("locationId");
+  const statusRaw = (params.get("status") || "").trim().toUpperCase();
+  const includeClaimedRaw = (params.get("includeClaimed") || "").trim().toLowerCase();
+
+  const dateFromRaw = (params.get("dateFrom") || "").trim();
+  const dateToRaw = (params.get("dateTo") || "").trim();
+
+  const categoryId = categoryIdRaw ? Number(categoryIdRaw) : null;
+  const locationId = locationIdRaw ? Number(locationIdRaw) : null;
+  const includeClaimed = includeClaimedRaw === "1" || includeClaimedRaw === "true" || includeClaimedRaw === "yes";
+
+  const where: any = {};
+  const sqlConds: Prisma.Sql[] = [];
+  let empty = false;
+
+  if (categoryId && Number.isFinite(categoryId)) {
+    where.category_id = categoryId;
+    sqlConds.push(Prisma.sql`f.category_id = ${categoryId}`);
+  }
+  if (locationId && Number.isFinite(locationId)) {
+    where.location_id = locationId;
+    sqlConds.push(Prisma.sql`f.location_id = ${locationId}`);
+  }
+
+  if (statusRaw && statusRaw !== "ALL") {
+    if (!isFoundStatus(statusRaw)) {
+      return { ok: false, error: `Invalid status. Allowed: ALL, ${FOUND_STATUSES.join(", ")}` };
+    }
+
+    if (statusRaw === "RETURNED" && !isPrivileged) empty = true;
+
+    where.status = statusRaw;
+    sqlConds.push(Prisma.sql`f.status = ${statusRaw}`);
+  } else {
+    if (!isPrivileged) {
+      if (includeClaimed) {
+        where.status = { not: "RETURNED" };
+        sqlConds.push(Prisma.sql`f.status <> 'RETURNED'`);
+      } else {
+        where.status = { notIn: ["RETURNED", "CLAIMED"] };
+        sqlConds.push(Prisma.sql`f.status NOT IN ('RETURNED', 'CLAIMED')`);
+      }
+    }
+  }
+
+  if (dateFromRaw || dateToRaw) {
+    const dateFoundFilter: any = {};
+
+    if (dateFromRaw) {
+      const d = new Date(dateFromRaw);
+      if (Number.isNaN(d.getTime())) {
+        return { ok: false, error: "Invalid dateFrom. Use YYYY-MM-DD or ISO date." };
+      }
+      dateFoundFilter.gte = d;
+      sqlConds.push(Prisma.sql`f.date_found >= ${d.toISOString().slice(0, 10)}::date`);
+    }
+
+    if (dateToRaw) {
+      const d = new Date(dateToRaw);
+      if (Number.isNaN(d.getTime())) {
+        return { ok: false, error: "Invalid dateTo. Use YYYY-MM-DD or ISO date." };
+      }
+      dateFoundFilter.lte = d;
+      sqlConds.push(Prisma.sql`f.date_found <= ${d.toISOString().slice(0, 10)}::date`);
+    }
+
+    where.date_found = dateFoundFilter;
+  }
+
+  const tsq = q ? toPrefixTsQuery(q) : null;
+
+  // Keyword with nothing searchable left (e.g. only punctuation): nothing can match
+  if (q && !tsq) empty = true;
+
+  return { ok: true, where, sqlConds, tsq, empty };
+}
@@ -0,0 +1,126 @@
+import "server-only";
+
+import type { Prisma } from "@/generated/prisma/client";
+import {
+  buildMatchColumns,
+  topMatches,
+  type IndexedMatchInput,
+  type RankedMatch,
+} from "@/lib/matching";
+
+// Works with both `prisma` and an interactive transaction `tx`
+type Db = Prisma.TransactionClient;
+
+// A row sharing no category, location or keyword can only earn date points (max 15),
+// so for thresholds above that we only need rows the token/FK indexes can find.
+const DATE_ONLY_MAX_SCORE = 15;
+
+type FoundIndexRow = { category_id: number; location_id: number; date_found: Date; match_tokens: string[] };
+type LostIndexRow = { category_id: number; location_id: number; date_lost: Date; match_tokens: string[] };
+
+export function foundIndexInput(f: FoundIndexRow): IndexedMatchInput {
+  return {
+    tokens: f.match_tokens,
+    category_id: f.category_id,
+    location_id: f.location_id,
+    date: new Date(f.date_found),
+  };
+}
+
+export function lostIndexInput(l: LostIndexRow): IndexedMatchInput {
+  return {
+    tokens: l.match_tokens,
+    category_id: l.category_id,
+    location_id: l.location_id,
+    date: new Date(l.date_lost),
+  };
+}
+
+function candidateFilter(q: IndexedMatchInput, minScore: number) {
+  if (minScore <= DATE_ONLY_MAX_SCORE) return {};
+  return {
+    OR: [
+      ...(q.tokens.length ? [{ match_tokens: { hasSome: q.tokens } }] : []),
+      { category_id: q.category_id },
+      { location_id: q.location_id },
+    ],
+  };
+}
+
+// Union of candidateFilter over several queries: a row no single query could match
+// still scores at most DATE_ONLY_MAX_SCORE against each of them.
+function batchCandidateFilter(qs: IndexedMatchInput[], minScore: number) {
+  if (minScore <= DATE_ONLY_MAX_SCORE) return {};
+  const tokens = [...new Set(qs.flatMap((q) => q.tokens))];
+  return {
+    OR: [
+      ...(tokens.length ? [{ match_tokens: { hasSome: tokens } }] : []),
+      { category_id: { in: [...new Set(qs.map((q) => q.category_id))] } },
+      { location_id: { in: [...new Set(qs.map((q) => q.location_id))] } },
+    ],
+  };
+}
+
+/**
+ * Rank every found item (matching `where`) against a lost report.
+ * Only the index columns are loaded; scoring is one batch pass (see topMatches).
+ */
+export async function rankFoundForLost(
+  db: Db,
+  lost: IndexedMatchInput,
+  opts: { where?: Prisma.FoundItemWhereInput; k: number; minScore?: number }
+): Promise<RankedMatch[]> {
+  const minScore = opts.minScore ?? 0;
+
+  const rows = await db.foundItem.findMany({
+    where: { AND: [opts.where ?? {}, candidateFilter(lost, minScore)] },
+    orderBy: { found_id: "asc" },
+    select: { found_id: true, category_id: true, location_id: true, date_found: true, match_tokens: true },
+  });
+
+  const cols = buildMatchColumns(rows.map((f) => ({ id: f.found_id, ...foundIndexInput(f) })));
+  return topMatches(lost, "lost", cols, { k: opts.k, minScore });
+}
+
+/**
+ * Rank every lost report (matching `where`) against a found item.
+ */
+export async function rankLostForFound(
+  db: Db,
+  found: IndexedMatchInput,
+  opts: { where?: Prisma.LostItemWhereInput; k: number; minScore?: number }
+): Promise<RankedMatch[]> {
+  const minScore = opts.minScore ?? 0;
+
+  const rows = await db.lostItem.findMany({
+    where: { AND: [opts.where ?? {}, candidateFilter(found, minScore)] },
+    orderBy: { lost_id: "asc" },
+    select: { lost_id: true, category_id: true, location_id: true, date_lost: true, match_tokens: true },
+  });
+
+  const cols = buildMatchColumns(rows.map((l) => ({ id: l.lost_id, ...lostIndexInput(l) })));
+  return topMatches(found, "found", cols, { k: opts.k, minScore });
+}
+
+/**
+ * rankLostForFound for many found items at once (bulk intake): the candidate lost reports are
+ * loaded and columnized once, then each item is one topMatches pass over them.
+ * Results line up with `founds` and equal what rankLostForFound returns per item.
+ */
+export async function rankLostForFounds(
+  db: Db,
+  founds: IndexedMatchInput[],
+  opts: { where?: Prisma.LostItemWhereInput; k: number; minScore?: number }
+): Promise<RankedMatch[][]> {
+  if (!founds.length) return [];
+  const minScore = opts.minScore ?? 0;
+
+  const rows = await db.lostItem.findMany({
+    where: { AND: [opts.where ?? {}, batchCandidateFilter(founds, minScore)] },
+    orderBy: { lost_id: "asc" },
+    select: { lost_id: true, category_id: true, location_id: true, date_lost: true, match_tokens: true },
+  });
+
+  const cols = buildMatchColumns(rows.map((l) => ({ id: l.lost_id, ...lostIndexInput(l) })));
+  return founds.map((f) => topMatches(f, "found", cols, { k: opts.k, minScore }));
+}
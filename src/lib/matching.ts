@@ -6,6 +6,15 @@ export type MatchInput = {
   date: Date; // date_lost or date_found
 };
 
+// Same as MatchInput, but with the keyword set already normalized
+// (stored in `match_tokens` so we never re-tokenize stored text).
+export type IndexedMatchInput = {
+  tokens: string[];
+  category_id: number;
+  location_id: number;
+  date: Date;
+};
+
 export type MatchScore = {
   score: number; // 0..100
   reasons: string[]; // for UI ("Same category", "2 shared keywords", etc.)
@@ -25,9 +34,19 @@ function uniq(arr: string[]) {
   return Array.from(new Set(arr));
 }
 
+/**
+ * Normalized, de-duplicated keyword set for an item.
+ * This is what gets persisted in `lost_items.match_tokens` / `found_items.match_tokens`.
+ */
+export function matchTokens(item_name: string, description: string | null): string[] {
+  return uniq(tokens(`${item_name} ${description ?? ""}`));
+}
+
+const DAY_MS = 1000 * 60 * 60 * 24;
+
 function daysBetween(a: Date, b: Date) {
   const ms = Math.abs(a.getTime() - b.getTime());
-  return Math.floor(ms / (1000 * 60 * 60 * 24));
+  return Math.floor(ms / DAY_MS);
 }
 
 /**
@@ -35,55 +54,266 @@ function daysBetween(a: Date, b: Date) {
  * We keep it deterministic + explainable for demo/DBMS.
  */
 export function scoreLostVsFound(lost: MatchInput, found: MatchInput): MatchScore {
-  let score = 0;
+  return scoreIndexed(
+    {
+      tokens: matchTokens(lost.item_name, lost.description),
+      category_id: lost.category_id,
+      location_id: lost.location_id,
+      date: lost.date,
+    },
+    {
+      tokens: matchTokens(found.item_name, found.description),
+      category_id: found.category_id,
+      location_id: found.location_id,
+      date: found.date,
+    }
+  );
+}
+
+/**
+ * Same scoring as scoreLostVsFound, but over precomputed token sets.
+ * Token arrays must already be de-duplicated (see matchTokens).
+ */
+export function scoreIndexed(lost: IndexedMatchInput, found: IndexedMatchInput): MatchScore {
+  const setB = new Set(found.tokens);
+  let overlap = 0;
+  for (const t of lost.tokens) if (setB.has(t)) overlap++;
+
   const reasons: string[] = [];
+  const score = scoreParts(
+    lost.category_id === found.category_id,
+    lost.location_id === found.location_id,
+    daysBetween(lost.date, found.date),
+    overlap,
+    lost.tokens.length,
+    reasons
+  );
+
+  return { score, reasons };
+}
+
+/**
+ * The actual rubric. Shared by scoreIndexed and the batch scorer so both
+ * always agree; pass `reasons = null` to skip building the explanation.
+ */
+function scoreParts(
+  sameCategory: boolean,
+  sameLocation: boolean,
+  days: number,
+  overlap: number,
+  lostTokenCount: number,
+  reasons: string[] | null
+) {
+  let score = 0;
 
   // 1) Category match (strong)
-  if (lost.category_id === found.category_id) {
+  if (sameCategory) {
     score += 40;
-    reasons.push("Same category");
+    reasons?.push("Same category");
   }
 
   // 2) Location match (medium)
-  if (lost.location_id === found.location_id) {
+  if (sameLocation) {
     score += 25;
-    reasons.push("Same location");
+    reasons?.push("Same location");
   }
 
   // 3) Date proximity (weak-medium)
-  const d = daysBetween(lost.date, found.date);
-  if (d <= 1) {
+  if (days <= 1) {
     score += 15;
-    reasons.push("Date is within 1 day");
-  } else if (d <= 3) {
+    reasons?.push("Date is within 1 day");
+  } else if (days <= 3) {
     score += 10;
-    reasons.push("Date is within 3 days");
-  } else if (d <= 7) {
+    reasons?.push("Date is within 3 days");
+  } else if (days <= 7) {
     score += 5;
-    reasons.push("Date is within 7 days");
+    reasons?.push("Date is within 7 days");
   }
 
   // 4) Keyword overlap (medium)
-  const lostText = `${lost.item_name} ${lost.description ?? ""}`;
-  const foundText = `${found.item_name} ${found.description ?? ""}`;
-
-  const A = uniq(tokens(lostText));
-  const B = uniq(tokens(foundText));
-
-  const setB = new Set(B);
-  const overlap = A.filter((t) => setB.has(t));
-
-  // Overlap contributes up to +20 depending on ratio
-  if (A.length > 0) {
-    const ratio = overlap.length / Math.max(1, A.length);
+  // Overlap contributes up to +20 depending on ratio (ratio is over the LOST report's keywords)
+  if (lostTokenCount > 0) {
+    const ratio = overlap / Math.max(1, lostTokenCount);
     const kwScore = Math.round(Math.min(20, ratio * 28)); // cap at 20
     if (kwScore > 0) score += kwScore;
   }
 
-  if (overlap.length >= 1) reasons.push(`${overlap.length} shared keyword(s)`);
+  if (overlap >= 1) reasons?.push(`${overlap} shared keyword(s)`);
 
   // clamp
-  score = Math.max(0, Math.min(100, score));
+  return Math.max(0, Math.min(100, score));
+}
 
-  return { score, reasons };
+// -----------------------------------------------------------------------------
+// Batch scoring: one query vs N candidates held in columnar typed arrays.
+// -----------------------------------------------------------------------------
+
+// Which side the single query item is on (the rubric is not symmetric:
+// keyword ratio is always over the lost report's tokens).
+export type MatchSide = "lost" | "found";
+
+/**
+ * Candidates in struct-of-arrays form. Token sets are stored CSR-style
+ * (row r owns tokenIds[tokenOffsets[r] .. tokenOffsets[r + 1]]) against a
+ * shared vocabulary; the query side is turned into a bitset over that vocabulary.
+ */
+export type MatchColumns = {
+  size: number;
+  ids: Int32Array;
+  categoryIds: Int32Array;
+  locationIds: Int32Array;
+  times: Float64Array; // date.getTime()
+  tokenOffsets: Int32Array; // size + 1
+  tokenIds: Int32Array;
+  vocab: Map<string, number>;
+};
+
+export type RankedMatch = MatchScore & { id: number };
+
+export function buildMatchColumns(rows: Array<IndexedMatchInput & { id: number }>): MatchColumns {
+  const size = rows.length;
+  const vocab = new Map<string, number>();
+
+  let totalTokens = 0;
+  for (const r of rows) totalTokens += r.tokens.length;
+
+  const ids = new Int32Array(size);
+  const categoryIds = new Int32Array(size);
+  const locationIds = new Int32Array(size);
+  const times = new Float64Array(size);
+  const tokenOffsets = new Int32Array(size + 1);
+  const tokenIds = new Int32Array(totalTokens);
+
+  let pos = 0;
+  for (let i = 0; i < size; i++) {
+    const r = rows[i];
+    ids[i] = r.id;
+    categoryIds[i] = r.category_id;
+    locationIds[i] = r.location_id;
+    times[i] = r.date.getTime();
+    tokenOffsets[i] = pos;
+    for (const t of r.tokens) {
+      let id = vocab.get(t);
+      if (id === undefined) {
+        id = vocab.size;
+        vocab.set(t, id);
+      }
+      tokenIds[pos++] = id;
+    }
+  }
+  tokenOffsets[size] = pos;
+
+  return { size, ids, categoryIds, locationIds, times, tokenOffsets, tokenIds, vocab };
+}
+
+function overlapAt(cols: MatchColumns, row: number, queryBits: Uint32Array) {
+  let overlap = 0;
+  const end = cols.tokenOffsets[row + 1];
+  for (let p = cols.tokenOffsets[row]; p < end; p++) {
+    const t = cols.tokenIds[p];
+    if (queryBits[t >>> 5] & (1 << (t & 31))) overlap++;
+  }
+  return overlap;
+}
+
+/**
+ * Score `query` against every row of `cols` and return the top `k` with
+ * score >= minScore, best first (ties keep column order, like a stable sort).
+ * Scores/reasons are identical to scoreIndexed; reasons are only built for the winners.
+ */
+export function topMatches(
+  query: IndexedMatchInput,
+  side: MatchSide,
+  cols: MatchColumns,
+  opts: { k: number; minScore?: number }
+): RankedMatch[] {
+  const k = Math.max(0, Math.floor(opts.k));
+  const minScore = opts.minScore ?? 0;
+  if (k === 0 || cols.size === 0) return [];
+
+  // Query tokens -> bitset over the candidate vocabulary.
+  // Tokens nobody else has can't overlap, but still count towards the lost-side ratio.
+  const queryBits = new Uint32Array(Math.max(1, Math.ceil(cols.vocab.size / 32)));
+  for (const t of query.tokens) {
+    const id = cols.vocab.get(t);
+    if (id !== undefined) queryBits[id >>> 5] |= 1 << (id & 31);
+  }
+
+  const qCategory = query.category_id;
+  const qLocation = query.location_id;
+  const qTime = query.date.getTime();
+  const qTokenCount = query.tokens.length;
+
+  // Bounded min-heap of (score, row); root is the current worst kept entry.
+  const heapScore = new Int32Array(k);
+  const heapRow = new Int32Array(k);
+  let heapSize = 0;
+
+  // a is "worse" than b: lower score, or same score but later row
+  const worse = (sa: number, ra: number, sb: number, rb: number) => sa < sb || (sa === sb && ra > rb);
+
+  for (let row = 0; row < cols.size; row++) {
+    const overlap = overlapAt(cols, row, queryBits);
+    const lostTokenCount =
+      side === "lost" ? qTokenCount : cols.tokenOffsets[row + 1] - cols.tokenOffsets[row];
+
+    const score = scoreParts(
+      cols.categoryIds[row] === qCategory,
+      cols.locationIds[row] === qLocation,
+      Math.floor(Math.abs(cols.times[row] - qTime) / DAY_MS),
+      overlap,
+      lostTokenCount,
+      null
+    );
+    if (score < minScore) continue;
+
+    if (heapSize < k) {
+      // sift up
+      let i = heapSize++;
+      while (i > 0) {
+        const parent = (i - 1) >> 1;
+        if (!worse(score, row, heapScore[parent], heapRow[parent])) break;
+        heapScore[i] = heapScore[parent];
+        heapRow[i] = heapRow[parent];
+        i = parent;
+      }
+      heapScore[i] = score;
+      heapRow[i] = row;
+    } else if (worse(heapScore[0], heapRow[0], score, row)) {
+      // replace root, sift down
+      let i = 0;
+      for (;;) {
+        const l = 2 * i + 1;
+        if (l >= heapSize) break;
+        const r = l + 1;
+        const c = r < heapSize && worse(heapScore[r], heapRow[r], heapScore[l], heapRow[l]) ? r : l;
+        if (!worse(heapScore[c], heapRow[c], score, row)) break;
+        heapScore[i] = heapScore[c];
+        heapRow[i] = heapRow[c];
+        i = c;
+      }
+      heapScore[i] = score;
+      heapRow[i] = row;
+    }
+  }
+
+  const order = Array.from({ length: heapSize }, (_, i) => i).sort(
+    (a, b) => heapScore[b] - heapScore[a] || heapRow[a] - heapRow[b]
+  );
+
+  return order.map((h) => {
+    const row = heapRow[h];
+    const reasons: string[] = [];
+    const lostTokenCount =
+      side === "lost" ? qTokenCount : cols.tokenOffsets[row + 1] - cols.tokenOffsets[row];
+    const score = scoreParts(
+      cols.categoryIds[row] === qCategory,
+      cols.locationIds[row] === qLocation,
+      Math.floor(Math.abs(cols.times[row] - qTime) / DAY_MS),
+      overlapAt(cols, row, queryBits),
+      lostTokenCount,
+      reasons
+    );
+    return { id: cols.ids[row], score, reasons };
+  });
 }
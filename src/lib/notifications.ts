@@ -0,0 +1,161 @@
+import "server-only";
+
+import { Client } from "pg";
+import { prisma } from "@/lib/db";
+
+// A trigger on `notifications` NOTIFYs this channel with the user_id on insert,
+// is_read change and delete, so every writer (routes, prisma/rematch.ts, other
+// instances) keeps the cache below correct without calling into this module.
+const CHANNEL = "notifications_changed";
+
+// Safety net only: entries are dropped as soon as the channel reports a change
+const UNREAD_TTL_MS = 5 * 60 * 1000;
+const MAX_CACHED_USERS = 10_000;
+const RECONNECT_MS = 5_000;
+
+type Listener = () => void;
+
+type NotificationHubState = {
+  unread: Map<number, { n: number; at: number }>;
+  // Bumped on every change; a count that raced with a change is not cached
+  changes: number;
+  subscribers: Map<number, Set<Listener>>;
+  client: Client | null;
+  connecting: Promise<void> | null;
+  retryTimer: ReturnType<typeof setTimeout> | null;
+};
+
+// Survives dev hot reload, like the Prisma client in db.ts
+const globalForNotifications = globalThis as unknown as { notificationHub?: NotificationHubState };
+const hub: NotificationHubState = (globalForNotifications.notificationHub ??= {
+  unread: new Map(),
+  changes: 0,
+  subscribers: new Map(),
+  client: null,
+  connecting: null,
+  retryTimer: null,
+});
+
+function changed(userId: number) {
+  hub.changes++;
+  hub.unread.delete(userId);
+  for (const fn of hub.subscribers.get(userId) ?? []) fn();
+}
+
+function dropListener(client: Client, err: unknown) {
+  console.error("Notification listener lost:", err);
+  if (hub.client === client) hub.client = null;
+  void client.end().catch(() => {});
+
+  // Changes may have been missed while disconnected: forget everything and wake subscribers
+  hub.changes++;
+  hub.unread.clear();
+  for (const fns of hub.subscribers.values()) for (const fn of fns) fn();
+
+  scheduleReconnect();
+}
+
+function scheduleReconnect() {
+  if (hub.retryTimer) return;
+  hub.retryTimer = setTimeout(() => {
+    hub.retryTimer = null;
+    void ensureListener();
+  }, RECONNECT_MS);
+  hub.retryTimer.unref?.();
+}
+
+/**
+ * Holds one connection open for LISTEN (per server process). It is a dedicated client, not a
+ * pool checkout: a pooled connection held forever shrinks the pool by one, and the pool's idle
+ * / statement timeouts don't suit a connection that only waits for NOTIFY.
+ */
+function ensureListener(): Promise<void> {
+  if (hub.client) return Promise.resolve();
+  if (hub.connecting) return hub.connecting;
+  // Backing off after a failure: callers fall back to plain counts meanwhile
+  if (hub.retryTimer) return Promise.resolve();
+
+  hub.connecting = (async () => {
+    const c = new Client({ connectionString: process.env.DATABASE_URL, application_name: "foundit-listen" });
+    try {
+      await c.connect();
+      c.on("notification", (msg) => {
+        if (msg.channel !== CHANNEL) return;
+        const userId = Number(msg.payload);
+        if (Number.isFinite(userId)) changed(userId);
+      });
+      c.on("error", (err) => dropListener(c, err));
+      // Server closed the connection without an error (restart, idle kill)
+      c.on("end", () => {
+        if (hub.client === c) dropListener(c, new Error("connection ended"));
+      });
+      await c.query(`LISTEN ${CHANNEL}`);
+      hub.client = c;
+    } catch (err) {
+      console.error("Notification listener failed to start:", err);
+      void c.end().catch(() => {});
+      scheduleReconnect();
+    } finally {
+      hub.connecting = null;
+    }
+  })();
+
+  return hub.connecting;
+}
+
+/** False while the LISTEN connection is down (counts are then read straight from the DB). */
+export function notificationsLive() {
+  return hub.client !== null;
+}
+
+/**
+ * Unread badge count. Served from memory while the change listener is up,
+ * so an idle user costs one count per cache lifetime instead of one per poll.
+ */
+export async function getUnreadCount(userId: number): Promise<number> {
+  await ensureListener();
+
+  const hit = hub.unread.get(userId);
+  if (hub.client && hit && Date.now() - hit.at < UNREAD_TTL_MS) return hit.n;
+
+  const changesBefore = hub.changes;
+  const n = await prisma.notification.count({ where: { user_id: userId, is_read: false } });
+
+  if (hub.client && hub.changes === changesBefore) {
+    hub.unread.delete(userId);
+    hub.unread.set(userId, { n, at: Date.now() });
+    if (hub.unread.size > MAX_CACHED_USERS) {
+      const oldest = hub.unread.keys().next().value;
+      if (oldest !== undefined) hub.unread.delete(oldest);
+    }
+  }
+  return n;
+}
+
+/**
+ * Drop this process's cached count right away (e.g. after mark-read), instead of
+ * waiting for the NOTIFY round trip.
+ */
+export function invalidateUnreadCount(userId: number) {
+  hub.changes++;
+  hub.unread.delete(userId);
+}
+
+/** Call `fn` whenever the user's notifications change. Returns an unsubscribe function. */
+export function subscribeNotifications(userId: number, fn: Listener) {
+  void ensureListener();
+
+  let set = hub.subscribers.get(userId);
+  if (!set) {
+    set = new Set();
+    hub.subscribers.set(userId, set);
+  }
+  set.add(fn);
+
+  return () => {
+    const s = hub.subscribers.get(userId);
+    if (!s) return;
+    s.delete(fn);
+    if (!s.size) hub.subscribers.delete(userId);
+  };
+}
@@ -0,0 +1,141 @@
+import "server-only";
+
+import { prisma } from "@/lib/db";
+
+// How a list endpoint reports its total:
+// - exact:    count(*) over the filter (the old behaviour, still the default for page=N callers)
+// - estimate: planner row estimate when unfiltered, else a count capped at ESTIMATE_CAP
+// - none:     skip counting entirely (cheapest; default for cursor mode)
+export type TotalMode = "exact" | "estimate" | "none";
+
+export const ESTIMATE_CAP = 1000;
+
+export function parseTotalMode(raw: string | null, fallback: TotalMode): TotalMode {
+  const t = String(raw || "").trim().toLowerCase();
+  if (t === "exact" || t === "estimate" || t === "none") return t;
+  return fallback;
+}
+
+/**
+ * Opaque keyset cursor: the ORDER BY values of the last row on the page.
+ * base64url(JSON) so callers can't depend on its shape.
+ */
+export function encodeCursor(parts: Array<string | number>): string {
+  return Buffer.from(JSON.stringify(parts), "utf8").toString("base64url");
+}
+
+export function decodeCursor(raw: string | null, arity: number): Array<string | number> | null {
+  if (!raw) return null;
+  try {
+    const parts = JSON.parse(Buffer.from(raw, "base64url").toString("utf8"));
+    if (!Array.isArray(parts) || parts.length !== arity) return null;
+    if (!parts.every((p) => typeof p === "string" || typeof p === "number")) return null;
+    return parts;
+  } catch {
+    return null;
+  }
+}
+
+// Cursor parts are JSON, so dates travel as ISO strings
+export function cursorDate(v: string | number): Date | null {
+  const d = new Date(String(v));
+  return Number.isNaN(d.getTime()) ? null : d;
+}
+
+/* ---------------- Keyset pages on (timestamp, id) ----------------
+ * ?mode=cursor for the first page, then ?cursor=<nextCursor>. Rows are ordered by a date column,
+ * then the id, in one direction; one extra row is fetched to tell whether a next page exists.
+ * Page-number callers keep skip/take + an exact total unless they ask otherwise (?total=).
+ */
+
+export type KeysetRequest = {
+  cursorMode: boolean;
+  totalMode: TotalMode;
+  // Last row of the previous page; null on the first page and in page-number mode
+  after: { at: Date; id: number } | null;
+};
+
+/** Read ?mode, ?cursor and ?total. Null when the cursor doesn't decode (respond 400). */
+export function parseKeyset(params: URLSearchParams): KeysetRequest | null {
+  const cursorRaw = params.get("cursor");
+  const cursorMode = params.get("mode") === "cursor" || Boolean(cursorRaw);
+  const totalMode = parseTotalMode(params.get("total"), cursorMode ? "none" : "exact");
+  if (!cursorRaw) return { cursorMode, totalMode, after: null };
+
+  const cursor = decodeCursor(cursorRaw, 2);
+  const at = cursor ? cursorDate(cursor[0]) : null;
+  const id = cursor ? Number(cursor[1]) : NaN;
+  if (!at || !Number.isFinite(id)) return null;
+  return { cursorMode, totalMode, after: { at, id } };
+}
+
+/** `where` narrowed to the rows that sort after the cursor row. */
+export function keysetWhere<W extends object>(
+  where: W,
+  keyset: KeysetRequest,
+  keys: { date: string; id: string },
+  dir: "asc" | "desc" = "desc"
+): W {
+  const after = keyset.after;
+  if (!after) return where;
+  const op = dir === "asc" ? "gt" : "lt";
+  return {
+    AND: [
+      where,
+      { OR: [{ [keys.date]: { [op]: after.at } }, { [keys.date]: after.at, [keys.id]: { [op]: after.id } }] },
+    ],
+  } as unknown as W;
+}
+
+/** skip/take for findMany: one extra row in cursor mode. */
+export function keysetWindow(keyset: KeysetRequest, page: number, pageSize: number) {
+  return keyset.cursorMode ? { take: pageSize + 1 } : { skip: (page - 1) * pageSize, take: pageSize };
+}
+
+/** Drop the extra row and point nextCursor at the last row kept. */
+export function keysetPage<T>(
+  found: T[],
+  keyset: KeysetRequest,
+  pageSize: number,
+  keyOf: (row: T) => { at: Date; id: number }
+): { rows: T[]; nextCursor: string | null } {
+  const rows = found.slice(0, pageSize);
+  if (!keyset.cursorMode || found.length <= pageSize) return { rows, nextCursor: null };
+  const last = keyOf(rows[rows.length - 1]);
+  return { rows, nextCursor: encodeCursor([last.at.toISOString(), last.id]) };
+}
+
+async function plannerEstimate(table: string) {
+  const rows = await prisma.$queryRaw<Array<{ n: number }>>`
+    SELECT reltuples::float8 AS n FROM pg_class WHERE relname = ${table} AND relkind = 'r'
+  `;
+  const n = rows[0]?.n;
+  // -1 (PG14+) / 0 means "never analyzed": no usable estimate
+  return typeof n === "number" && n > 0 ? Math.round(n) : null;
+}
+
+/**
+ * Resolve the total for a list response.
+ * `table` should only be passed when the query is unfiltered (planner stats are per table).
+ */
+export async function resolveTotal(
+  mode: TotalMode,
+  opts: {
+    exact: () => Promise<number>;
+    capped: (take: number) => Promise<number>;
+    table?: string;
+  }
+): Promise<{ total: number | null; totalIsEstimate: boolean }> {
+  if (mode === "none") return { total: null, totalIsEstimate: false };
+  if (mode === "exact") return { total: await opts.exact(), totalIsEstimate: false };
+
+  if (opts.table) {
+    const n = await plannerEstimate(opts.table);
+    if (n !== null) return { total: n, totalIsEstimate: true };
+  }
+
+  const n = await opts.capped(ESTIMATE_CAP + 1);
+  return n > ESTIMATE_CAP
+    ? { total: ESTIMATE_CAP, totalIsEstimate: true }
+    : { total: n, totalIsEstimate: false };
+}
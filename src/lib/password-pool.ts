@@ -0,0 +1,136 @@
+import "server-only";
+
+import os from "os";
+import { Worker } from "worker_threads";
+import bcrypt from "bcryptjs";
+
+/* ---------------- Password hashing off the event loop ----------------
+ * bcryptjs is pure JS: one cost-12 hash/compare holds a thread for hundreds of ms.
+ * Hashes and compares run on a small worker-thread pool instead, so a login spike only
+ * queues logins, not every other request on the process.
+ *
+ * PASSWORD_WORKERS: pool size (default: CPU count - 1, max 4). 0 = run in-process (dev/tests).
+ * PASSWORD_QUEUE_MAX: tasks allowed to wait for a worker (default 64). Past that, callers get
+ *   PasswordPoolBusyError right away (routes answer 503) instead of piling up latency.
+ */
+
+function envInt(name: string, fallback: number) {
+  const raw = process.env[name];
+  if (raw === undefined || raw.trim() === "") return fallback;
+  const n = Number(raw);
+  return Number.isFinite(n) && n >= 0 ? Math.floor(n) : fallback;
+}
+
+const POOL_SIZE = envInt("PASSWORD_WORKERS", Math.max(1, Math.min(4, os.cpus().length - 1)));
+const QUEUE_MAX = envInt("PASSWORD_QUEUE_MAX", 64);
+
+// Evaluated as CommonJS inside each worker; `require` resolves from the app's node_modules.
+// The sync APIs are fine here: the worker does nothing else.
+const WORKER_SOURCE = `
+const { parentPort } = require("worker_threads");
+const bcrypt = require("bcryptjs");
+parentPort.on("message", (t) => {
+  try {
+    const result = t.op === "hash" ? bcrypt.hashSync(t.password, t.cost) : bcrypt.compareSync(t.password, t.hash);
+    parentPort.postMessage({ result });
+  } catch (err) {
+    parentPort.postMessage({ error: String((err && err.message) || err) });
+  }
+});
+`;
+
+export class PasswordPoolBusyError extends Error {
+  constructor() {
+    super("Password hashing queue is full.");
+    this.name = "PasswordPoolBusyError";
+  }
+}
+
+type TaskInput = { op: "hash"; password: string; cost: number } | { op: "compare"; password: string; hash: string };
+
+type Task = TaskInput & { resolve: (v: string | boolean) => void; reject: (err: Error) => void };
+
+type Slot = { worker: Worker; task: Task | null };
+
+type PasswordPoolState = { slots: Slot[]; queue: Task[] };
+
+// Survives dev hot reload, like the Prisma client in db.ts
+const globalForPasswords = globalThis as unknown as { passwordPool?: PasswordPoolState };
+const state: PasswordPoolState = (globalForPasswords.passwordPool ??= { slots: [], queue: [] });
+
+function spawn(): Slot {
+  const slot: Slot = { worker: new Worker(WORKER_SOURCE, { eval: true }), task: null };
+
+  slot.worker.on("message", (msg: { result?: string | boolean; error?: string }) => {
+    const task = slot.task;
+    slot.task = null;
+    if (task) {
+      if (msg.error !== undefined) task.reject(new Error(msg.error));
+      else task.resolve(msg.result as string | boolean);
+    }
+    dispatch();
+  });
+
+  const fail = (err: Error) => {
+    state.slots = state.slots.filter((s) => s !== slot);
+    slot.task?.reject(err);
+    slot.task = null;
+    dispatch();
+  };
+  slot.worker.on("error", fail);
+  slot.worker.on("exit", (code) => {
+    if (state.slots.includes(slot)) fail(new Error(`Password worker exited (${code}).`));
+  });
+
+  // Idle workers must not keep the process alive
+  slot.worker.unref();
+  state.slots.push(slot);
+  return slot;
+}
+
+function dispatch() {
+  while (state.queue.length) {
+    const slot = state.slots.find((s) => !s.task) ?? (state.slots.length < POOL_SIZE ? spawn() : null);
+    if (!slot) return;
+
+    const task = state.queue.shift()!;
+    slot.task = task;
+    const { resolve, reject, ...input } = task;
+    slot.worker.postMessage(input);
+  }
+}
+
+function runInline(input: TaskInput): Promise<string | boolean> {
+  return input.op === "hash" ? bcrypt.hash(input.password, input.cost) : bcrypt.compare(input.password, input.hash);
+}
+
+function run(input: TaskInput): Promise<string | boolean> {
+  if (POOL_SIZE === 0) return runInline(input);
+
+  const allBusy = state.slots.length >= POOL_SIZE && state.slots.every((s) => s.task);
+  if (allBusy && state.queue.length >= QUEUE_MAX) {
+    return Promise.reject(new PasswordPoolBusyError());
+  }
+
+  return new Promise((resolve, reject) => {
+    state.queue.push({ ...input, resolve, reject } as Task);
+    dispatch();
+  });
+}
+
+export async function bcryptHash(password: string, cost: number) {
+  return (await run({ op: "hash", password, cost })) as string;
+}
+
+export async function bcryptCompare(password: string, hash: string) {
+  return (await run({ op: "compare", password, hash })) as boolean;
+}
+
+/** Cost factor a stored hash was made with (null if it isn't a bcrypt hash). */
+export function bcryptRounds(hash: string): number | null {
+  try {
+    return bcrypt.getRounds(hash);
+  } catch {
+    return null;
+  }
+}
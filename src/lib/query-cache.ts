@@ -0,0 +1,142 @@
+// Client-side: no server-only imports.
+
+/* ---------------- Query cache for list pages ----------------
+ * A small LRU of JSON responses keyed by the normalized URL (query params sorted), with:
+ * - in-flight dedup: a prefetch and a click for the same page share one request;
+ * - per-caller abort: a superseded caller stops waiting, and the request itself is aborted
+ *   once nobody (caller or prefetch) is waiting on it any more;
+ * - prefetch: warm a likely-next URL without surfacing errors.
+ * Only `ok: true` responses are cached; errors are thrown to the caller every time.
+ */
+
+export class QueryError extends Error {
+  constructor(
+    message: string,
+    readonly status: number
+  ) {
+    super(message);
+    this.name = "QueryError";
+  }
+}
+
+/** Same params in any order give the same key; empty values are dropped. */
+export function normalizeQueryKey(url: string): string {
+  const [path, query = ""] = url.split("?", 2);
+  const params = [...new URLSearchParams(query).entries()]
+    .filter(([, v]) => v !== "")
+    .sort(([a, av], [b, bv]) => (a === b ? av.localeCompare(bv) : a.localeCompare(b)));
+  return params.length ? `${path}?${new URLSearchParams(params).toString()}` : path;
+}
+
+export function isAbortError(err: unknown) {
+  return err instanceof DOMException && err.name === "AbortError";
+}
+
+type Entry<T> = { value: T; at: number };
+
+type Flight<T> = { promise: Promise<T>; controller: AbortController; waiters: number };
+
+export function createQueryCache<T>(opts: { max: number; ttlMs: number }) {
+  // Map iteration order is insertion order: re-inserting on hit makes the first key the LRU one
+  const entries = new Map<string, Entry<T>>();
+  const inflight = new Map<string, Flight<T>>();
+
+  function peek(url: string): T | undefined {
+    const key = normalizeQueryKey(url);
+    const hit = entries.get(key);
+    if (!hit) return undefined;
+    if (Date.now() - hit.at > opts.ttlMs) {
+      entries.delete(key);
+      return undefined;
+    }
+    entries.delete(key);
+    entries.set(key, hit);
+    return hit.value;
+  }
+
+  function store(key: string, value: T) {
+    entries.delete(key);
+    entries.set(key, { value, at: Date.now() });
+    while (entries.size > opts.max) {
+      entries.delete(entries.keys().next().value as string);
+    }
+  }
+
+  function start(key: string): Flight<T> {
+    const existing = inflight.get(key);
+    if (existing) return existing;
+
+    const controller = new AbortController();
+    const promise = (async () => {
+      try {
+        const res = await fetch(key, { signal: controller.signal });
+        const data = await res.json().catch(() => null);
+        if (!res.ok || !data?.ok) {
+          throw new QueryError(String(data?.error || "Request failed."), res.status);
+        }
+        store(key, data as T);
+        return data as T;
+      } finally {
+        if (inflight.get(key)?.controller === controller) inflight.delete(key);
+      }
+    })();
+
+    const flight: Flight<T> = { promise, controller, waiters: 0 };
+    inflight.set(key, flight);
+    return flight;
+  }
+
+  /** Cached value, the in-flight request for the same key, or a new request. */
+  function get(url: string, signal?: AbortSignal): Promise<T> {
+    const cached = peek(url);
+    if (cached !== undefined) return Promise.resolve(cached);
+    if (signal?.aborted) return Promise.reject(new DOMException("Aborted", "AbortError"));
+
+    const key = normalizeQueryKey(url);
+    const flight = start(key);
+    flight.waiters++;
+
+    return new Promise<T>((resolve, reject) => {
+      const release = () => {
+        signal?.removeEventListener("abort", onAbort);
+        flight.waiters--;
+      };
+      const onAbort = () => {
+        release();
+        if (flight.waiters <= 0) {
+          // Nobody left to use it; the next get() for this key starts a fresh request
+          if (inflight.get(key) === flight) inflight.delete(key);
+          flight.controller.abort();
+        }
+        reject(new DOMException("Aborted", "AbortError"));
+      };
+      signal?.addEventListener("abort", onAbort, { once: true });
+
+      flight.promise.then(
+        (v) => {
+          if (signal?.aborted) return;
+          release();
+          resolve(v);
+        },
+        (err) => {
+          if (signal?.aborted) return;
+          release();
+          reject(err);
+        }
+      );
+    });
+  }
+
+  /** Warm the cache for `url`; never throws, never aborted by callers of get(). */
+  function prefetch(url: string) {
+    if (peek(url) !== undefined) return;
+    const flight = start(normalizeQueryKey(url));
+    flight.waiters++;
+    flight.promise.then(
+      () => flight.waiters--,
+      () => flight.waiters--
+    );
+  }
+
+  return { get, peek, prefetch };
+}
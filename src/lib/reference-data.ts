@@ -0,0 +1,54 @@
+import "server-only";
+
+import { createHash } from "crypto";
+import { prisma } from "@/lib/db";
+import { createTtlCache } from "@/lib/cache";
+
+// Categories/locations/roles only change through the admin routes, which invalidate this
+// process right away; the TTL bounds staleness on other instances.
+const REFERENCE_TTL_MS = 5 * 60 * 1000;
+
+/**
+ * Categories, locations and roles (a few dozen rows), with lookup maps and a content version.
+ * Reads the primary, so an admin edit is visible as soon as it's invalidated.
+ */
+async function loadReferenceData() {
+  const [categories, locations, roles] = await Promise.all([
+    prisma.category.findMany({
+      orderBy: { category_id: "asc" },
+      select: { category_id: true, category_name: true },
+    }),
+    prisma.location.findMany({
+      orderBy: { location_id: "asc" },
+      select: { location_id: true, location_name: true },
+    }),
+    prisma.role.findMany({
+      orderBy: { role_id: "asc" },
+      select: { role_id: true, role_name: true },
+    }),
+  ]);
+
+  // Content hash: identical data on every instance gives the same ETag
+  const version = createHash("sha1").update(JSON.stringify([categories, locations, roles])).digest("hex").slice(0, 16);
+
+  return {
+    categories,
+    locations,
+    roles,
+    version,
+    categoryNames: new Map(categories.map((c) => [c.category_id, c.category_name] as const)),
+    locationNames: new Map(locations.map((l) => [l.location_id, l.location_name] as const)),
+    roleIds: new Map(roles.map((r) => [r.role_name.toUpperCase(), r.role_id] as const)),
+  };
+}
+
+const referenceCache = createTtlCache({ ttlMs: REFERENCE_TTL_MS, load: loadReferenceData });
+
+export async function getReferenceData() {
+  return (await referenceCache.get()).value;
+}
+
+/** Call after a committed create/update/delete of a category, location or role. */
+export function invalidateReferenceData() {
+  referenceCache.invalidate();
+}
@@ -0,0 +1,120 @@
+import "server-only";
+
+import { prisma } from "@/lib/db";
+import { createTtlCache } from "@/lib/cache";
+import { getReferenceData } from "@/lib/reference-data";
+
+// Rollups are trigger-maintained, so the TTL only bounds staleness across instances. Built from
+// the primary: a lagging replica read right after invalidateStaffReport() would stay cached for
+// the whole TTL.
+const REPORT_TTL_MS = 60 * 1000;
+const TOP_N = 6;
+const MONTHS = 12;
+
+type Rollup = { kind: string; month: Date; category_id: number; location_id: number; status: string; n: number };
+
+function monthKey(d: Date) {
+  return d.toISOString().slice(0, 7);
+}
+
+function lastMonths(count: number) {
+  const now = new Date();
+  const out: string[] = [];
+  for (let i = count - 1; i >= 0; i--) {
+    out.push(monthKey(new Date(Date.UTC(now.getUTCFullYear(), now.getUTCMonth() - i, 1))));
+  }
+  return out;
+}
+
+function topBy(rows: Rollup[], key: "category_id" | "location_id") {
+  const counts = new Map<number, number>();
+  for (const r of rows) counts.set(r[key], (counts.get(r[key]) || 0) + r.n);
+  return Array.from(counts, ([id, count]) => ({ id, count }))
+    .filter((x) => x.count > 0)
+    .sort((a, b) => b.count - a.count || a.id - b.id)
+    .slice(0, TOP_N);
+}
+
+function sum(rows: Rollup[]) {
+  return rows.reduce((acc, r) => acc + r.n, 0);
+}
+
+/**
+ * Staff dashboard numbers, computed from `report_rollups` (a few hundred buckets at most)
+ * instead of counting/grouping the item tables on every view.
+ */
+async function buildStaffReport() {
+  const [slots, { categoryNames: catMap, locationNames: locMap }] = await Promise.all([
+    // A bucket is spread over several slot rows, any of which may be negative: fold them first
+    prisma.reportRollup.groupBy({
+      by: ["kind", "month", "category_id", "location_id", "status"],
+      _sum: { n: true },
+    }),
+    getReferenceData(),
+  ]);
+  const rows: Rollup[] = slots
+    .map(({ _sum, ...r }) => ({ ...r, n: _sum.n ?? 0 }))
+    .filter((r) => r.n > 0);
+
+  const lost = rows.filter((r) => r.kind === "LOST" && r.status !== "CANCELLED");
+  const found = rows.filter((r) => r.kind === "FOUND");
+  const claimedFound = found.filter((r) => r.status === "CLAIMED");
+
+  const totalLostReports = sum(lost);
+  const totalFoundItems = sum(found);
+  const pendingClaims = sum(rows.filter((r) => r.kind === "CLAIM" && r.status === "PENDING"));
+  const claimedFoundItems = sum(claimedFound);
+  const unclaimedFoundItems = totalFoundItems - claimedFoundItems;
+
+  const toCategory = ({ id, count }: { id: number; count: number }) => ({
+    category_id: id,
+    category_name: catMap.get(id) || `Category #${id}`,
+    count,
+  });
+  const toLocation = ({ id, count }: { id: number; count: number }) => ({
+    location_id: id,
+    location_name: locMap.get(id) || `Location #${id}`,
+    count,
+  });
+
+  const monthly = lastMonths(MONTHS).map((month) => {
+    const inMonth = (r: Rollup) => monthKey(r.month) === month;
+    return {
+      month,
+      lost_reports: sum(lost.filter(inMonth)),
+      found_items: sum(found.filter(inMonth)),
+      claimed_found: sum(claimedFound.filter(inMonth)),
+    };
+  });
+
+  const recoveryRate = totalFoundItems ? (claimedFoundItems / totalFoundItems) * 100 : 0;
+
+  return {
+    totals: {
+      totalLostReports,
+      totalFoundItems,
+      pendingClaims,
+      claimedFoundItems,
+      unclaimedFoundItems,
+      recoveryRate: Number(recoveryRate.toFixed(2)),
+    },
+    topLostCategories: topBy(lost, "category_id").map(toCategory),
+    topFoundCategories: topBy(found, "category_id").map(toCategory),
+    topLostLocations: topBy(lost, "location_id").map(toLocation),
+    topFoundLocations: topBy(found, "location_id").map(toLocation),
+    monthly,
+  };
+}
+
+const staffReportCache = createTtlCache({ ttlMs: REPORT_TTL_MS, load: buildStaffReport });
+
+export function getStaffReport(opts?: { fresh?: boolean }) {
+  return staffReportCache.get(Boolean(opts?.fresh));
+}
+
+/**
+ * Call after a committed write that changes report numbers (items, claims, category/location names).
+ */
+export function invalidateStaffReport() {
+  staffReportCache.invalidate();
+}
@@ -0,0 +1,29 @@
+import "server-only";
+
+import { Prisma } from "@/generated/prisma/client";
+
+/**
+ * Turn free text into a prefix tsquery for `found_items.search_vector`
+ * ("black wal" -> "black:* & wal:*"), so partial words still match like the old ILIKE search.
+ * Only [a-z0-9] survives, so the result is always safe to hand to to_tsquery().
+ * Returns null when nothing searchable is left.
+ */
+export function toPrefixTsQuery(q: string): string | null {
+  const terms = q
+    .toLowerCase()
+    .split(/[^a-z0-9]+/)
+    .filter(Boolean)
+    .slice(0, 8);
+
+  if (!terms.length) return null;
+  return terms.map((t) => `${t}:*`).join(" & ");
+}
+
+// Matches the trigger in the found_items search migration ('simple' config, no stemming)
+export function foundSearchMatch(tsq: string) {
+  return Prisma.sql`f.search_vector @@ to_tsquery('simple', ${tsq})`;
+}
+
+export function foundSearchRank(tsq: string) {
+  return Prisma.sql`ts_rank_cd(f.search_vector, to_tsquery('simple', ${tsq}))`;
+}
@@ -1,4 +1,5 @@
 import "server-only";
+import { cache } from "react";
 import { cookies } from "next/headers";
 import { createSessionToken, verifySessionToken, type SessionPayload } from "@/lib/auth";
 
@@ -29,14 +30,29 @@ export async function clearSession() {
   });
 }
 
-export async function getSession(): Promise<SessionPayload | null> {
-  const cookieStore = await cookies();
-  const token = cookieStore.get(COOKIE_NAME)?.value;
-  if (!token) return null;
-
+// Request-scoped: layouts, pages and helpers (requireSession/requireRole) rendering the
+// same request share one decode. Across requests, verifySessionToken has its own LRU.
+const verifyForRequest = cache(async (token: string): Promise<SessionPayload | null> => {
   try {
     return await verifySessionToken(token);
   } catch {
     return null;
   }
+});
+
+/**
+ * Raw session token, for long-lived responses (SSE) that re-check it with verifySessionToken
+ * after the request scope cookies() needs is gone.
+ */
+export async function getSessionToken(): Promise<string | null> {
+  const cookieStore = await cookies();
+  return cookieStore.get(COOKIE_NAME)?.value || null;
+}
+
+export async function getSession(): Promise<SessionPayload | null> {
+  const cookieStore = await cookies();
+  const token = cookieStore.get(COOKIE_NAME)?.value;
+  if (!token) return null;
+
+  return verifyForRequest(token);
 }
@@ -1,9 +1,15 @@
 import "server-only";
 
-import { mkdir, writeFile } from "fs/promises";
+import { createWriteStream } from "fs";
+import { access, copyFile, mkdir, rename, rm, utimes } from "fs/promises";
+import os from "os";
 import path from "path";
-import { randomUUID } from "crypto";
+import { Readable, Transform } from "stream";
+import { pipeline } from "stream/promises";
+import type { ReadableStream as NodeReadableStream } from "stream/web";
+import { createHash, randomUUID } from "crypto";
 import { v2 as cloudinary } from "cloudinary";
+import { IMAGE_VARIANT_WIDTHS, localVariantName, type ImageVariant } from "@/lib/image-variants";
 
 export const ALLOWED_IMAGE_MIME = new Set([
   "image/jpeg",
@@ -51,7 +57,44 @@ class UploadError extends Error {
   }
 }
 
-async function uploadToCloudinary(buffer: Buffer, folder: string) {
+type UploadFolder = "found" | "lost" | "avatars";
+
+export type StoredImage = {
+  url: string;
+  filename: string;
+  // Smaller renditions when the backend produced them (see imageVariant())
+  variants: Record<ImageVariant, string> | null;
+};
+
+function tooLarge(maxBytes: number) {
+  return new UploadError(`File too large (max ${Math.floor(maxBytes / (1024 * 1024))}MB).`, 413);
+}
+
+/**
+ * Counts bytes as they pass and fails the pipeline as soon as maxBytes is exceeded,
+ * so an oversized upload is never held (or written) in full.
+ */
+function byteLimiter(maxBytes: number, hash?: ReturnType<typeof createHash>) {
+  let size = 0;
+  const meter = new Transform({
+    transform(chunk: Buffer, _enc, cb) {
+      size += chunk.length;
+      if (size > maxBytes) {
+        cb(tooLarge(maxBytes));
+        return;
+      }
+      hash?.update(chunk);
+      cb(null, chunk);
+    },
+  });
+  return { meter, size: () => size };
+}
+
+function toNodeStream(body: ReadableStream<Uint8Array>) {
+  return Readable.fromWeb(body as unknown as NodeReadableStream<Uint8Array>);
+}
+
+async function uploadToCloudinary(body: ReadableStream<Uint8Array>, folder: UploadFolder, maxBytes: number) {
   const ok = ensureCloudinary();
   if (!ok) {
     throw new UploadError("Cloudinary is not configured.", 500);
@@ -60,29 +103,206 @@ async function uploadToCloudinary(buffer: Buffer, folder: string) {
   const baseFolder = (process.env.CLOUDINARY_FOLDER || "foundit").trim();
   const targetFolder = baseFolder ? `${baseFolder}/${folder}` : folder;
 
-  return new Promise<{ url: string; filename: string }>((resolve, reject) => {
-    const stream = cloudinary.uploader.upload_stream(
-      { folder: targetFolder, resource_type: "image" },
-      (err, result) => {
-        if (err || !result) {
-          reject(new UploadError("Upload failed.", 500));
-          return;
-        }
-        resolve({
-          url: result.secure_url || result.url || "",
-          filename: result.public_id || result.asset_id || result.original_filename || "",
-        });
-      }
-    );
-    stream.end(buffer);
+  let resolveUpload!: (res: { url: string; filename: string }) => void;
+  let rejectUpload!: (err: unknown) => void;
+  const done = new Promise<{ url: string; filename: string }>((resolve, reject) => {
+    resolveUpload = resolve;
+    rejectUpload = reject;
   });
+
+  const upload = cloudinary.uploader.upload_stream(
+    { folder: targetFolder, resource_type: "image" },
+    (err, result) => {
+      if (err || !result) {
+        rejectUpload(new UploadError("Upload failed.", 500));
+        return;
+      }
+      resolveUpload({
+        url: result.secure_url || result.url || "",
+        filename: result.public_id || result.asset_id || result.original_filename || "",
+      });
+    }
+  );
+
+  const { meter } = byteLimiter(maxBytes);
+  // If the limiter trips, pipeline rejects first and the half-sent upload is destroyed
+  const [, res] = await Promise.all([pipeline(toNodeStream(body), meter, upload), done]);
+  return res;
+}
+
+/* ---------------- Local disk backend ---------------- */
+
+// Lazily loaded: sharp is a native module, so uploads still work
+// (originals only, no variants) on platforms where its binary can't load.
+type Sharp = typeof import("sharp");
+let sharpModule: Promise<Sharp | null> | null = null;
+
+function loadSharp() {
+  sharpModule ??= import("sharp")
+    .then((m) => (m.default ?? m) as Sharp)
+    .catch((err) => {
+      console.warn("sharp unavailable, storing uploads without variants:", err?.message || err);
+      return null;
+    });
+  return sharpModule;
+}
+
+const VARIANT_QUALITY = 75;
+
+const EXT_BY_FORMAT: Record<string, string> = {
+  jpeg: ".jpg",
+  png: ".png",
+  webp: ".webp",
+  gif: ".gif",
+};
+
+async function exists(p: string) {
+  try {
+    await access(p);
+    return true;
+  } catch {
+    return false;
+  }
+}
+
+// A dedup hit re-stamps the existing file: cleanup treats a recent mtime as "an upload may be
+// about to reference this" (see found/update)
+async function touch(p: string) {
+  const now = new Date();
+  await utimes(p, now, now).catch(() => {});
 }
 
-async function uploadToLocal(buffer: Buffer, fileName: string, folder: string) {
+// rename() can't cross filesystems (tmpdir -> project dir)
+async function moveFile(from: string, to: string) {
+  try {
+    await rename(from, to);
+  } catch (err: any) {
+    if (err?.code !== "EXDEV") throw err;
+    await copyFile(from, to);
+    await rm(from, { force: true });
+  }
+}
+
+async function spoolToTemp(body: ReadableStream<Uint8Array>, maxBytes: number) {
+  const tmp = path.join(os.tmpdir(), `foundit-upload-${randomUUID()}`);
+  const hash = createHash("sha256");
+  const { meter, size } = byteLimiter(maxBytes, hash);
+
+  try {
+    await pipeline(toNodeStream(body), meter, createWriteStream(tmp));
+  } catch (err) {
+    await rm(tmp, { force: true });
+    throw err;
+  }
+
+  if (size() === 0) {
+    await rm(tmp, { force: true });
+    throw new UploadError("Empty file.", 400);
+  }
+
+  // 128 bits of sha256 is plenty for dedup and keeps names short
+  return { tmp, hash: hash.digest("hex").slice(0, 32) };
+}
+
+/**
+ * Stream to a temp file (hashing on the way), then store as public/uploads/<folder>/<hash>.<ext>
+ * with WebP thumb/md variants. Identical uploads land on the same name and are written once.
+ */
+async function uploadToLocal(
+  body: ReadableStream<Uint8Array>,
+  mime: string,
+  folder: UploadFolder,
+  maxBytes: number
+): Promise<StoredImage> {
   const uploadDir = path.join(process.cwd(), "public", "uploads", folder);
   await mkdir(uploadDir, { recursive: true });
-  await writeFile(path.join(uploadDir, fileName), buffer);
-  return { url: `/uploads/${folder}/${fileName}`, filename: fileName };
+
+  const { tmp, hash } = await spoolToTemp(body, maxBytes);
+
+  try {
+    const sharp = await loadSharp();
+
+    if (!sharp) {
+      // No variants possible: "-raw" keeps imageVariant() from pointing at files that don't exist
+      const filename = `${hash}-raw${extFromMime(mime) || ".jpg"}`;
+      const dest = path.join(uploadDir, filename);
+      if (!(await exists(dest))) await moveFile(tmp, dest);
+      else await touch(dest);
+      return { url: `/uploads/${folder}/${filename}`, filename, variants: null };
+    }
+
+    // Trust the decoded bytes, not the client's Content-Type
+    const meta = await sharp(tmp).metadata().catch(() => null);
+    const ext = meta?.format ? EXT_BY_FORMAT[meta.format] : undefined;
+    if (!ext) {
+      throw new UploadError("Invalid file type. Use JPG/PNG/WEBP/GIF.", 415);
+    }
+
+    const filename = `${hash}${ext}`;
+    const dest = path.join(uploadDir, filename);
+    const variantNames = {
+      thumb: localVariantName(hash, "thumb"),
+      md: localVariantName(hash, "md"),
+    };
+
+    // The original is written last, so its presence means the variants are there too
+    if (!(await exists(dest))) {
+      for (const v of Object.keys(variantNames) as ImageVariant[]) {
+        await sharp(tmp)
+          .rotate() // apply EXIF orientation before it is stripped
+          .resize({ width: IMAGE_VARIANT_WIDTHS[v], withoutEnlargement: true })
+          .webp({ quality: VARIANT_QUALITY })
+          .toFile(path.join(uploadDir, variantNames[v]));
+      }
+      await moveFile(tmp, dest);
+    } else {
+      await touch(dest);
+    }
+
+    return {
+      url: `/uploads/${folder}/${filename}`,
+      filename,
+      variants: {
+        thumb: `/uploads/${folder}/${variantNames.thumb}`,
+        md: `/uploads/${folder}/${variantNames.md}`,
+      },
+    };
+  } finally {
+    await rm(tmp, { force: true });
+  }
+}
+
+/**
+ * Store an image from a byte stream without buffering it: maxBytes is enforced while reading.
+ */
+export async function storeImageStream({
+  body,
+  mime,
+  folder,
+  maxBytes,
+  contentLength,
+}: {
+  body: ReadableStream<Uint8Array>;
+  mime: string;
+  folder: UploadFolder;
+  maxBytes: number;
+  contentLength?: number | null;
+}): Promise<StoredImage> {
+  if (!ALLOWED_IMAGE_MIME.has(mime)) {
+    throw new UploadError("Invalid file type. Use JPG/PNG/WEBP/GIF.", 415);
+  }
+  // Cheap early reject when the client announced the size
+  if (contentLength && contentLength > maxBytes) {
+    throw tooLarge(maxBytes);
+  }
+
+  if (ensureCloudinary()) {
+    const res = await uploadToCloudinary(body, folder, maxBytes);
+    if (!res.url) throw new UploadError("Upload failed.", 500);
+    return { ...res, variants: null };
+  }
+
+  return uploadToLocal(body, mime, folder, maxBytes);
 }
 
 export async function storeImage({
@@ -91,31 +311,49 @@ export async function storeImage({
   maxBytes,
 }: {
   file: File;
-  folder: "found" | "lost" | "avatars";
+  folder: UploadFolder;
   maxBytes: number;
 }) {
-  if (!ALLOWED_IMAGE_MIME.has(file.type)) {
-    throw new UploadError("Invalid file type. Use JPG/PNG/WEBP/GIF.", 415);
-  }
+  return storeImageStream({
+    body: file.stream(),
+    mime: file.type,
+    folder,
+    maxBytes,
+    contentLength: file.size,
+  });
+}
 
-  const bytes = await file.arrayBuffer();
-  if (bytes.byteLength > maxBytes) {
-    throw new UploadError(
-      `File too large (max ${Math.floor(maxBytes / (1024 * 1024))}MB).`,
-      413
-    );
+/**
+ * Upload route body: either the raw image (Content-Type: image/*, streamed) or the
+ * older multipart form with a `file` field (parsed in memory by the runtime).
+ */
+export async function storeImageFromRequest(
+  req: Request,
+  { folder, maxBytes }: { folder: UploadFolder; maxBytes: number }
+) {
+  const contentType = (req.headers.get("content-type") || "").toLowerCase();
+
+  if (contentType.startsWith("multipart/form-data")) {
+    const form = await req.formData();
+    const entry = form.get("file");
+    if (!entry || typeof entry === "string") {
+      throw new UploadError("Missing file (field name must be 'file').", 400);
+    }
+    return storeImage({ file: entry as File, folder, maxBytes });
   }
 
-  const buffer = Buffer.from(bytes);
-  if (ensureCloudinary()) {
-    const res = await uploadToCloudinary(buffer, folder);
-    if (!res.url) throw new UploadError("Upload failed.", 500);
-    return res;
+  if (!req.body) {
+    throw new UploadError("Missing file (field name must be 'file').", 400);
   }
 
-  const ext = extFromMime(file.type) || path.extname(file.name) || ".jpg";
-  const filename = `${randomUUID()}${ext}`;
-  return uploadToLocal(buffer, filename, folder);
+  const lengthRaw = Number(req.headers.get("content-length"));
+  return storeImageStream({
+    body: req.body,
+    mime: contentType.split(";")[0].trim(),
+    folder,
+    maxBytes,
+    contentLength: Number.isFinite(lengthRaw) ? lengthRaw : null,
+  });
 }
 
 export { UploadError };
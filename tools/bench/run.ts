@@ -0,0 +1,346 @@
+import "dotenv/config";
+
+import fs from "fs";
+import path from "path";
+import { performance } from "perf_hooks";
+import { Pool } from "pg";
+import { SignJWT } from "jose";
+
+// Load test for the hot API routes against a running server seeded by prisma/bench-seed.ts.
+//
+//   npm run bench:seed                               # once: synthetic volume
+//   npm run build && npm start                       # bench a production build, not `next dev`
+//   npm run bench                                    # all routes, compare to tools/bench/baseline.json
+//   npm run bench -- --routes=found.list,staff.reports --concurrency=32 --duration=20
+//   npm run bench -- --save-baseline                 # record this run as the new baseline
+//
+// The baseline is not committed: latencies depend on the machine and data volume, so record one
+// locally with --save-baseline before comparing (or point --baseline=<file> at a shared one).
+//
+// Each route runs on its own (closed loop, `concurrency` workers) so latencies and query counts
+// aren't mixed. Results are written to tools/bench/results/<timestamp>.json.
+// Exit code 1 when any route regressed against the baseline beyond --threshold.
+
+const args = process.argv.slice(2);
+
+function opt(name: string) {
+  return args.find((a) => a.startsWith(`--${name}=`))?.split("=").slice(1).join("=");
+}
+
+function num(name: string, fallback: number) {
+  const n = Number(opt(name) ?? process.env[`BENCH_${name.toUpperCase()}`]);
+  return Number.isFinite(n) && n > 0 ? n : fallback;
+}
+
+const BASE_URL = (opt("url") || process.env.BENCH_URL || "http://127.0.0.1:3000").replace(/\/$/, "");
+const CONCURRENCY = num("concurrency", 16);
+const DURATION_S = num("duration", 15);
+const WARMUP_S = num("warmup", 3);
+// Allowed slowdown before a route counts as regressed (0.2 = p95 up or throughput down by 20%)
+const THRESHOLD = num("threshold", 0.2);
+const BENCH_DIR = path.join(process.cwd(), "tools", "bench");
+const BASELINE_PATH = opt("baseline") || path.join(BENCH_DIR, "baseline.json");
+const saveBaseline = args.includes("--save-baseline");
+
+const secret = process.env.AUTH_SECRET;
+if (!secret) throw new Error("Missing AUTH_SECRET in .env");
+const key = new TextEncoder().encode(secret);
+
+const pool = new Pool({ connectionString: process.env.DATABASE_URL, max: 2 });
+
+type BenchUser = { user_id: number; email: string; full_name: string; role: "USER" | "STAFF" | "ADMIN" };
+
+type Fixtures = {
+  staffCookie: string;
+  userCookies: string[];
+  lostIds: number[];
+  categoryIds: number[];
+  locationIds: number[];
+};
+
+type RequestSpec = { path: string; cookie: string; method?: "GET" | "POST"; body?: unknown };
+
+type Scenario = { name: string; next: (f: Fixtures, i: number) => RequestSpec };
+
+const SEARCH_WORDS = ["", "", "", "wallet", "black", "umbrella", "student id", "charger", "blue backpack"];
+
+const SCENARIOS: Scenario[] = [
+  {
+    name: "found.list",
+    next: (f, i) => {
+      const q = SEARCH_WORDS[i % SEARCH_WORDS.length];
+      const page = 1 + (i % 20);
+      return {
+        path: `/api/found/list?page=${page}&pageSize=12${q ? `&q=${encodeURIComponent(q)}` : ""}`,
+        cookie: f.userCookies[i % f.userCookies.length],
+      };
+    },
+  },
+  {
+    name: "matches.suggest",
+    next: (f, i) => ({
+      path: `/api/matches/suggest?lostId=${f.lostIds[(i * 7919) % f.lostIds.length]}`,
+      cookie: f.staffCookie,
+    }),
+  },
+  {
+    name: "notifications",
+    next: (f, i) => ({ path: "/api/notifications?limit=20", cookie: f.userCookies[i % f.userCookies.length] }),
+  },
+  {
+    name: "staff.reports",
+    next: (f) => ({ path: "/api/staff/reports", cookie: f.staffCookie }),
+  },
+  {
+    name: "found.create",
+    next: (f, i) => ({
+      path: "/api/found/create",
+      method: "POST",
+      cookie: f.staffCookie,
+      body: {
+        categoryId: f.categoryIds[i % f.categoryIds.length],
+        locationId: f.locationIds[i % f.locationIds.length],
+        itemName: `Bench Black Wallet ${i}`,
+        description: "Black bi-fold wallet left on a cafeteria table. Bench run.",
+        storageLocation: "Security Office - Bench Shelf",
+        dateFound: new Date().toISOString().slice(0, 10),
+      },
+    }),
+  },
+];
+
+async function sessionCookie(u: BenchUser) {
+  const token = await new SignJWT({ userId: u.user_id, role: u.role, email: u.email, name: u.full_name, avatarUrl: null })
+    .setProtectedHeader({ alg: "HS256" })
+    .setIssuedAt()
+    .setExpirationTime("1h")
+    .sign(key);
+  return `foundit_session=${token}`;
+}
+
+async function loadFixtures(): Promise<Fixtures> {
+  // Bench staff (created first) + up to 200 reporters to spread per-user caches realistically
+  const users = await pool.query<BenchUser>(
+    `SELECT u.user_id, u.email, u.full_name, upper(r.role_name) AS role
+       FROM users u JOIN roles r ON r.role_id = u.role_id
+      WHERE u.email LIKE 'bench-%'
+      ORDER BY u.user_id
+      LIMIT 201`
+  );
+  const staff = users.rows.find((u) => u.role === "STAFF");
+  const reporters = users.rows.filter((u) => u.role === "USER");
+  if (!staff || !reporters.length) {
+    throw new Error("No bench users found. Run `npm run bench:seed` first.");
+  }
+
+  const lost = await pool.query<{ lost_id: number }>(
+    `SELECT lost_id FROM lost_items WHERE user_id = ANY($1) ORDER BY lost_id LIMIT 5000`,
+    [reporters.map((u) => u.user_id)]
+  );
+  const cats = await pool.query<{ category_id: number }>(`SELECT category_id FROM categories ORDER BY category_id`);
+  const locs = await pool.query<{ location_id: number }>(`SELECT location_id FROM locations ORDER BY location_id`);
+
+  return {
+    staffCookie: await sessionCookie(staff),
+    userCookies: await Promise.all(reporters.map(sessionCookie)),
+    lostIds: lost.rows.map((r) => r.lost_id),
+    categoryIds: cats.rows.map((r) => r.category_id),
+    locationIds: locs.rows.map((r) => r.location_id),
+  };
+}
+
+// Statements executed by the database, from pg_stat_statements (null when the extension isn't enabled)
+async function statementCount(): Promise<number | null> {
+  try {
+    const r = await pool.query<{ n: string }>(
+      `SELECT coalesce(sum(calls), 0)::bigint AS n FROM pg_stat_statements
+        WHERE dbid = (SELECT oid FROM pg_database WHERE datname = current_database())`
+    );
+    return Number(r.rows[0].n);
+  } catch {
+    return null;
+  }
+}
+
+async function send(spec: RequestSpec) {
+  const res = await fetch(BASE_URL + spec.path, {
+    method: spec.method || "GET",
+    headers: {
+      cookie: spec.cookie,
+      "user-agent": "foundit-bench",
+      ...(spec.body ? { "content-type": "application/json" } : {}),
+    },
+    body: spec.body ? JSON.stringify(spec.body) : undefined,
+  });
+  await res.arrayBuffer();
+  return res.ok;
+}
+
+async function drive(s: Scenario, f: Fixtures, seconds: number, counter: { i: number }) {
+  const latencies: number[] = [];
+  let errors = 0;
+  const until = performance.now() + seconds * 1000;
+
+  const worker = async () => {
+    while (performance.now() < until) {
+      const spec = s.next(f, counter.i++);
+      const t0 = performance.now();
+      let ok = false;
+      try {
+        ok = await send(spec);
+      } catch {
+        ok = false;
+      }
+      latencies.push(performance.now() - t0);
+      if (!ok) errors++;
+    }
+  };
+
+  const t0 = performance.now();
+  await Promise.all(Array.from({ length: CONCURRENCY }, worker));
+  return { latencies, errors, elapsedMs: performance.now() - t0 };
+}
+
+function percentile(sorted: number[], p: number) {
+  if (!sorted.length) return 0;
+  const idx = Math.min(sorted.length - 1, Math.ceil((p / 100) * sorted.length) - 1);
+  return sorted[Math.max(0, idx)];
+}
+
+const round = (n: number) => Math.round(n * 100) / 100;
+
+type RouteResult = {
+  requests: number;
+  errors: number;
+  throughputRps: number;
+  latencyMs: { p50: number; p95: number; p99: number; mean: number; max: number };
+  queriesPerRequest: number | null;
+};
+
+async function runScenario(s: Scenario, f: Fixtures): Promise<RouteResult> {
+  const counter = { i: 0 };
+  if (WARMUP_S) await drive(s, f, WARMUP_S, counter);
+
+  const before = await statementCount();
+  const { latencies, errors, elapsedMs } = await drive(s, f, DURATION_S, counter);
+  const after = await statementCount();
+
+  const sorted = latencies.slice().sort((a, b) => a - b);
+  const total = sorted.reduce((a, b) => a + b, 0);
+  // -1: the "before" snapshot itself is counted
+  const queries = before !== null && after !== null ? after - before - 1 : null;
+
+  return {
+    requests: sorted.length,
+    errors,
+    throughputRps: round(sorted.length / (elapsedMs / 1000)),
+    latencyMs: {
+      p50: round(percentile(sorted, 50)),
+      p95: round(percentile(sorted, 95)),
+      p99: round(percentile(sorted, 99)),
+      mean: round(sorted.length ? total / sorted.length : 0),
+      max: round(sorted[sorted.length - 1] || 0),
+    },
+    queriesPerRequest: queries !== null && sorted.length ? round(queries / sorted.length) : null,
+  };
+}
+
+type Report = {
+  startedAt: string;
+  baseUrl: string;
+  concurrency: number;
+  durationS: number;
+  routes: Record<string, RouteResult>;
+};
+
+function compare(current: Report, baseline: Report) {
+  const rows: string[] = [];
+  let regressed = false;
+
+  for (const [name, cur] of Object.entries(current.routes)) {
+    const base = baseline.routes[name];
+    if (!base) {
+      rows.push(`${name.padEnd(18)} (no baseline)`);
+      continue;
+    }
+
+    const p95 = base.latencyMs.p95 ? cur.latencyMs.p95 / base.latencyMs.p95 - 1 : 0;
+    const rps = base.throughputRps ? cur.throughputRps / base.throughputRps - 1 : 0;
+    const q =
+      cur.queriesPerRequest !== null && base.queriesPerRequest !== null
+        ? cur.queriesPerRequest - base.queriesPerRequest
+        : null;
+
+    const bad = p95 > THRESHOLD || rps < -THRESHOLD || (q !== null && q >= 1) || cur.errors > base.errors;
+    regressed ||= bad;
+
+    const pct = (x: number) => `${x >= 0 ? "+" : ""}${(x * 100).toFixed(1)}%`;
+    rows.push(
+      `${name.padEnd(18)} p95 ${pct(p95).padStart(8)}  rps ${pct(rps).padStart(8)}  ` +
+        `queries/req ${q === null ? "n/a" : (q >= 0 ? "+" : "") + q.toFixed(2)}${bad ? "  REGRESSED" : ""}`
+    );
+  }
+
+  return { rows, regressed };
+}
+
+async function main() {
+  const only = opt("routes")?.split(",").map((s) => s.trim());
+  const scenarios = only ? SCENARIOS.filter((s) => only.includes(s.name)) : SCENARIOS;
+  if (!scenarios.length) throw new Error(`Unknown routes. Available: ${SCENARIOS.map((s) => s.name).join(", ")}`);
+
+  const fixtures = await loadFixtures();
+  if ((await statementCount()) === null) {
+    console.warn("pg_stat_statements not available: query counts will be null.");
+  }
+
+  const report: Report = {
+    startedAt: new Date().toISOString(),
+    baseUrl: BASE_URL,
+    concurrency: CONCURRENCY,
+    durationS: DURATION_S,
+    routes: {},
+  };
+
+  for (const s of scenarios) {
+    process.stdout.write(`${s.name}... `);
+    const r = await runScenario(s, fixtures);
+    report.routes[s.name] = r;
+    console.log(
+      `${r.requests} req, ${r.throughputRps} req/s, p50 ${r.latencyMs.p50} ms, p95 ${r.latencyMs.p95} ms, ` +
+        `p99 ${r.latencyMs.p99} ms, ${r.errors} errors, ${r.queriesPerRequest ?? "n/a"} queries/req`
+    );
+  }
+
+  const resultsDir = path.join(BENCH_DIR, "results");
+  fs.mkdirSync(resultsDir, { recursive: true });
+  const outPath = path.join(resultsDir, `${report.startedAt.replace(/[:.]/g, "-")}.json`);
+  fs.writeFileSync(outPath, JSON.stringify(report, null, 2) + "\n");
+  console.log(`\nResults: ${path.relative(process.cwd(), outPath)}`);
+
+  if (saveBaseline) {
+    fs.writeFileSync(BASELINE_PATH, JSON.stringify(report, null, 2) + "\n");
+    console.log(`Baseline saved: ${path.relative(process.cwd(), BASELINE_PATH)}`);
+    return;
+  }
+
+  if (!fs.existsSync(BASELINE_PATH)) {
+    console.log("No baseline yet (run with --save-baseline to record one).");
+    return;
+  }
+
+  const baseline = JSON.parse(fs.readFileSync(BASELINE_PATH, "utf8")) as Report;
+  const { rows, regressed } = compare(report, baseline);
+  console.log(`\nAgainst baseline from ${baseline.startedAt} (threshold ${(THRESHOLD * 100).toFixed(0)}%):`);
+  for (const row of rows) console.log("  " + row);
+  if (regressed) process.exitCode = 1;
+}
+
+main()
+  .catch((e) => {
+    console.error(e);
+    process.exit(1);
+  })
+  .finally(async () => {
+    await pool.end();
+  });
@@ -0,0 +1,129 @@
+import {
+  buildMatchColumns,
+  matchTokens,
+  scoreLostVsFound,
+  topMatches,
+  type IndexedMatchInput,
+  type MatchInput,
+  type MatchSide,
+  type RankedMatch,
+} from "../../src/lib/matching";
+
+// Parity check: the batch ranker (buildMatchColumns + topMatches) against the reference path
+// (scoreLostVsFound on every candidate, filter by minScore, stable sort by score, take k).
+//
+//   npm run matchcheck                                  # 500 random cases per side
+//   npm run matchcheck -- --cases=5000 --seed=42
+//
+// No database: fixtures are generated from a seeded PRNG, so a failing --seed reproduces.
+// Both sides are checked (a lost report vs found items, a found item vs lost reports), with
+// ids, scores, reasons and order compared exactly. Exit code 1 on the first mismatch.
+
+const args = process.argv.slice(2);
+
+function opt(name: string) {
+  return args.find((a) => a.startsWith(`--${name}=`))?.split("=").slice(1).join("=");
+}
+
+const CASES = Math.max(1, Number(opt("cases") ?? 500) || 500);
+const SEED = Number(opt("seed") ?? Date.now() % 2 ** 31) >>> 0;
+
+// mulberry32
+function prng(seed: number) {
+  let a = seed;
+  return () => {
+    a = (a + 0x6d2b79f5) | 0;
+    let t = Math.imul(a ^ (a >>> 15), 1 | a);
+    t = (t + Math.imul(t ^ (t >>> 7), 61 | t)) ^ t;
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+}
+
+const rand = prng(SEED);
+const int = (n: number) => Math.floor(rand() * n);
+const pick = <T>(xs: readonly T[]) => xs[int(xs.length)];
+
+// Small vocabulary (with case/punctuation noise) so keyword overlap is common
+const WORDS = [
+  "black", "Black", "wallet", "wallet,", "leather", "ID", "id", "card", "blue", "umbrella",
+  "earbuds", "AirPods", "phone", "iPhone", "case", "keys", "keychain", "red", "bag", "notebook",
+  "calculator", "USB", "flash-drive", "water", "bottle", "jacket", "a", "the", "with", "of",
+] as const;
+
+const BASE_TIME = Date.UTC(2026, 0, 15);
+const HOUR_MS = 60 * 60 * 1000;
+
+function phrase(min: number, max: number) {
+  return Array.from({ length: min + int(max - min + 1) }, () => pick(WORDS)).join(" ");
+}
+
+function fixture(): MatchInput {
+  return {
+    item_name: phrase(1, 3),
+    description: rand() < 0.15 ? null : phrase(0, 8),
+    category_id: 1 + int(4),
+    location_id: 1 + int(5),
+    // Up to ~10 days either side, at any hour: exercises the 1/3/7-day boundaries
+    date: new Date(BASE_TIME + (int(480) - 240) * HOUR_MS + int(HOUR_MS)),
+  };
+}
+
+function indexed(m: MatchInput): IndexedMatchInput {
+  return {
+    tokens: matchTokens(m.item_name, m.description),
+    category_id: m.category_id,
+    location_id: m.location_id,
+    date: m.date,
+  };
+}
+
+function reference(query: MatchInput, side: MatchSide, candidates: MatchInput[], k: number, minScore: number) {
+  const scored: RankedMatch[] = candidates.map((c, i) => ({
+    id: i + 1,
+    ...(side === "lost" ? scoreLostVsFound(query, c) : scoreLostVsFound(c, query)),
+  }));
+  // Array.prototype.sort is stable: ties keep candidate order, as topMatches promises
+  return scored
+    .filter((s) => s.score >= minScore)
+    .sort((a, b) => b.score - a.score)
+    .slice(0, k);
+}
+
+function batch(query: MatchInput, side: MatchSide, candidates: MatchInput[], k: number, minScore: number) {
+  const cols = buildMatchColumns(candidates.map((c, i) => ({ id: i + 1, ...indexed(c) })));
+  return topMatches(indexed(query), side, cols, { k, minScore });
+}
+
+function same(a: RankedMatch[], b: RankedMatch[]) {
+  return JSON.stringify(a) === JSON.stringify(b);
+}
+
+function main() {
+  let compared = 0;
+
+  for (const side of ["lost", "found"] as const) {
+    for (let c = 0; c < CASES; c++) {
+      const query = fixture();
+      const candidates = Array.from({ length: int(200) }, fixture);
+      const k = pick([1, 5, 10, 30, 250]);
+      const minScore = pick([0, 20, 40, 65]);
+
+      const want = reference(query, side, candidates, k, minScore);
+      const got = batch(query, side, candidates, k, minScore);
+      compared += want.length;
+
+      if (!same(want, got)) {
+        console.error(`FAIL side=${side} case=${c} k=${k} minScore=${minScore} (seed ${SEED})`);
+        console.error(`  query:     ${JSON.stringify(query)}`);
+        console.error(`  reference: ${JSON.stringify(want.slice(0, 5))}${want.length > 5 ? " …" : ""}`);
+        console.error(`  batch:     ${JSON.stringify(got.slice(0, 5))}${got.length > 5 ? " …" : ""}`);
+        process.exitCode = 1;
+        return;
+      }
+    }
+  }
+
+  console.log(`ok  ${CASES * 2} cases, ${compared} ranked matches identical (seed ${SEED})`);
+}
+
+main();
@@ -0,0 +1,4 @@
+from .engine import SOURCE_GLOBS, Patch, apply_patches
+from .runner import discover, run, summarize
+
+__all__ = ["SOURCE_GLOBS", "Patch", "apply_patches", "discover", "run", "summarize"]
@@ -0,0 +1,92 @@
+"""
+Apply registered UI patches across src/app and src/components.
+
+    python -m tools.patchkit                 # apply all patches
+    python -m tools.patchkit --check         # dry run: show diff, exit 1 if anything would change
+    python -m tools.patchkit --only found-grid-cards
+    python -m tools.patchkit --files src/app/found/page.tsx
+    python -m tools.patchkit --json          # machine-readable timing report
+    python -m tools.patchkit --list
+    python -m tools.patchkit --restore src/app/found/page.tsx
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from .backups import BackupStore
+from .patches import PATCHES, select
+from .runner import discover, run, summarize
+
+
+def print_report(summary: dict):
+    print()
+    print(f"{'patch':24} {'matched':>8} {'applied':>8} {'match ms':>10} {'bytes':>10}")
+    for name, s in summary["patches"].items():
+        print(f"{name:24} {s['files_matched']:>8} {s['files_applied']:>8} {s['match_ms']:>10.3f} {s['bytes_rewritten']:>10}")
+    print(
+        f"\n{summary['files_scanned']} file(s) scanned, {summary['files_touched']} touched, "
+        f"{summary['bytes_written']} bytes written, index {summary['index_ms']:.3f} ms, "
+        f"wall {summary['wall_ms']:.3f} ms"
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(prog="python -m tools.patchkit")
+    ap.add_argument("--check", action="store_true", help="dry run: print a unified diff, write nothing")
+    ap.add_argument("--only", nargs="+", metavar="NAME", help="apply only these patches")
+    ap.add_argument("--files", nargs="+", metavar="PATH", help="restrict to these repo-relative files")
+    ap.add_argument("--json", action="store_true", help="print the timing report as JSON")
+    ap.add_argument("--quiet", action="store_true", help="only print changes and errors")
+    ap.add_argument("--list", action="store_true", help="list registered patches")
+    ap.add_argument("--no-backup", action="store_true", help="skip backups of rewritten files")
+    ap.add_argument("--restore", metavar="PATH", help="restore PATH from its latest backup")
+    ap.add_argument("--root", default=".", help="repository root (default: current directory)")
+    args = ap.parse_args(argv)
+
+    root = Path(args.root).resolve()
+
+    if args.list:
+        for p in PATCHES:
+            print(f"{p.name:24} {p.description}")
+        return 0
+
+    if args.restore:
+        digest = BackupStore(root).restore(args.restore)
+        print(f"OK: restored {args.restore} ({digest[:12]})")
+        return 0
+
+    patches = select(args.only)
+    work = discover(root, patches, args.files)
+    reports, wall_s = run(root, work, check=args.check, backup=not args.no_backup)
+    summary = summarize(reports, patches, wall_s)
+
+    out = sys.stderr if args.json else sys.stdout
+    for r in reports:
+        if r.error:
+            print(f"ERROR: {r.path}: {r.error}", file=out)
+            continue
+        if not args.quiet:
+            for name, status in r.statuses.items():
+                print(f"{r.path}: {name}: {status}", file=out)
+        if args.check and r.diff:
+            out.write(r.diff)
+        elif r.changed:
+            backup = f" (backup {r.backup[:12]})" if r.backup else ""
+            print(f"OK: {r.path}: {r.bytes_written} bytes written{backup}", file=out)
+
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        print_report(summary)
+
+    if summary["errors"]:
+        return 2
+    return 1 if args.check and summary["files_touched"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
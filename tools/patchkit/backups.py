@@ -0,0 +1,64 @@
+"""
+Content-addressed backups: each distinct file content is stored once under
+.patch-backups/objects/<sha256>, and manifest.jsonl records which path had which
+content when. Re-running a rollout over unchanged files costs no extra disk.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+
+BACKUP_DIR = ".patch-backups"
+
+
+class BackupStore:
+    def __init__(self, root: Path):
+        self.root = root
+        self.dir = root / BACKUP_DIR
+        self.objects = self.dir / "objects"
+        self.manifest = self.dir / "manifest.jsonl"
+
+    def save(self, path: Path, content: str) -> str:
+        data = content.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        obj = self.objects / digest[:2] / digest
+        if not obj.exists():
+            obj.parent.mkdir(parents=True, exist_ok=True)
+            # Parallel workers may store the same content at once; rename makes that harmless
+            fd, tmp = tempfile.mkstemp(dir=obj.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, obj)
+
+        entry = {
+            "at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "path": path.relative_to(self.root).as_posix(),
+            "sha256": digest,
+        }
+        # One short O_APPEND write per entry, so concurrent workers don't interleave lines
+        with self.manifest.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+        return digest
+
+    def latest(self, rel: str) -> str | None:
+        if not self.manifest.exists():
+            return None
+        digest = None
+        for line in self.manifest.read_text(encoding="utf-8").splitlines():
+            entry = json.loads(line)
+            if entry["path"] == rel:
+                digest = entry["sha256"]
+        return digest
+
+    def restore(self, rel: str) -> str:
+        digest = self.latest(rel)
+        if digest is None:
+            raise SystemExit(f"ERROR: no backup recorded for {rel}")
+        data = (self.objects / digest[:2] / digest).read_bytes()
+        (self.root / rel).write_bytes(data)
+        return digest
@@ -0,0 +1,223 @@
+"""Anchor-based source patch engine.
+
+A Patch names a block by literal anchors (no regex, so no backtracking):
+
+    start anchor ... end anchor      -> replaced by `replacement`
+    start anchor                     -> replaced by `replacement` (end=None)
+
+The replacement is written at the indentation of the start anchor's line.
+All patches for a file are resolved against one anchor index built from a single
+read, applied together, and the file is written once.
+"""
+
+from __future__ import annotations
+
+import bisect
+import difflib
+import re
+import textwrap
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+# Statuses reported per (patch, file)
+APPLIED = "applied"
+ALREADY = "already-applied"
+MISSING = "anchor-not-found"
+AMBIGUOUS = "ambiguous-anchor"
+NO_END = "end-not-found"
+GUARD = "guard-failed"
+CONFLICT = "conflict"
+
+_WS = re.compile(r"\s+")
+
+# Default targets: every component/page in the app
+SOURCE_GLOBS = ("src/app/**/*.tsx", "src/components/**/*.tsx")
+
+
+def _normalize(text: str) -> str:
+    return _WS.sub(" ", text).strip()
+
+
+@dataclass(frozen=True)
+class Patch:
+    name: str
+    # Literal start anchors; the first one present in the file wins (later ones are fallbacks)
+    start: tuple[str, ...]
+    replacement: str
+    # Repo-relative files or globs
+    targets: tuple[str, ...] = SOURCE_GLOBS
+    # Literal end anchor (inclusive). None: only the start anchor itself is replaced.
+    end: str | None = None
+    # End anchor must open a line at the start line's indentation (closes the same JSX block)
+    end_at_indent: bool = True
+    # Literals that must all appear inside the matched block, or the patch is skipped
+    within: tuple[str, ...] = ()
+    description: str = ""
+
+    def block(self, indent: str) -> str:
+        body = textwrap.dedent(self.replacement).strip("\n")
+        return "\n".join(indent + line if line.strip() else "" for line in body.splitlines())
+
+    @property
+    def anchors(self) -> tuple[str, ...]:
+        return self.start + ((self.end,) if self.end else ()) + self.within
+
+    @property
+    def marker(self) -> str:
+        # Whitespace-insensitive, so re-indentation doesn't defeat idempotence detection
+        return _normalize(textwrap.dedent(self.replacement))
+
+
+class AnchorIndex:
+    """Every occurrence of every anchor, found with one C-level scan per distinct anchor."""
+
+    def __init__(self, text: str, anchors: set[str]):
+        self.text = text
+        self.positions: dict[str, list[int]] = {}
+        for anchor in anchors:
+            hits: list[int] = []
+            i = text.find(anchor)
+            while i != -1:
+                hits.append(i)
+                i = text.find(anchor, i + 1)
+            self.positions[anchor] = hits
+
+    def first_after(self, anchor: str, pos: int) -> int | None:
+        hits = self.positions.get(anchor, [])
+        k = bisect.bisect_left(hits, pos)
+        return hits[k] if k < len(hits) else None
+
+    def after(self, anchor: str, pos: int):
+        hits = self.positions.get(anchor, [])
+        return hits[bisect.bisect_left(hits, pos):]
+
+
+@dataclass
+class Edit:
+    start: int
+    end: int
+    text: str
+    patch: str
+
+
+@dataclass
+class FileResult:
+    path: Path
+    before: str
+    after: str
+    statuses: dict[str, str] = field(default_factory=dict)
+    passes: int = 0
+    # Seconds spent matching each patch (idempotence check + anchor resolution)
+    match_s: dict[str, float] = field(default_factory=dict)
+    # UTF-8 bytes each patch replaced
+    rewritten: dict[str, int] = field(default_factory=dict)
+    index_s: float = 0.0
+
+    @property
+    def changed(self) -> bool:
+        return self.before != self.after
+
+    def diff(self, root: Path) -> str:
+        rel = self.path.relative_to(root).as_posix() if self.path.is_absolute() else self.path.as_posix()
+        return "".join(
+            difflib.unified_diff(
+                self.before.splitlines(keepends=True),
+                self.after.splitlines(keepends=True),
+                fromfile=f"a/{rel}",
+                tofile=f"b/{rel}",
+            )
+        )
+
+
+def _line_start(text: str, pos: int) -> int:
+    return text.rfind("\n", 0, pos) + 1
+
+
+def _resolve(patch: Patch, index: AnchorIndex) -> tuple[str, Edit | None]:
+    text = index.text
+
+    anchor = next((a for a in patch.start if index.positions.get(a)), None)
+    if anchor is None:
+        return MISSING, None
+    hits = index.positions[anchor]
+    if len(hits) > 1:
+        return AMBIGUOUS, None
+
+    at = hits[0]
+    ls = _line_start(text, at)
+    lead = text[ls:at]
+    # Anchor opens its line: replace from the line start so the indent is rewritten cleanly
+    indent = lead if not lead.strip() else ""
+    span_start = ls if indent == lead else at
+
+    if patch.end is None:
+        span_end = at + len(anchor)
+    else:
+        span_end = None
+        for e in index.after(patch.end, at + len(anchor)):
+            if not patch.end_at_indent or (text[_line_start(text, e):e] == indent):
+                span_end = e + len(patch.end)
+                break
+        if span_end is None:
+            return NO_END, None
+
+    for lit in patch.within:
+        hit = index.first_after(lit, span_start)
+        if hit is None or hit + len(lit) > span_end:
+            return GUARD, None
+
+    return APPLIED, Edit(span_start, span_end, patch.block(indent), patch.name)
+
+
+def apply_patches(path: Path, text: str, patches: list[Patch], max_passes: int | None = None) -> FileResult:
+    """
+    Apply every patch to `text` (the contents of `path`) in memory.
+
+    A patch whose anchor only exists after another patch ran (e.g. a restyle of a block an
+    earlier patch introduced) is picked up by a further pass over the in-memory text; the
+    file on disk is still read and written once.
+    """
+    result = FileResult(path=path, before=text, after=text)
+    pending = list(patches)
+    max_passes = max_passes or max(1, len(patches))
+
+    current = text
+    while pending and result.passes < max_passes:
+        result.passes += 1
+        t0 = time.perf_counter()
+        norm = _normalize(current)
+        index = AnchorIndex(current, {a for p in pending for a in p.anchors})
+        result.index_s += time.perf_counter() - t0
+
+        edits: list[Edit] = []
+        retry: list[Patch] = []
+        for patch in pending:
+            t0 = time.perf_counter()
+            if patch.marker and patch.marker in norm:
+                status, edit = ALREADY, None
+            else:
+                status, edit = _resolve(patch, index)
+            result.match_s[patch.name] = result.match_s.get(patch.name, 0.0) + time.perf_counter() - t0
+
+            if edit is not None and any(edit.start < e.end and e.start < edit.end for e in edits):
+                status, edit = CONFLICT, None
+
+            result.statuses[patch.name] = status
+            if edit is not None:
+                edits.append(edit)
+                result.rewritten[patch.name] = result.rewritten.get(patch.name, 0) + len(
+                    current[edit.start : edit.end].encode("utf-8")
+                )
+            elif status == MISSING:
+                retry.append(patch)
+
+        if not edits:
+            break
+
+        for e in sorted(edits, key=lambda e: e.start, reverse=True):
+            current = current[: e.start] + e.text + current[e.end :]
+        pending = retry
+
+    result.after = current
+    return result
@@ -0,0 +1,262 @@
+"""
+Registered patches. Ported from the one-off scripts/*.py and tools/patch_found_filters.py;
+order matters only for chained patches (a later one may anchor on an earlier one's output).
+"""
+
+from __future__ import annotations
+
+from .engine import Patch
+
+FOUND_PAGE = "src/app/found/page.tsx"
+
+# Current filter card; both filter patches bring older layouts up to it
+FOUND_FILTERS = r"""
+<Card className="rounded-3xl border border-[rgba(0,0,0,0.06)] bg-secondary/60 p-0 shadow-[0_6px_20px_rgba(0,0,0,0.04)]">
+  <div className="p-2.5 md:p-3">
+    <form onSubmit={onSearchSubmit} className="flex flex-col gap-3">
+      <div className="flex flex-col gap-3 lg:flex-row lg:items-center lg:gap-3">
+        <div className="relative flex-1">
+          <Search className="pointer-events-none absolute left-3 top-1/2 size-4 -translate-y-1/2 text-muted-foreground" />
+          <Input
+            className="h-10 rounded-2xl border-0 bg-background/60 pl-9 shadow-none ring-0 transition-colors placeholder:text-muted-foreground/80 hover:bg-background/75 focus-visible:bg-background/90 focus-visible:ring-2 focus-visible:ring-ring/25"
+            placeholder="Search keywords (e.g., wallet, ID, earbuds)..."
+            value={q}
+            onChange={(e) => setQ(e.target.value)}
+          />
+        </div>
+
+        <Button
+          type="submit"
+          className="h-10 rounded-2xl px-4 shadow-sm transition active:scale-[0.98]"
+          disabled={loading}
+        >
+          Apply
+        </Button>
+      </div>
+
+      <div className="rounded-2xl bg-background/45 p-2 ring-1 ring-[rgba(0,0,0,0.06)]">
+        <div className="flex flex-wrap items-center justify-between gap-2 px-1 text-xs text-muted-foreground/70">
+          <div className="inline-flex items-center gap-1 rounded-full bg-background/70 px-2 py-1">
+            <SlidersHorizontal className="size-3.5" />
+            <span className="tracking-wide">Filters</span>
+          </div>
+          {!isStaff ? (
+            <label className="inline-flex items-center gap-2 rounded-full bg-background/70 px-2 py-1 text-[11px]">
+              <span>Include claimed</span>
+              <Switch size="sm" checked={includeClaimed} onCheckedChange={setIncludeClaimed} />
+            </label>
+          ) : null}
+        </div>
+
+        <div className="mt-2 grid gap-2 sm:grid-cols-2 lg:grid-cols-6">
+          <Select value={categoryId} onValueChange={(v) => setCategoryId(v)} disabled={optionsLoading}>
+            <SelectTrigger className="h-10 w-full rounded-2xl border-0 bg-background/60 shadow-none ring-0 transition-colors hover:bg-background/75 focus:ring-2 focus:ring-ring/25">
+              <SelectValue placeholder={optionsLoading ? "Loading..." : "Category"} />
+            </SelectTrigger>
+            <SelectContent>
+              <SelectItem value="all">All categories</SelectItem>
+              {categories.map((c) => (
+                <SelectItem key={c.category_id} value={String(c.category_id)}>
+                  {c.category_name}
+                </SelectItem>
+              ))}
+            </SelectContent>
+          </Select>
+
+          <Select value={locationId} onValueChange={(v) => setLocationId(v)} disabled={optionsLoading}>
+            <SelectTrigger className="h-10 w-full rounded-2xl border-0 bg-background/60 shadow-none ring-0 transition-colors hover:bg-background/75 focus:ring-2 focus:ring-ring/25">
+              <SelectValue placeholder={optionsLoading ? "Loading..." : "Location"} />
+            </SelectTrigger>
+            <SelectContent>
+              <SelectItem value="all">All locations</SelectItem>
+              {locations.map((l) => (
+                <SelectItem key={l.location_id} value={String(l.location_id)}>
+                  {l.location_name}
+                </SelectItem>
+              ))}
+            </SelectContent>
+          </Select>
+
+          <Select value={status} onValueChange={(v) => setStatus(v)}>
+            <SelectTrigger className="h-10 w-full rounded-2xl border-0 bg-background/60 shadow-none ring-0 transition-colors hover:bg-background/75 focus:ring-2 focus:ring-ring/25">
+              <SelectValue placeholder="Status" />
+            </SelectTrigger>
+            <SelectContent>
+              <SelectItem value="all">All statuses</SelectItem>
+              {statusOptions.map((s) => (
+                <SelectItem key={s.value} value={s.value}>
+                  {s.label}
+                </SelectItem>
+              ))}
+            </SelectContent>
+          </Select>
+
+          <div className="relative">
+            <CalendarDays className="pointer-events-none absolute left-3 top-1/2 size-4 -translate-y-1/2 text-muted-foreground" />
+            <Input
+              type="date"
+              className="h-10 rounded-2xl border-0 bg-background/60 pl-9 shadow-none ring-0 transition-colors hover:bg-background/75 focus-visible:bg-background/90 focus-visible:ring-2 focus-visible:ring-ring/25"
+              value={dateFrom}
+              onChange={(e) => setDateFrom(e.target.value)}
+              aria-label="Date from"
+            />
+          </div>
+
+          <div className="relative">
+            <CalendarDays className="pointer-events-none absolute left-3 top-1/2 size-4 -translate-y-1/2 text-muted-foreground" />
+            <Input
+              type="date"
+              className="h-10 rounded-2xl border-0 bg-background/60 pl-9 shadow-none ring-0 transition-colors hover:bg-background/75 focus-visible:bg-background/90 focus-visible:ring-2 focus-visible:ring-ring/25"
+              value={dateTo}
+              onChange={(e) => setDateTo(e.target.value)}
+              aria-label="Date to"
+            />
+          </div>
+
+          <Select value={sortKey} onValueChange={(v) => setSortKey(v as SortKey)}>
+            <SelectTrigger className="h-10 w-full rounded-2xl border-0 bg-background/60 shadow-none ring-0 transition-colors hover:bg-background/75 focus:ring-2 focus:ring-ring/25">
+              <div className="flex items-center gap-2">
+                <ArrowUpDown className="size-4 text-muted-foreground" />
+                <SelectValue placeholder="Sort" />
+              </div>
+            </SelectTrigger>
+            <SelectContent>
+              {SORT_OPTIONS.map((s) => (
+                <SelectItem key={s.value} value={s.value}>
+                  {s.label}
+                </SelectItem>
+              ))}
+            </SelectContent>
+          </Select>
+        </div>
+      </div>
+    </form>
+  </div>
+</Card>
+"""
+
+# Contained-image result cards reading the md WebP variant
+FOUND_GRID_CARDS = r"""
+{items.map((it) => {
+  const src = it.image ? imageVariant(it.image, "md") : "/found-placeholder.svg";
+  const statusLabel = statusOptions.find((o) => o.value === it.status)?.label ?? it.status;
+
+  const statusKey = String(it.status || "").toUpperCase();
+  const tone =
+    statusKey === "NEWLY_FOUND"
+      ? "bg-emerald-500/12 text-emerald-700"
+      : statusKey === "CLAIMED"
+      ? "bg-zinc-500/12 text-zinc-700"
+      : "bg-blue-500/12 text-blue-700";
+
+  return (
+    <Link
+      key={it.found_id}
+      href={`/found/${it.found_id}`}
+      className="group block cursor-pointer rounded-3xl focus-visible:outline-none focus-visible:ring-2 focus-visible:ring-ring/25"
+    >
+      <Card className="rounded-3xl overflow-hidden p-0 bg-[#FCFCFD] ring-1 ring-[rgba(0,0,0,0.06)] shadow-[0_10px_30px_rgba(0,0,0,0.06)] transition-[transform,box-shadow] will-change-transform group-hover:-translate-y-0.5 group-hover:shadow-[0_16px_45px_rgba(0,0,0,0.10)]">
+        <div className="relative aspect-[4/3] overflow-hidden bg-secondary/70">
+          <div className="absolute inset-4">
+            <Image
+              src={src}
+              alt={it.item_name}
+              fill
+              className="object-contain transition duration-300 group-hover:scale-[1.03]"
+              sizes="(max-width: 1024px) 100vw, 33vw"
+              priority={false}
+            />
+          </div>
+
+          <div className="pointer-events-none absolute inset-x-0 bottom-0 h-10 bg-gradient-to-b from-transparent to-[#FCFCFD]" />
+
+          <div className="absolute left-3 top-3">
+            <Badge
+              variant="secondary"
+              className={
+                "rounded-full border-0 px-3 py-1 text-xs font-medium shadow-none backdrop-blur-sm " +
+                tone
+              }
+            >
+              {statusLabel}
+            </Badge>
+          </div>
+        </div>
+
+        <div className="bg-[#FCFCFD] p-5">
+          <div className="min-w-0">
+            <div className="text-[16px] font-semibold tracking-tight truncate underline-offset-4 group-hover:underline">
+              {it.item_name}
+            </div>
+
+            <div className="mt-1 flex flex-wrap items-center gap-2 text-[11px] text-muted-foreground/70">
+              <span className="inline-flex items-center gap-1">
+                <Tag className="size-3" />
+                {it.category.category_name}
+              </span>
+              <span className="inline-flex items-center gap-1">
+                <MapPin className="size-3" />
+                {it.location.location_name}
+              </span>
+            </div>
+          </div>
+
+          <p className="mt-3 text-[13px] text-muted-foreground/75 line-clamp-2">
+            {it.description}
+          </p>
+
+          <div className="mt-4 flex items-center justify-between text-[11px] text-muted-foreground/60">
+            <span>Found: {fmt.format(new Date(it.date_found))}</span>
+            <span className="inline-flex items-center gap-1 text-muted-foreground/50 opacity-0 transition-opacity group-hover:opacity-100">
+              <ChevronRight className="size-4" aria-hidden="true" />
+            </span>
+          </div>
+        </div>
+      </Card>
+    </Link>
+  );
+})}
+"""
+
+PATCHES: list[Patch] = [
+    Patch(
+        name="found-filters-card",
+        description="Found page: plain filter card -> current filter card (was tools/patch_found_filters.py)",
+        targets=(FOUND_PAGE,),
+        start=('<Card className="rounded-3xl p-5">',),
+        end="</Card>",
+        replacement=FOUND_FILTERS,
+    ),
+    Patch(
+        name="found-filters-bar",
+        description="Found page: h-11 dark-glass filter bar -> current filter card (was scripts/patch_found_filters_bar.py)",
+        targets=(FOUND_PAGE,),
+        start=(
+            '<Card className="rounded-3xl border border-black/5 bg-secondary/70 p-0 py-0 shadow-[0_8px_30px_rgba(0,0,0,0.06)]">',
+            '<Card className="rounded-3xl border border-black/5 bg-secondary/70 p-0 shadow-[0_8px_30px_rgba(0,0,0,0.06)]">',
+        ),
+        end="</Card>",
+        replacement=FOUND_FILTERS,
+    ),
+    # scripts/patch_found_grid_cards.py rewrote the same block and was superseded by v2.
+    # Guarded on the imageVariant line: the replacement needs the page's imageVariant import.
+    Patch(
+        name="found-grid-cards",
+        description="Found page: contained-image result cards (was scripts/patch_found_grid_cards_v2.py)",
+        targets=(FOUND_PAGE,),
+        start=("{items.map((it) => {",),
+        end="})}",
+        within=('const src = it.image ? imageVariant(it.image, "md") : "/found-placeholder.svg";',),
+        replacement=FOUND_GRID_CARDS,
+    ),
+]
+
+
+def select(names: list[str] | None = None) -> list[Patch]:
+    if not names:
+        return list(PATCHES)
+    known = {p.name: p for p in PATCHES}
+    unknown = [n for n in names if n not in known]
+    if unknown:
+        raise SystemExit(f"ERROR: unknown patch(es): {', '.join(unknown)}")
+    return [known[n] for n in names]
@@ -0,0 +1,182 @@
+"""
+Runs patches over the target files, one file at a time. Every registered patch targets a
+single page, and a file's work is one read, an in-memory anchor scan and one write, so a
+process pool only ever added start-up cost.
+
+Each file is processed under an exclusive lock (so two rollouts can't interleave on
+the same component): read once, every patch for it applied, then replaced atomically
+(temp file in the same directory + os.replace).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .backups import BACKUP_DIR, BackupStore
+from .engine import ALREADY, APPLIED, Patch, apply_patches
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+@dataclass
+class FileReport:
+    path: str
+    statuses: dict[str, str] = field(default_factory=dict)
+    match_s: dict[str, float] = field(default_factory=dict)
+    rewritten: dict[str, int] = field(default_factory=dict)
+    index_s: float = 0.0
+    bytes_written: int = 0
+    changed: bool = False
+    diff: str = ""
+    backup: str | None = None
+    error: str | None = None
+
+
+def discover(root: Path, patches: list[Patch], only: list[str] | None = None) -> dict[str, list[Patch]]:
+    """Repo-relative target file -> patches for it. Each distinct glob is expanded once."""
+    expanded: dict[str, list[str]] = {}
+    by_file: dict[str, list[Patch]] = defaultdict(list)
+    wanted = {Path(p).as_posix() for p in only} if only else None
+
+    for patch in patches:
+        for target in patch.targets:
+            if target not in expanded:
+                if any(c in target for c in "*?["):
+                    expanded[target] = sorted(p.relative_to(root).as_posix() for p in root.glob(target) if p.is_file())
+                else:
+                    expanded[target] = [target]
+            for rel in expanded[target]:
+                if wanted is not None and rel not in wanted:
+                    continue
+                if patch not in by_file[rel]:
+                    by_file[rel].append(patch)
+    return dict(by_file)
+
+
+@contextmanager
+def file_lock(root: Path, rel: str, enabled: bool = True):
+    # Dry runs only read, and atomic replacement means they never see a half-written file
+    if not enabled:
+        yield
+        return
+
+    locks = root / BACKUP_DIR / "locks"
+    locks.mkdir(parents=True, exist_ok=True)
+    lock_path = locks / (hashlib.sha1(rel.encode("utf-8")).hexdigest() + ".lock")
+    with open(lock_path, "a+b") as f:
+        if fcntl:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def atomic_write(path: Path, data: bytes):
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            os.chmod(tmp, path.stat().st_mode & 0o7777)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def process_file(root: Path, rel: str, patches: list[Patch], check: bool, backup: bool) -> FileReport:
+    report = FileReport(path=rel)
+    path = root / rel
+    try:
+        with file_lock(root, rel, enabled=not check):
+            if not path.exists():
+                report.error = "not found"
+                return report
+
+            result = apply_patches(path, path.read_text(encoding="utf-8"), patches)
+            report.statuses = result.statuses
+            report.match_s = result.match_s
+            report.rewritten = result.rewritten
+            report.index_s = result.index_s
+            report.changed = result.changed
+            if not result.changed:
+                return report
+
+            if check:
+                report.diff = result.diff(root)
+                return report
+
+            if backup:
+                report.backup = BackupStore(root).save(path, result.before)
+            data = result.after.encode("utf-8")
+            atomic_write(path, data)
+            report.bytes_written = len(data)
+    except Exception as err:
+        report.error = f"{type(err).__name__}: {err}"
+    return report
+
+
+def run(
+    root: Path,
+    work: dict[str, list[Patch]],
+    *,
+    check: bool = False,
+    backup: bool = True,
+) -> tuple[list[FileReport], float]:
+    """Returns per-file reports (in path order) and wall time in seconds."""
+    t0 = time.perf_counter()
+    reports = [process_file(root, rel, patches, check, backup) for rel, patches in sorted(work.items())]
+    return reports, time.perf_counter() - t0
+
+
+def summarize(reports: list[FileReport], patches: list[Patch], wall_s: float) -> dict:
+    per_patch = {
+        p.name: {"files_matched": 0, "files_applied": 0, "match_ms": 0.0, "bytes_rewritten": 0} for p in patches
+    }
+    for r in reports:
+        for name, status in r.statuses.items():
+            stats = per_patch[name]
+            stats["match_ms"] += r.match_s.get(name, 0.0) * 1000
+            stats["bytes_rewritten"] += r.rewritten.get(name, 0)
+            if status in (APPLIED, ALREADY):
+                stats["files_matched"] += 1
+            if status == APPLIED:
+                stats["files_applied"] += 1
+
+    for stats in per_patch.values():
+        stats["match_ms"] = round(stats["match_ms"], 3)
+
+    return {
+        "files_scanned": len(reports),
+        "files_touched": sum(1 for r in reports if r.changed),
+        "bytes_written": sum(r.bytes_written for r in reports),
+        "index_ms": round(sum(r.index_s for r in reports) * 1000, 3),
+        "wall_ms": round(wall_s * 1000, 3),
+        "errors": {r.path: r.error for r in reports if r.error},
+        "patches": per_patch,
+    }
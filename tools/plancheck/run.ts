@@ -0,0 +1,439 @@
+import "dotenv/config";
+
+import { Pool } from "pg";
+import { PrismaPg } from "@prisma/adapter-pg";
+import { Prisma, PrismaClient } from "../../src/generated/prisma/client";
+import { auditLogWhere, claimWhere, foundItemFilters } from "../../src/lib/list-filters";
+import { foundSearchMatch } from "../../src/lib/search";
+import { foundIndexInput, lostIndexInput, rankFoundForLost, rankLostForFound } from "../../src/lib/match-index";
+
+// Query-plan check for the hot read paths, against a seeded database (prisma/bench-seed.ts).
+//
+//   npm run bench:seed                                  # once: synthetic volume
+//   npm run plancheck                                   # every shape
+//   npm run plancheck -- --only=found.list.public,staff.claims.pending --verbose
+//   npm run plancheck -- --min-rows=5000 --json
+//
+// Each shape runs through Prisma with the same filters as its route (the where-builders in
+// src/lib/list-filters.ts and the ranking helpers are imported, not copied). The SQL Prisma
+// sends is captured at the pg pool and re-run as EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) in a
+// rolled-back transaction. A shape fails when its plan reads a table with a Seq Scan that
+// touches more than --min-rows rows (default 1000). Exit code 1 when any shape fails.
+//
+// Runs with the react-server export condition (see package.json) so the server-only lib
+// modules can be imported outside Next.
+
+const args = process.argv.slice(2);
+
+function opt(name: string) {
+  return args.find((a) => a.startsWith(`--${name}=`))?.split("=").slice(1).join("=");
+}
+
+const MIN_ROWS = Math.max(0, Number(opt("min-rows") ?? process.env.PLANCHECK_MIN_ROWS ?? 1000) || 0);
+const verbose = args.includes("--verbose");
+const asJson = args.includes("--json");
+
+const pool = new Pool({ connectionString: process.env.DATABASE_URL, max: 2 });
+
+/* ---------------- SQL capture ----------------
+ * The pg adapter runs non-transactional queries through pool.query; record text + values
+ * while a shape runs.
+ */
+
+type Captured = { text: string; values: unknown[] };
+let capture: Captured[] | null = null;
+
+const poolQuery = pool.query.bind(pool) as (...a: any[]) => any;
+(pool as any).query = (...a: any[]) => {
+  const [q, v] = a;
+  const text = typeof q === "string" ? q : q?.text;
+  if (capture && typeof text === "string") {
+    capture.push({ text, values: (typeof q === "object" && q?.values) || v || [] });
+  }
+  return poolQuery(...a);
+};
+
+const prisma = new PrismaClient({ adapter: new PrismaPg(pool) });
+
+/* ---------------- Shapes ---------------- */
+
+type Fixtures = {
+  userId: number;
+  categoryId: number;
+  actorId: number;
+  lostId: number;
+  foundId: number;
+};
+
+type Shape = {
+  name: string;
+  // Where the shape comes from, for the report
+  source: string;
+  run: (f: Fixtures) => Promise<unknown>;
+  // Full scans that are the point of the query (e.g. loading all active inventory)
+  allowSeqScan?: string[];
+};
+
+const sp = (init: Record<string, string> = {}) => new URLSearchParams(init);
+
+// found/list select, trimmed to what changes the plan (the relation joins)
+const FOUND_CARD = {
+  found_id: true,
+  item_name: true,
+  status: true,
+  date_created: true,
+  category: { select: { category_name: true } },
+  location: { select: { location_name: true } },
+} as const;
+
+function foundList(
+  params: URLSearchParams,
+  privileged: boolean,
+  order: "date_created" | "date_found",
+  dir: "asc" | "desc"
+) {
+  const f = foundItemFilters(params, privileged);
+  if (!f.ok) throw new Error(f.error);
+  return prisma.foundItem.findMany({
+    where: f.where,
+    orderBy: [{ [order]: dir }, { found_id: dir }],
+    take: 13,
+    select: FOUND_CARD,
+  });
+}
+
+const SHAPES: Shape[] = [
+  {
+    name: "found.list.public",
+    source: "GET /api/found/list (signed out, default sort)",
+    run: () => foundList(sp(), false, "date_created", "desc"),
+  },
+  {
+    name: "found.list.public.category",
+    source: "GET /api/found/list?categoryId=",
+    run: (f) => foundList(sp({ categoryId: String(f.categoryId) }), false, "date_created", "desc"),
+  },
+  {
+    name: "found.list.staff.status",
+    source: "GET /api/found/list?status=CLAIMED (staff)",
+    run: () => foundList(sp({ status: "CLAIMED" }), true, "date_created", "desc"),
+  },
+  {
+    name: "found.list.date_found",
+    source: "GET /api/found/list?sortBy=date_found&sortDir=asc",
+    run: () => foundList(sp(), false, "date_found", "asc"),
+  },
+  {
+    name: "found.search",
+    source: "GET /api/found/list?q= (full-text path)",
+    run: async () => {
+      const f = foundItemFilters(sp({ q: "black wallet" }), false);
+      if (!f.ok || !f.tsq) throw new Error("no tsquery");
+      const filter = Prisma.join([foundSearchMatch(f.tsq), ...f.sqlConds], " AND ");
+      return prisma.$queryRaw`
+        SELECT f.found_id FROM found_items f
+        WHERE ${filter}
+        ORDER BY f.date_created DESC, f.found_id DESC
+        LIMIT 13
+      `;
+    },
+  },
+  {
+    name: "found.count.claimed",
+    source: "staff dashboard (claimed items)",
+    run: () => prisma.foundItem.count({ where: { status: "CLAIMED" } }),
+  },
+  {
+    name: "staff.claims.pending",
+    source: "GET /api/staff/claims, staff dashboard queue",
+    run: () =>
+      prisma.claim.findMany({
+        where: claimWhere(sp({ status: "PENDING" })).where,
+        orderBy: { date_claimed: "asc" },
+        take: 50,
+        select: { claim_id: true, date_claimed: true, found_item: { select: { item_name: true } } },
+      }),
+  },
+  {
+    name: "staff.claims.approved",
+    source: "GET /api/staff/claims?status=APPROVED",
+    run: () =>
+      prisma.claim.findMany({
+        where: claimWhere(sp({ status: "APPROVED" })).where,
+        orderBy: { date_claimed: "desc" },
+        take: 50,
+        select: { claim_id: true, date_claimed: true },
+      }),
+  },
+  {
+    name: "claims.count.pending",
+    source: "staff + admin dashboards",
+    run: () => prisma.claim.count({ where: { claim_status: "PENDING" } }),
+  },
+  {
+    name: "claims.count.reviewed_today",
+    source: "staff dashboard",
+    run: () =>
+      prisma.claim.count({
+        where: { reviewed_at: { not: null, gte: new Date(new Date().setHours(0, 0, 0, 0)) } },
+      }),
+  },
+  {
+    name: "audit.list",
+    source: "GET /api/admin/audit/list",
+    run: () =>
+      prisma.auditLog.findMany({
+        where: auditLogWhere(sp()),
+        orderBy: [{ created_at: "desc" }, { audit_id: "desc" }],
+        take: 21,
+        select: { audit_id: true, action: true, created_at: true },
+      }),
+  },
+  {
+    name: "audit.list.actor",
+    source: "GET /api/admin/audit/list?actorUserId=",
+    run: (f) =>
+      prisma.auditLog.findMany({
+        where: auditLogWhere(sp({ actorUserId: String(f.actorId) })),
+        orderBy: [{ created_at: "desc" }, { audit_id: "desc" }],
+        take: 21,
+        select: { audit_id: true, action: true, created_at: true },
+      }),
+  },
+  {
+    name: "notifications.unread",
+    source: "getUnreadCount (src/lib/notifications.ts), badge polling",
+    run: (f) => prisma.notification.count({ where: { user_id: f.userId, is_read: false } }),
+  },
+  {
+    name: "notifications.list",
+    source: "GET /api/notifications",
+    run: (f) =>
+      prisma.notification.findMany({
+        where: { user_id: f.userId },
+        orderBy: { created_at: "desc" },
+        take: 20,
+        select: { notification_id: true, created_at: true },
+      }),
+  },
+  {
+    name: "lost.mine",
+    source: "GET /api/lost/mine",
+    run: (f) =>
+      prisma.lostItem.findMany({
+        where: { user_id: f.userId },
+        orderBy: { date_created: "desc" },
+        take: 25,
+        select: { lost_id: true, status: true },
+      }),
+  },
+  {
+    name: "match.candidates.lost",
+    source: "POST /api/found/create, /api/found/bulk (rankLostForFound)",
+    run: async (f) => {
+      const found = await prisma.foundItem.findUniqueOrThrow({
+        where: { found_id: f.foundId },
+        select: { category_id: true, location_id: true, date_found: true, match_tokens: true },
+      });
+      capture = [];
+      return rankLostForFound(prisma, foundIndexInput(found), {
+        where: { status: "REPORTED_LOST" },
+        k: 30,
+        minScore: 20,
+      });
+    },
+  },
+  {
+    name: "match.candidates.found",
+    source: "POST /api/lost/create (rankFoundForLost)",
+    run: async (f) => {
+      const lost = await prisma.lostItem.findUniqueOrThrow({
+        where: { lost_id: f.lostId },
+        select: { category_id: true, location_id: true, date_lost: true, match_tokens: true },
+      });
+      capture = [];
+      return rankFoundForLost(prisma, lostIndexInput(lost), {
+        where: { status: "NEWLY_FOUND" },
+        k: 30,
+        minScore: 20,
+      });
+    },
+  },
+  {
+    name: "rematch.active_lost",
+    source: "prisma/rematch.ts (loads all active lost reports)",
+    allowSeqScan: ["lost_items"],
+    run: () =>
+      prisma.lostItem.findMany({
+        where: { status: "REPORTED_LOST" },
+        orderBy: { lost_id: "asc" },
+        select: { lost_id: true, match_tokens: true },
+      }),
+  },
+];
+
+/* ---------------- Plans ---------------- */
+
+type PlanNode = {
+  "Node Type": string;
+  "Relation Name"?: string;
+  "Index Name"?: string;
+  "Actual Rows"?: number;
+  "Actual Loops"?: number;
+  "Rows Removed by Filter"?: number;
+  "Shared Hit Blocks"?: number;
+  "Shared Read Blocks"?: number;
+  Plans?: PlanNode[];
+};
+
+type SeqScan = { table: string; rowsScanned: number };
+
+type StatementResult = {
+  sql: string;
+  executionMs: number;
+  sharedBlocks: number;
+  nodes: string[];
+  seqScans: SeqScan[];
+};
+
+type ShapeResult = {
+  name: string;
+  source: string;
+  ok: boolean;
+  statements: StatementResult[];
+  failures: string[];
+};
+
+function walk(node: PlanNode, depth: number, out: { lines: string[]; seq: SeqScan[] }) {
+  const loops = node["Actual Loops"] ?? 1;
+  const rows = (node["Actual Rows"] ?? 0) * loops;
+  const on = node["Relation Name"] ? ` on ${node["Relation Name"]}` : "";
+  const using = node["Index Name"] ? ` using ${node["Index Name"]}` : "";
+  const removed = node["Rows Removed by Filter"] ? `, removed ${node["Rows Removed by Filter"] * loops}` : "";
+  out.lines.push(`${"  ".repeat(depth)}${node["Node Type"]}${on}${using} (rows ${rows}${removed})`);
+
+  if (node["Node Type"] === "Seq Scan" && node["Relation Name"]) {
+    out.seq.push({ table: node["Relation Name"], rowsScanned: rows + (node["Rows Removed by Filter"] ?? 0) * loops });
+  }
+  for (const child of node.Plans ?? []) walk(child, depth + 1, out);
+}
+
+async function explain(stmt: Captured): Promise<StatementResult> {
+  const client = await pool.connect();
+  try {
+    // ANALYZE executes the statement: keep it in a transaction that never commits
+    await client.query("BEGIN");
+    const r = await client.query(`EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) ${stmt.text}`, stmt.values as any[]);
+    const plan = (r.rows[0]["QUERY PLAN"] as Array<{ Plan: PlanNode; "Execution Time": number }>)[0];
+
+    const out = { lines: [] as string[], seq: [] as SeqScan[] };
+    walk(plan.Plan, 0, out);
+    return {
+      sql: stmt.text.replace(/\s+/g, " ").trim(),
+      executionMs: Number(plan["Execution Time"].toFixed(2)),
+      sharedBlocks: (plan.Plan["Shared Hit Blocks"] ?? 0) + (plan.Plan["Shared Read Blocks"] ?? 0),
+      nodes: out.lines,
+      seqScans: out.seq,
+    };
+  } finally {
+    await client.query("ROLLBACK").catch(() => {});
+    client.release();
+  }
+}
+
+async function checkShape(shape: Shape, f: Fixtures): Promise<ShapeResult> {
+  // Shapes that load their own inputs reset `capture` before the measured query
+  capture = [];
+  await shape.run(f);
+  const statements = capture.filter((c) => /^\s*(SELECT|WITH)\b/i.test(c.text));
+  capture = null;
+
+  const results: StatementResult[] = [];
+  const failures: string[] = [];
+  for (const stmt of statements) {
+    const r = await explain(stmt);
+    results.push(r);
+    for (const s of r.seqScans) {
+      if (s.rowsScanned > MIN_ROWS && !shape.allowSeqScan?.includes(s.table)) {
+        failures.push(`Seq Scan on ${s.table} read ${s.rowsScanned} rows (limit ${MIN_ROWS})`);
+      }
+    }
+  }
+
+  return { name: shape.name, source: shape.source, ok: failures.length === 0, statements: results, failures };
+}
+
+/* ---------------- Fixtures ---------------- */
+
+async function loadFixtures(): Promise<Fixtures> {
+  const one = async (sql: string) => {
+    const r = await pool.query<{ id: number }>(sql);
+    if (!r.rows.length) throw new Error(`No fixture for: ${sql}\nRun \`npm run bench:seed\` first.`);
+    return r.rows[0].id;
+  };
+
+  // Busy-but-typical rows, so per-user plans see realistic row counts
+  return {
+    userId: await one(
+      `SELECT user_id AS id FROM notifications GROUP BY user_id ORDER BY count(*) DESC, user_id LIMIT 1`
+    ),
+    categoryId: await one(
+      `SELECT category_id AS id FROM found_items GROUP BY category_id ORDER BY count(*) DESC LIMIT 1`
+    ),
+    actorId: await one(
+      `SELECT actor_user_id AS id FROM audit_logs WHERE actor_user_id IS NOT NULL
+        GROUP BY actor_user_id ORDER BY count(*) DESC LIMIT 1`
+    ),
+    lostId: await one(
+      `SELECT lost_id AS id FROM lost_items WHERE status = 'REPORTED_LOST' ORDER BY lost_id DESC LIMIT 1`
+    ),
+    foundId: await one(
+      `SELECT found_id AS id FROM found_items WHERE status = 'NEWLY_FOUND' ORDER BY found_id DESC LIMIT 1`
+    ),
+  };
+}
+
+async function main() {
+  const only = opt("only")?.split(",").map((s) => s.trim());
+  const shapes = only ? SHAPES.filter((s) => only.includes(s.name)) : SHAPES;
+  if (!shapes.length) throw new Error(`Unknown shapes. Available: ${SHAPES.map((s) => s.name).join(", ")}`);
+
+  const fixtures = await loadFixtures();
+  const results: ShapeResult[] = [];
+
+  for (const shape of shapes) {
+    const r = await checkShape(shape, fixtures);
+    results.push(r);
+    if (asJson) continue;
+
+    const ms = r.statements.reduce((acc, s) => acc + s.executionMs, 0).toFixed(2);
+    console.log(`${r.ok ? "ok  " : "FAIL"} ${r.name.padEnd(30)} ${ms.padStart(9)} ms  ${r.source}`);
+    for (const msg of r.failures) console.log(`       ${msg}`);
+    if (verbose || !r.ok) {
+      for (const s of r.statements) {
+        console.log(`       ${s.sql.slice(0, 160)}${s.sql.length > 160 ? "…" : ""}`);
+        for (const line of s.nodes) console.log(`         ${line}`);
+      }
+    }
+  }
+
+  const failed = results.filter((r) => !r.ok);
+  if (asJson) {
+    console.log(JSON.stringify({ minRows: MIN_ROWS, shapes: results }, null, 2));
+  } else {
+    console.log(
+      `\n${results.length - failed.length}/${results.length} shapes passed (seq scan limit ${MIN_ROWS} rows).`
+    );
+  }
+  if (failed.length) process.exitCode = 1;
+}
+
+main()
+  .catch((e) => {
+    console.error(e);
+    process.exit(1);
+  })
+  .finally(async () => {
+    await prisma.$disconnect();
+    await pool.end();
+  });